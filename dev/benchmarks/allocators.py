@@ -0,0 +1,177 @@
+"""
+Benchmark block allocators by replaying allocation traces.
+
+Each trace is a sequence of allocations and frees, as a context would make them:
+
+- ``grains``: granular voices, each taking a stereo audio bus or a one-channel
+  control bus, living ``--lifetime`` events on average
+- ``buffers``: a sample pool churning buffers of mixed sizes, most short-lived and
+  some held for the whole trace
+- ``mixed``: both at once, on a single heap
+
+Replays each trace against the current best-fit allocator and the linear-scan
+first-fit allocator it replaced, and reports time per operation, failed
+allocations and the peak and final fragmentation.
+
+Run with ``python dev/benchmarks/allocators.py``.
+"""
+
+import argparse
+import bisect
+import dataclasses
+import random
+import time
+from typing import Iterator
+
+from supriya.contexts.allocators import BlockAllocator
+
+Event = tuple[str, int, int]  # (action, key, size)
+
+
+@dataclasses.dataclass(order=True)
+class Block:
+    start_offset: int = 0
+    stop_offset: int = 0
+
+    @property
+    def size(self) -> int:
+        return self.stop_offset - self.start_offset
+
+
+class FirstFitAllocator:
+    """
+    The previous allocator: first-fit over a sorted list of free blocks.
+    """
+
+    def __init__(self, heap_maximum: int = 1024, heap_minimum: int = 0) -> None:
+        self._used_dict: dict[int, Block] = {}
+        self._free_heap = [Block(heap_minimum, heap_maximum)]
+
+    def allocate(self, size: int = 1) -> int | None:
+        for i, block in enumerate(self._free_heap):
+            if size <= block.size:
+                break
+        else:
+            return None
+        if size < block.size:
+            self._free_heap[i] = Block(block.start_offset + size, block.stop_offset)
+        else:
+            self._free_heap.pop(i)
+        self._used_dict[block.start_offset] = Block(
+            block.start_offset, block.start_offset + size
+        )
+        return block.start_offset
+
+    def free(self, index: int) -> None:
+        if (block := self._used_dict.pop(index, None)) is None:
+            return
+        heap = self._free_heap
+        heap.insert(index := bisect.bisect(heap, block), block)
+        if (
+            index < len(heap) - 1
+            and heap[index].stop_offset == heap[index + 1].start_offset
+        ):
+            heap[index].stop_offset = heap.pop(index + 1).stop_offset
+        if index > 0 and heap[index].start_offset == heap[index - 1].stop_offset:
+            heap[index - 1].stop_offset = heap.pop(index).stop_offset
+
+    @property
+    def fragmentation(self) -> float:
+        free_size = sum(block.size for block in self._free_heap)
+        if not free_size:
+            return 0.0
+        return 1.0 - max(block.size for block in self._free_heap) / free_size
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--heap-size", type=int, default=1 << 16)
+    parser.add_argument("--lifetime", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser
+
+
+def churn(
+    rng: random.Random, events: int, sizes: list[int], lifetime: int, held: float = 0.0
+) -> Iterator[Event]:
+    expiries: dict[int, list[int]] = {}
+    for key in range(events):
+        for expired in expiries.pop(key, []):
+            yield ("free", expired, 0)
+        yield ("allocate", key, rng.choice(sizes))
+        if rng.random() >= held:
+            expiry = key + max(1, int(rng.expovariate(1 / lifetime)))
+            expiries.setdefault(expiry, []).append(key)
+
+
+def build_traces(args: argparse.Namespace) -> dict[str, list[Event]]:
+    rng = random.Random(args.seed)
+    grains = list(churn(rng, args.events, [2, 2, 1], lifetime=args.lifetime))
+    buffers = list(churn(rng, args.events, [1, 2, 8, 64, 512], lifetime=50, held=0.01))
+    mixed = [
+        (action, key * 2 + i, size)
+        for pair in zip(grains, buffers)
+        for i, (action, key, size) in enumerate(pair)
+    ]
+    return {"grains": grains, "buffers": buffers, "mixed": mixed}
+
+
+def fragmentation(allocator) -> float:
+    if isinstance(allocator, BlockAllocator):
+        return allocator.stats.fragmentation
+    return allocator.fragmentation
+
+
+def replay(allocator, trace: list[Event]) -> tuple[int, float, float]:
+    offsets: dict[int, int] = {}
+    failures, peak = 0, 0.0
+    for i, (action, key, size) in enumerate(trace):
+        if action == "free":
+            if key in offsets:
+                allocator.free(offsets.pop(key))
+        elif (offset := allocator.allocate(size)) is None:
+            failures += 1
+        else:
+            offsets[key] = offset
+        if not i % 1000:
+            peak = max(peak, fragmentation(allocator))
+    return failures, peak, fragmentation(allocator)
+
+
+def time_replay(allocator, trace: list[Event]) -> float:
+    offsets: dict[int, int] = {}
+    allocate, free = allocator.allocate, allocator.free
+    start = time.perf_counter()
+    for action, key, size in trace:
+        if action == "free":
+            if key in offsets:
+                free(offsets.pop(key))
+        elif (offset := allocate(size)) is not None:
+            offsets[key] = offset
+    return (time.perf_counter() - start) / len(trace)
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    print(
+        f"{'trace':<8} {'allocator':<10} {'us/op':>8} {'failures':>9}"
+        f" {'peak frag':>9} {'end frag':>9}"
+    )
+    for name, trace in build_traces(args).items():
+        for allocator_name, allocator_class in [
+            ("best-fit", BlockAllocator),
+            ("first-fit", FirstFitAllocator),
+        ]:
+            per_op = time_replay(allocator_class(heap_maximum=args.heap_size), trace)
+            failures, peak, end = replay(
+                allocator_class(heap_maximum=args.heap_size), trace
+            )
+            print(
+                f"{name:<8} {allocator_name:<10} {per_op * 1e6:>8.2f} {failures:>9}"
+                f" {peak:>9.3f} {end:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    run()
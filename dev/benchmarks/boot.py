@@ -0,0 +1,100 @@
+"""
+Benchmark server boot time, broken down by phase.
+
+Boots and quits a server ``--repeat`` times and reports the mean time spent in each
+phase of booting:
+
+- ``process``: starting scsynth until it accepts connections
+- ``notify``: connecting and registering for notifications
+- ``system``: emitting the default groups and system SynthDefs
+- ``sync``: waiting for scsynth to finish installing them
+
+Runs with the system SynthDefs packed into datagram-sized ``/d_recv`` bundles, and
+again sent one ``/d_recv`` per SynthDef, as the server used to.
+
+Run with ``python dev/benchmarks/boot.py`` (requires scsynth).
+"""
+
+import argparse
+import functools
+import statistics
+import time
+
+from supriya import Server, ServerLifecycleEvent
+
+PHASES = ("process", "notify", "system", "sync", "total")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    return parser
+
+
+def setup_system_separately(server: Server) -> None:
+    server._add_group_to_tree(0)
+    with server.at():
+        for i in range(server._maximum_logins):
+            server.add_group(permanent=True, add_action="ADD_TO_TAIL", target_node=0)
+    for synthdefs in server._get_system_synthdef_batches():
+        for synthdef in synthdefs:
+            with server.at():
+                server.add_synthdefs(synthdef)
+
+
+def measure(separately: bool) -> dict[str, float]:
+    server = Server()
+    stamps: dict[str, float] = {}
+
+    def stamp(name, function, *args, **kwargs):
+        stamps[name + "_start"] = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stamps[name + "_stop"] = time.perf_counter()
+
+    setup_system = server._setup_system
+    if separately:
+        setup_system = functools.partial(setup_system_separately, server)
+    server._setup_notifications = functools.partial(  # type: ignore[method-assign]
+        stamp, "notify", server._setup_notifications
+    )
+    server._setup_system = functools.partial(  # type: ignore[method-assign]
+        stamp, "system", setup_system
+    )
+    server.register_lifecycle_callback(
+        ServerLifecycleEvent.PROCESS_BOOTED,
+        lambda event: stamps.__setitem__("process_stop", time.perf_counter()),
+    )
+    stamps["process_start"] = time.perf_counter()
+    server.boot()
+    stamps["total_stop"] = time.perf_counter()
+    server.quit()
+    return {
+        "process": stamps["process_stop"] - stamps["process_start"],
+        "notify": stamps["notify_stop"] - stamps["notify_start"],
+        "system": stamps["system_stop"] - stamps["system_start"],
+        "sync": stamps["total_stop"] - stamps["system_stop"],
+        "total": stamps["total_stop"] - stamps["process_start"],
+    }
+
+
+def report(name: str, timings: list[dict[str, float]]) -> None:
+    print(
+        f"{name:<10} "
+        + " ".join(
+            f"{statistics.mean(x[phase] for x in timings) * 1000:>9.2f}"
+            for phase in PHASES
+        )
+    )
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    print(f"{'install':<10} " + " ".join(f"{phase + ' ms':>9}" for phase in PHASES))
+    for name, separately in [("batched", False), ("separate", True)]:
+        report(name, [measure(separately) for _ in range(args.repeat)])
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,70 @@
+"""
+Benchmark buffer transfers into and out of NumPy arrays.
+
+Allocates a ``--seconds`` long stereo buffer, then writes it from and reads it back
+into a NumPy array with ``Buffer.from_numpy()`` and ``Buffer.to_numpy()`` at each
+``--windows`` size, reporting the mean throughput achieved. A window of one waits
+on every chunk's reply in turn, as a hand-written loop over ``get_range()`` would.
+Finally transfers it through a memory-mapped temporary file instead, with
+``via="file"``.
+
+Run with ``python dev/benchmarks/buffers.py`` (requires scsynth).
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy
+
+from supriya import Server
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--windows", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser
+
+
+def measure(
+    server: Server, samples: numpy.ndarray, window: int, via: str
+) -> tuple[float, float]:
+    buffer = server.add_buffer(channel_count=2, frame_count=len(samples))
+    server.sync()
+    try:
+        start = time.perf_counter()
+        buffer.from_numpy(samples, window=window, via=via)
+        written = time.perf_counter()
+        array = buffer.to_numpy(window=window, via=via)
+        read = time.perf_counter()
+        assert numpy.array_equal(array, samples)
+        return samples.size / (written - start), samples.size / (read - written)
+    finally:
+        buffer.free()
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    server = Server().boot()
+    try:
+        sample_rate = server.options.sample_rate or 44100
+        samples = numpy.random.default_rng(0).uniform(
+            -1, 1, (int(args.seconds * sample_rate), 2)
+        )
+        samples = samples.astype(numpy.float32)
+        print(f"{'via':<4} {'window':>6} {'write MB/s':>10} {'read MB/s':>10}")
+        for via, window in [("osc", window) for window in args.windows] + [("file", 0)]:
+            timings = [
+                measure(server, samples, window, via) for _ in range(args.repeat)
+            ]
+            write = statistics.mean(timing[0] for timing in timings) * 4 / 1e6
+            read = statistics.mean(timing[1] for timing in timings) * 4 / 1e6
+            print(f"{via:<4} {window or '-':>6} {write:>10.2f} {read:>10.2f}")
+    finally:
+        server.quit()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,70 @@
+"""
+Benchmark polling control buses through shared memory.
+
+Allocates ``--count`` control buses, then reads them all ``--polls`` times, as a
+visualizer redrawing at frame rate would, once through ``get_range()`` and once
+through ``BusGroup.get_array()`` into a preallocated array, and writes them back
+through ``set_range()`` and ``BusGroup.set_array()``. Reports the mean time per
+call.
+
+Run with ``python dev/benchmarks/buses.py`` (requires scsynth and supriya-shm).
+"""
+
+import argparse
+import time
+
+import numpy
+
+from supriya import Server
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=4096)
+    parser.add_argument("--polls", type=int, default=600)
+    return parser
+
+
+def measure(function, polls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(polls):
+        function()
+    return (time.perf_counter() - start) / polls
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    server = Server().boot(control_bus_channel_count=args.count)
+    try:
+        if server.shared_memory is None:
+            raise SystemExit("supriya-shm is not installed")
+        bus_group = server.add_bus_group(count=args.count)
+        out = numpy.empty(args.count, dtype=numpy.float32)
+        values = numpy.random.default_rng(0).uniform(-1, 1, args.count)
+        listed = values.tolist()
+        print(f"{'method':<12} {'us/call':>9}")
+        for name, function in [
+            (
+                "get_range",
+                lambda: bus_group[0].get_range(args.count, use_shared_memory=True),
+            ),
+            (
+                "get_array",
+                lambda: bus_group.get_array(out=out, use_shared_memory=True),
+            ),
+            (
+                "set_range",
+                lambda: bus_group[0].set_range(listed, use_shared_memory=True),
+            ),
+            (
+                "set_array",
+                lambda: bus_group.set_array(values, use_shared_memory=True),
+            ),
+        ]:
+            print(f"{name:<12} {measure(function, args.polls) * 1e6:>9.1f}")
+    finally:
+        server.quit()
+
+
+if __name__ == "__main__":
+    run()
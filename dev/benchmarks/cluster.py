@@ -0,0 +1,84 @@
+"""
+Benchmark voice capacity as a server cluster gains shards.
+
+For each shard count, boots a cluster and adds voices in batches, spread by the
+least-loaded placement policy, until any shard's average CPU usage crosses
+``--threshold`` percent. Each voice is a bank of silent sine oscillators, so the
+cost is all DSP. Reports the voices sustained, per cluster and per shard.
+
+Run with ``python dev/benchmarks/cluster.py`` (requires scsynth).
+"""
+
+import argparse
+import time
+
+from supriya import ServerCluster
+from supriya.contexts.clusters import LeastLoadedPlacement
+from supriya.ugens import Mix, Out, SinOsc, SynthDefBuilder
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--oscillators", type=int, default=16)
+    parser.add_argument("--threshold", type=float, default=80.0)
+    parser.add_argument("--maximum-voices", type=int, default=100_000)
+    return parser
+
+
+def build_synthdef(oscillators: int):
+    with SynthDefBuilder(amplitude=0.0, frequency=440) as builder:
+        Out.ar(
+            bus=0,
+            source=Mix.new(
+                [
+                    SinOsc.ar(frequency=builder["frequency"] * (i + 1))
+                    for i in range(oscillators)
+                ]
+            )
+            * builder["amplitude"],
+        )
+    return builder.build(name="cluster-voice")
+
+
+def measure(shard_count: int, args: argparse.Namespace) -> tuple[int, float]:
+    synthdef = build_synthdef(args.oscillators)
+    cluster = ServerCluster(
+        count=shard_count,
+        policy=LeastLoadedPlacement(),
+        maximum_node_count=args.maximum_voices,
+    ).boot()
+    try:
+        cluster.add_synthdefs(synthdef)
+        cluster.sync()
+        voices, load = 0, 0.0
+        while voices < args.maximum_voices:
+            for _ in range(args.batch_size):
+                cluster.add_synth(synthdef, frequency=110 + voices % 880)
+                voices += 1
+            cluster.sync()
+            time.sleep(1.5)  # let each shard's /status reply catch up
+            load = max(
+                shard.status.average_cpu_usage if shard.status else 0.0
+                for shard in cluster
+            )
+            if load >= args.threshold:
+                break
+        return voices, load
+    finally:
+        cluster.quit()
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    print(f"{'shards':>6} {'voices':>8} {'per shard':>10} {'peak cpu %':>10}")
+    for shard_count in args.shards:
+        voices, load = measure(shard_count, args)
+        print(
+            f"{shard_count:>6} {voices:>8} {voices / shard_count:>10.0f} {load:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,77 @@
+"""
+Benchmark serialized versus pipelined queries against a running scsynth.
+
+Serialized queries await each round trip before sending the next; pipelined queries
+are all sent up front and gathered, relying on the OSC protocol's pending-request
+table to hand each reply to the right caller.
+
+Run with ``python dev/benchmarks/communicate.py`` (requires scsynth).
+"""
+
+import argparse
+import asyncio
+import time
+
+from supriya import AsyncServer
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser
+
+
+def report(name: str, count: int, serialized: float, pipelined: float) -> None:
+    print(
+        f"{name:<16} {count / serialized:>16.0f} {count / pipelined:>16.0f} "
+        f"{serialized / pipelined:>7.2f}x"
+    )
+
+
+async def measure(queries, repeat: int) -> tuple[float, float]:
+    serialized = pipelined = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for query in queries:
+            await query()
+        serialized = min(serialized, time.perf_counter() - start)
+        start = time.perf_counter()
+        await asyncio.gather(*(query() for query in queries))
+        pipelined = min(pipelined, time.perf_counter() - start)
+    return serialized, pipelined
+
+
+async def run_async(count: int, repeat: int) -> None:
+    server = await AsyncServer().boot()
+    try:
+        buffer = server.add_buffer(channel_count=1, frame_count=64)
+        buses = server.add_bus_group(count=min(count, 1024))
+        group = server.add_group()
+        await server.sync()
+        workloads = {
+            "query_buffer": [lambda: server.query_buffer(buffer) for _ in range(count)],
+            "query_node": [lambda: server.query_node(group) for _ in range(count)],
+            "get_bus": [
+                (lambda bus=buses[i % len(buses)]: server.get_bus(bus))
+                for i in range(count)
+            ],
+        }
+        print(
+            f"{'query':<16} {'serialized (q/s)':>16} {'pipelined (q/s)':>16} "
+            f"{'speedup':>8}"
+        )
+        for name, queries in workloads.items():
+            serialized, pipelined = await measure(queries, repeat)
+            report(name, count, serialized, pipelined)
+    finally:
+        await server.quit()
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    asyncio.run(run_async(args.count, args.repeat))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,134 @@
+"""
+Benchmark the server's node tree mirror under large groups.
+
+Feeds ``/n_go``, ``/n_move`` and ``/n_end`` notifications straight into an unbooted
+server's handlers, as if a single group held ``--count`` grains, and reports the
+mean cost of each notification. A list-backed mirror, as the server used to keep,
+is timed alongside for comparison.
+
+Run with ``python dev/benchmarks/node_tree.py`` (no scsynth required).
+"""
+
+import argparse
+import random
+import time
+
+from supriya import OscMessage, Server
+
+
+class ListMirror:
+    """
+    The list-per-group mirror, kept here as a baseline.
+    """
+
+    def __init__(self) -> None:
+        self.children: dict[int, list[int]] = {1: []}
+        self.parents: dict[int, int] = {}
+
+    def add(self, id_: int, parent_id: int, previous_id: int, next_id: int) -> None:
+        self.parents[id_] = parent_id
+        children = self.children[parent_id]
+        if previous_id == -1:
+            children.insert(0, id_)
+        elif next_id == -1:
+            children.append(id_)
+        elif previous_id in children:
+            children.insert(children.index(previous_id) + 1, id_)
+        elif next_id in children:
+            children.insert(children.index(next_id), id_)
+
+    def remove(self, id_: int) -> None:
+        children = self.children[self.parents.pop(id_)]
+        children.pop(children.index(id_))
+
+    def n_end(self, message: OscMessage) -> None:
+        self.remove(message.contents[0])
+
+    def n_go(self, message: OscMessage) -> None:
+        self.add(*message.contents[:4])
+
+    def n_move(self, message: OscMessage) -> None:
+        self.remove(message.contents[0])
+        self.add(*message.contents[:4])
+
+
+class LinkedMirror:
+    """
+    The server's own mirror, driven through its OSC handlers.
+    """
+
+    def __init__(self) -> None:
+        self.server = Server()
+        self.server._add_group_to_tree(0)
+        self.server._handle_n_go(OscMessage("/n_go", 1, 0, -1, -1, 1))
+
+    def n_end(self, message: OscMessage) -> None:
+        self.server._handle_n_end(message)
+
+    def n_go(self, message: OscMessage) -> None:
+        self.server._handle_n_go(message)
+
+    def n_move(self, message: OscMessage) -> None:
+        self.server._handle_n_move(message)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--moves", type=int, default=10_000)
+    parser.add_argument("--baseline-count", type=int, default=20_000)
+    return parser
+
+
+def build_messages(count: int, moves: int) -> dict[str, list[OscMessage]]:
+    random.seed(0)
+    ids = list(range(1000, 1000 + count))
+    # Grains arrive at the tail, each after the last.
+    n_go = [
+        OscMessage("/n_go", id_, 1, ids[i - 1] if i else -1, -1, 0)
+        for i, id_ in enumerate(ids)
+    ]
+    # Each move places a random grain after another random grain.
+    n_move = []
+    for _ in range(moves):
+        id_, previous_id = random.sample(ids, 2)
+        n_move.append(OscMessage("/n_move", id_, 1, previous_id, 0, 0))
+    # Grains end in random order, as they would with random durations.
+    shuffled = ids[:]
+    random.shuffle(shuffled)
+    n_end = [OscMessage("/n_end", id_, 1, -1, -1, 0) for id_ in shuffled]
+    return {"n_go": n_go, "n_move": n_move, "n_end": n_end}
+
+
+def measure(mirror, messages: dict[str, list[OscMessage]]) -> dict[str, float]:
+    timings: dict[str, float] = {}
+    for name, batch in messages.items():
+        handler = getattr(mirror, name)
+        start = time.perf_counter()
+        for message in batch:
+            handler(message)
+        timings[name] = (time.perf_counter() - start) / max(1, len(batch))
+    return timings
+
+
+def report(name: str, count: int, timings: dict[str, float]) -> None:
+    print(
+        f"{name:<8} {count:>9} "
+        + " ".join(f"{timings[x] * 1e6:>10.2f}" for x in ("n_go", "n_move", "n_end"))
+    )
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    print(
+        f"{'mirror':<8} {'nodes':>9} {'n_go us':>10} {'n_move us':>10} {'n_end us':>10}"
+    )
+    for count in sorted({args.baseline_count, args.count}):
+        messages = build_messages(count, args.moves)
+        report("linked", count, measure(LinkedMirror(), messages))
+        if count <= args.baseline_count:
+            report("list", count, measure(ListMirror(), messages))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,103 @@
+"""
+Benchmark send-side coalescing in AsyncOscProtocol.
+
+Each run emits bursts of ``/s_new`` bundles sharing a timestamp, one burst per event
+loop iteration, the way a pattern player emits events due on the same beat. Without
+coalescing every message costs one ``sendto`` (or ``write``) call and, over UDP, one
+packet; with coalescing each burst is flushed as a handful of bundles.
+
+Run with ``python dev/benchmarks/osc_coalescing.py``.
+"""
+
+import argparse
+import asyncio
+import socket
+import threading
+import time
+
+from supriya.osc import AsyncOscProtocol, OscBundle, OscMessage
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bursts", type=int, default=200)
+    parser.add_argument("--burst-size", type=int, default=32)
+    parser.add_argument("--window", type=float, default=0.0)
+    return parser
+
+
+def start_sink() -> tuple[socket.socket, list[int]]:
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(("127.0.0.1", 0))
+    sink.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 22)
+    packets = [0]
+
+    def drain() -> None:
+        while True:
+            try:
+                sink.recv(65536)
+            except OSError:
+                return
+            packets[0] += 1
+
+    threading.Thread(target=drain, daemon=True).start()
+    return sink, packets
+
+
+async def run_async(
+    port: int, bursts: int, burst_size: int, window: float | None
+) -> tuple[int, float]:
+    osc_protocol = AsyncOscProtocol()
+    await osc_protocol.connect("127.0.0.1", port)
+    osc_protocol.enable_coalescing(window)
+    writes = 0
+    sendto = osc_protocol.transport.sendto
+
+    def counting_sendto(*args) -> None:
+        nonlocal writes
+        writes += 1
+        sendto(*args)
+
+    osc_protocol.transport.sendto = counting_sendto  # type: ignore[method-assign]
+    start = time.perf_counter()
+    for i in range(bursts):
+        timestamp = time.time() + 0.5
+        for j in range(burst_size):
+            osc_protocol.send(
+                OscBundle(
+                    timestamp=timestamp,
+                    contents=[
+                        OscMessage("/s_new", "default", -1, 0, 1, "frequency", 440 + j)
+                    ],
+                )
+            )
+        await asyncio.sleep(window or 0)
+    osc_protocol.flush()
+    elapsed = time.perf_counter() - start
+    await osc_protocol.disconnect()
+    return writes, elapsed
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    count = args.bursts * args.burst_size
+    sink, packets = start_sink()
+    port = sink.getsockname()[1]
+    print(f"{'mode':<12} {'messages':>9} {'syscalls':>9} {'packets':>9} {'msg/s':>10}")
+    try:
+        for name, window in [("immediate", None), ("coalesced", args.window)]:
+            before = packets[0]
+            writes, elapsed = asyncio.run(
+                run_async(port, args.bursts, args.burst_size, window)
+            )
+            time.sleep(0.25)  # let the sink drain
+            print(
+                f"{name:<12} {count:>9} {writes:>9} {packets[0] - before:>9} "
+                f"{count / elapsed:>10.0f}"
+            )
+    finally:
+        sink.close()
+
+
+if __name__ == "__main__":
+    run()
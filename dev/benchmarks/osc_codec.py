@@ -0,0 +1,264 @@
+"""
+Benchmark OSC encoding and decoding against the original slicing implementations.
+
+Run with ``python dev/benchmarks/osc_codec.py``.
+"""
+
+import argparse
+import functools
+import struct
+import timeit
+from collections.abc import Sequence as SequenceABC
+from enum import Enum
+
+from supriya.osc import (
+    BUNDLE_PREFIX,
+    IMMEDIATELY,
+    NTP_DELTA,
+    SECONDS_TO_NTP_TIMESTAMP,
+    OscBundle,
+    OscMessage,
+)
+
+
+def legacy_encode_string(value: str) -> bytes:
+    result = bytes(value + "\x00", "ascii")
+    if len(result) % 4 != 0:
+        width = (len(result) // 4 + 1) * 4
+        result = result.ljust(width, b"\x00")
+    return result
+
+
+def legacy_encode_blob(value: bytes) -> bytes:
+    result = bytes(struct.pack(">I", len(value)) + value)
+    if len(result) % 4 != 0:
+        width = (len(result) // 4 + 1) * 4
+        result = result.ljust(width, b"\x00")
+    return result
+
+
+def legacy_encode_value(value) -> tuple[str, bytes]:
+    type_tags, encoded_value = "", b""
+    if isinstance(value, Enum):
+        if isinstance(value.value, str):
+            type_tags += "s"
+            encoded_value = legacy_encode_string(value.value)
+        else:
+            type_tags += "i"
+            encoded_value += struct.pack(">i", value.value)
+    elif isinstance(value, (OscBundle, OscMessage)):
+        type_tags += "b"
+        encoded_value = legacy_encode_blob(legacy_to_datagram(value))
+    elif isinstance(value, (bytearray, bytes)):
+        type_tags += "b"
+        encoded_value = legacy_encode_blob(value)
+    elif isinstance(value, str):
+        type_tags += "s"
+        encoded_value = legacy_encode_string(value)
+    elif isinstance(value, bool):
+        type_tags += "T" if value else "F"
+    elif isinstance(value, float):
+        type_tags += "f"
+        encoded_value += struct.pack(">f", value)
+    elif isinstance(value, int):
+        type_tags += "i"
+        encoded_value += struct.pack(">i", value)
+    elif value is None:
+        type_tags += "N"
+    elif isinstance(value, SequenceABC):
+        type_tags += "["
+        for sub_value in value:
+            sub_type_tags, sub_encoded_value = legacy_encode_value(sub_value)
+            type_tags += sub_type_tags
+            encoded_value += sub_encoded_value
+        type_tags += "]"
+    else:
+        raise TypeError(value)
+    return type_tags, encoded_value
+
+
+def legacy_to_datagram(item: OscBundle | OscMessage) -> bytes:
+    if isinstance(item, OscBundle):
+        datagram: bytes = BUNDLE_PREFIX
+        datagram += OscBundle._encode_date(item.timestamp)
+        for content in item.contents:
+            content_datagram = legacy_to_datagram(content)
+            datagram += struct.pack(">i", len(content_datagram))
+            datagram += content_datagram
+        return datagram
+    if isinstance(item.address, str):
+        encoded_address = legacy_encode_string(item.address)
+    else:
+        encoded_address = struct.pack(">i", item.address)
+    encoded_type_tags = ","
+    encoded_contents = b""
+    for value in item.contents:
+        type_tags, encoded_value = legacy_encode_value(value)
+        encoded_type_tags += type_tags
+        encoded_contents += encoded_value
+    return encoded_address + legacy_encode_string(encoded_type_tags) + encoded_contents
+
+
+def legacy_decode_blob(data: bytes) -> tuple[bytes, bytes]:
+    actual_length, remainder = struct.unpack(">I", data[:4])[0], data[4:]
+    padded_length = actual_length
+    if actual_length % 4 != 0:
+        padded_length = (actual_length // 4 + 1) * 4
+    return remainder[:padded_length][:actual_length], remainder[padded_length:]
+
+
+def legacy_decode_string(data: bytes) -> tuple[str, bytes]:
+    actual_length = data.index(b"\x00")
+    padded_length = (actual_length // 4 + 1) * 4
+    return str(data[:actual_length], "ascii"), data[padded_length:]
+
+
+def legacy_decode_message(datagram: bytes) -> OscMessage:
+    remainder = datagram
+    address, remainder = legacy_decode_string(remainder)
+    type_tags, remainder = legacy_decode_string(remainder)
+    contents: list = []
+    array_stack = [contents]
+    for type_tag in type_tags[1:]:
+        if type_tag == "i":
+            value, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
+            array_stack[-1].append(value)
+        elif type_tag == "f":
+            value, remainder = struct.unpack(">f", remainder[:4])[0], remainder[4:]
+            array_stack[-1].append(value)
+        elif type_tag == "s":
+            value, remainder = legacy_decode_string(remainder)
+            array_stack[-1].append(value)
+        elif type_tag == "b":
+            value, remainder = legacy_decode_blob(remainder)
+            for decode in (legacy_decode_bundle, legacy_decode_message):
+                try:
+                    value = decode(value)
+                    break
+                except Exception:
+                    pass
+            array_stack[-1].append(value)
+        elif type_tag == "T":
+            array_stack[-1].append(True)
+        elif type_tag == "F":
+            array_stack[-1].append(False)
+        elif type_tag == "N":
+            array_stack[-1].append(None)
+        elif type_tag == "[":
+            array: list = []
+            array_stack[-1].append(array)
+            array_stack.append(array)
+        elif type_tag == "]":
+            array_stack.pop()
+    return OscMessage(address, *contents)
+
+
+def legacy_decode_bundle(datagram: bytes) -> OscBundle:
+    if not datagram.startswith(BUNDLE_PREFIX):
+        raise ValueError("datagram is not a bundle")
+    remainder = datagram[8:]
+    data, remainder = remainder[:8], remainder[8:]
+    timestamp = None
+    if data != IMMEDIATELY:
+        timestamp = struct.unpack(">Q", data)[0] / SECONDS_TO_NTP_TIMESTAMP - NTP_DELTA
+    contents: list[OscBundle | OscMessage] = []
+    while len(remainder):
+        length, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
+        if remainder.startswith(BUNDLE_PREFIX):
+            contents.append(legacy_decode_bundle(remainder[:length]))
+        else:
+            contents.append(legacy_decode_message(remainder[:length]))
+        remainder = remainder[length:]
+    return OscBundle(timestamp=timestamp, contents=contents)
+
+
+def legacy_from_datagram(datagram: bytes) -> OscBundle | OscMessage:
+    if datagram.startswith(BUNDLE_PREFIX):
+        return legacy_decode_bundle(datagram)
+    return legacy_decode_message(datagram)
+
+
+def from_datagram(datagram: bytes) -> OscBundle | OscMessage:
+    if datagram.startswith(BUNDLE_PREFIX):
+        return OscBundle.from_datagram(datagram)
+    return OscMessage.from_datagram(datagram)
+
+
+def build_workloads(size: int) -> dict[str, OscBundle | OscMessage]:
+    s_new = [
+        OscMessage(
+            "/s_new", "default", 1000 + i, 0, 1, "frequency", 440.0, "amplitude", 0.1
+        )
+        for i in range(size)
+    ]
+    n_set = [
+        OscMessage("/n_set", 1000 + i, "frequency", 220.0 + i, "pan", -0.5)
+        for i in range(size)
+    ]
+    return {
+        "s_new": s_new[0],
+        "b_setn": OscMessage("/b_setn", 0, 0, size, *(float(i) for i in range(size))),
+        "bundle": OscBundle(timestamp=1.0, contents=s_new),
+        "nested bundle": OscBundle(
+            timestamp=1.0,
+            contents=[
+                OscBundle(timestamp=1.0, contents=[message]) for message in n_set
+            ],
+        ),
+        "d_recv completion": OscMessage(
+            "/d_recv", b"SCgf" * 256, OscBundle(contents=s_new)
+        ),
+        "b_getn.reply 100KB": OscMessage(
+            "/b_getn.reply", 0, 0, 25_000, *(float(i) for i in range(25_000))
+        ),
+        "g_queryTree.reply": OscMessage(
+            "/g_queryTree.reply",
+            1,
+            0,
+            size,
+            *(x for i in range(size) for x in (1000 + i, -1, "default", 1, "amp", 0.1)),
+        ),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=500)
+    parser.add_argument("--number", type=int, default=20)
+    return parser
+
+
+def report(name: str, legacy: float, current: float, number: int) -> None:
+    print(
+        f"{name:<24} {legacy / number * 1000:>12.3f} "
+        f"{current / number * 1000:>12.3f} {legacy / current:>7.2f}x"
+    )
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    workloads = build_workloads(args.size)
+    header = f"{'legacy (ms)':>12} {'current (ms)':>12} {'speedup':>8}"
+    print(f"{'encode':<24} {header}")
+    for name, item in workloads.items():
+        assert legacy_to_datagram(item) == item.to_datagram()
+        legacy = timeit.timeit(
+            functools.partial(legacy_to_datagram, item), number=args.number
+        )
+        current = timeit.timeit(item.to_datagram, number=args.number)
+        report(name, legacy, current, args.number)
+    print(f"{'decode':<24} {header}")
+    for name, item in workloads.items():
+        datagram = item.to_datagram()
+        assert legacy_from_datagram(datagram) == from_datagram(datagram)
+        legacy = timeit.timeit(
+            functools.partial(legacy_from_datagram, datagram), number=args.number
+        )
+        current = timeit.timeit(
+            functools.partial(from_datagram, datagram), number=args.number
+        )
+        report(name, legacy, current, args.number)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,77 @@
+"""
+Benchmark callback dispatch with thousands of registered OSC address patterns.
+
+Registers ``--count`` callbacks of each kind against a disconnected protocol and
+times ``_match_callbacks`` for a stream of incoming messages:
+
+- ``exact``: plain addresses, e.g. ``/voice/123/gate``
+- ``wildcard``: patterns with a wildcard part, e.g. ``/voice/123/*``
+- ``siblings``: patterns whose wildcard parts share a level, e.g.
+  ``/voice/{123,solo}/gate``
+- ``linear``: the same wildcard patterns, tested one regex at a time, as a consumer
+  would have to without pattern support
+
+Run with ``python dev/benchmarks/osc_patterns.py``.
+"""
+
+import argparse
+import random
+import timeit
+
+from supriya.osc import OscMessage, ThreadedOscProtocol, compile_address_pattern
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser
+
+
+def build_protocol(patterns: list[str]) -> ThreadedOscProtocol:
+    osc_protocol = ThreadedOscProtocol()
+    for pattern in patterns:
+        osc_protocol._add_callback(osc_protocol._register([pattern], lambda _: None))
+    return osc_protocol
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    random.seed(0)
+    messages = [
+        OscMessage(f"/voice/{random.randrange(args.count)}/gate", 1)
+        for _ in range(args.messages)
+    ]
+    # Half the messages go to addresses never seen before, defeating the cache.
+    messages[::2] = [
+        OscMessage(f"/voice/{i}/gate", 1) for i in range(len(messages[::2]))
+    ]
+    exact = build_protocol([f"/voice/{i}/gate" for i in range(args.count)])
+    wildcard = build_protocol([f"/voice/{i}/*" for i in range(args.count)])
+    siblings = build_protocol([f"/voice/{{{i},solo}}/gate" for i in range(args.count)])
+    regexes = [compile_address_pattern(f"/voice/{i}/*") for i in range(args.count)]
+
+    def linear() -> None:
+        for message in messages:
+            [regex for regex in regexes if regex.fullmatch(message.address)]
+
+    def dispatch(osc_protocol: ThreadedOscProtocol) -> None:
+        osc_protocol.pattern_trie.cache.clear()
+        for message in messages:
+            osc_protocol._match_callbacks(message)
+
+    print(f"{'dispatch':<10} {'patterns':>9} {'us/message':>11}")
+    for name, function in [
+        ("exact", lambda: dispatch(exact)),
+        ("wildcard", lambda: dispatch(wildcard)),
+        ("siblings", lambda: dispatch(siblings)),
+        ("linear", linear),
+    ]:
+        repeat = 1 if name == "linear" else args.repeat
+        elapsed = min(timeit.repeat(function, number=1, repeat=repeat))
+        print(f"{name:<10} {args.count:>9} {elapsed / len(messages) * 1e6:>11.2f}")
+
+
+if __name__ == "__main__":
+    run()
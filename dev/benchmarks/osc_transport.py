@@ -0,0 +1,151 @@
+"""
+Benchmark OSC throughput over UDP and TCP.
+
+Each protocol sends a burst of ``/b_setn`` messages to a local echo peer and waits for
+the echoes to come back. UDP may drop datagrams under load, or refuse those too
+large to send at all, so the loss column reports the proportion of messages which
+never returned.
+
+Run with ``python dev/benchmarks/osc_transport.py``.
+"""
+
+import argparse
+import asyncio
+import logging
+import socketserver
+import threading
+import time
+
+from supriya.osc import AsyncOscProtocol, OscMessage, ThreadedOscProtocol
+
+
+class UdpEchoHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        data, sock = self.request
+        sock.sendto(data, self.client_address)
+
+
+class TcpEchoHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        while data := self.request.recv(65536):
+            self.request.sendall(data)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 1024, 16384])
+    parser.add_argument("--timeout", type=float, default=1.0)
+    return parser
+
+
+def start_echo_servers() -> dict[str, socketserver.BaseServer]:
+    servers: dict[str, socketserver.BaseServer] = {
+        "tcp": socketserver.ThreadingTCPServer(("127.0.0.1", 0), TcpEchoHandler),
+        "udp": socketserver.UDPServer(("127.0.0.1", 0), UdpEchoHandler),
+    }
+    for server in servers.values():
+        setattr(server, "daemon_threads", True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    return servers
+
+
+def run_threaded(
+    port: int, protocol: str, message: OscMessage, count: int, timeout: float
+) -> tuple[int, float]:
+    received, last = 0, 0.0
+    done = threading.Event()
+
+    def on_message(_) -> None:
+        nonlocal received, last
+        received, last = received + 1, time.perf_counter()
+        if received == count:
+            done.set()
+
+    osc_protocol = ThreadedOscProtocol()
+    osc_protocol.connect("127.0.0.1", port, protocol=protocol)
+    osc_protocol.register(pattern=["/b_setn"], procedure=on_message)
+    start = time.perf_counter()
+    for _ in range(count):
+        try:
+            osc_protocol.send(message)
+        except OSError:
+            pass
+    previous = -1
+    # Wait until everything returns, or until nothing has returned for a while.
+    while not done.wait(timeout) and received != previous:
+        previous = received
+    elapsed = max(last - start, 1e-9)
+    osc_protocol.disconnect()
+    return received, elapsed
+
+
+async def run_async(
+    port: int, protocol: str, message: OscMessage, count: int, timeout: float
+) -> tuple[int, float]:
+    received, last = 0, 0.0
+    done = asyncio.Event()
+
+    def on_message(_) -> None:
+        nonlocal received, last
+        received, last = received + 1, time.perf_counter()
+        if received == count:
+            done.set()
+
+    osc_protocol = AsyncOscProtocol()
+    await osc_protocol.connect("127.0.0.1", port, protocol=protocol)
+    osc_protocol.register(pattern=["/b_setn"], procedure=on_message)
+    start = time.perf_counter()
+    for i in range(count):
+        try:
+            osc_protocol.send(message)
+        except OSError:
+            pass
+        if not i % 64:
+            # Let the loop drain the transport's buffers as we go.
+            await asyncio.sleep(0)
+    while True:
+        previous = received
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+            break
+        except asyncio.TimeoutError:
+            if received == previous:
+                break
+    elapsed = max(last - start, 1e-9)
+    await osc_protocol.disconnect()
+    return received, elapsed
+
+
+def report(
+    name: str, message: OscMessage, count: int, received: int, elapsed: float
+) -> None:
+    size = len(message.to_datagram())
+    print(
+        f"{name:<24} {size:>9} {received / elapsed:>10.0f} "
+        f"{received * size / elapsed / 1e6:>8.2f} {1 - received / count:>6.1%}"
+    )
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    # Oversized UDP datagrams are refused by the OS; count them, don't log them.
+    logging.getLogger("supriya").setLevel(logging.ERROR)
+    servers = start_echo_servers()
+    print(f"{'transport':<24} {'bytes':>9} {'msg/s':>10} {'MB/s':>8} {'loss':>6}")
+    for size in args.sizes:
+        message = OscMessage("/b_setn", 0, 0, size, *([0.5] * size))
+        for protocol, server in servers.items():
+            port = server.server_address[1]
+            received, elapsed = run_threaded(
+                port, protocol, message, args.count, args.timeout
+            )
+            report(f"threaded {protocol}", message, args.count, received, elapsed)
+            received, elapsed = asyncio.run(
+                run_async(port, protocol, message, args.count, args.timeout)
+            )
+            report(f"async {protocol}", message, args.count, received, elapsed)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,88 @@
+"""
+Benchmark streaming scope frames to several subscribers.
+
+Plays a sine into an amplitude scope, then for ``--seconds`` feeds each of
+``--subscribers`` consumers at ``--fps``: once with every consumer polling
+``read()`` on its own, and once with every consumer iterating ``stream()``.
+Reports the shared memory reads made, the frames each consumer received and the
+stream's drop statistics.
+
+Run with ``python dev/benchmarks/scopes.py`` (requires scsynth and supriya-shm).
+"""
+
+import argparse
+import asyncio
+
+from supriya import Server
+from supriya.ugens import Out, SinOsc, SynthDefBuilder
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fps", type=float, default=60.0)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--subscribers", type=int, default=4)
+    return parser
+
+
+async def poll(scope, fps: float, seconds: float) -> tuple[int, int]:
+    reads = frames = 0
+    for _ in range(int(fps * seconds)):
+        frame_count, _ = scope.read()
+        reads += 1
+        frames += bool(frame_count)
+        await asyncio.sleep(1 / fps)
+    return reads, frames
+
+
+async def stream(scope, fps: float, seconds: float) -> int:
+    frames = 0
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + seconds
+    async for _ in scope.stream(fps=fps):
+        frames += 1
+        if loop.time() >= deadline:
+            break
+    return frames
+
+
+async def main(args: argparse.Namespace) -> None:
+    server = Server().boot()
+    try:
+        if server.shared_memory is None:
+            raise SystemExit("supriya-shm is not installed")
+        with SynthDefBuilder() as builder:
+            Out.ar(bus=0, source=SinOsc.ar())
+        synthdef = builder.build(name="scope-sine")
+        with server.at():
+            with server.add_synthdefs(synthdef):
+                server.add_synth(synthdef)
+        scope = server.add_amplitude_scope(bus=server.audio_output_bus_group[0])
+        server.sync()
+        results = await asyncio.gather(
+            *(poll(scope, args.fps, args.seconds) for _ in range(args.subscribers))
+        )
+        reads = sum(result[0] for result in results)
+        frames = min(result[1] for result in results)
+        print(f"read():   {reads:>6} reads, {frames:>5} frames per subscriber")
+        results = await asyncio.gather(
+            *(stream(scope, args.fps, args.seconds) for _ in range(args.subscribers))
+        )
+        await asyncio.sleep(0.1)
+        counters = scope.stream_counters
+        print(
+            f"stream(): {counters['polls']:>6} reads, {min(results):>5} frames per"
+            f" subscriber, {counters['unchanged']} unchanged, {counters['dropped']}"
+            f" dropped, {counters['late']} late"
+        )
+        scope.stop()
+    finally:
+        server.quit()
+
+
+def run() -> None:
+    asyncio.run(main(build_parser().parse_args()))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,74 @@
+"""
+Benchmark loading soundfiles into NumPy arrays.
+
+Writes a ``--minutes`` long, ``--channels`` channel 16-bit WAV file, then loads it
+with ``soundfiles.load_array()``, streams it with ``soundfiles.stream()``, and
+decodes it with ``soundfiles.load()``, through ``audioread`` and a tuple of
+floats, reporting the mean time and peak memory allocated by Python for each.
+
+Run with ``python dev/benchmarks/soundfiles.py``.
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+import tracemalloc
+import wave
+from pathlib import Path
+
+import numpy
+
+from supriya.soundfiles import load, load_array, stream
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=float, default=5.0)
+    parser.add_argument("--channels", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-audioread", action="store_true")
+    return parser
+
+
+def load_streamed(path: Path) -> float:
+    return max(float(numpy.abs(chunk).max()) for chunk in stream(path))
+
+
+def measure(function, path: Path, repeat: int) -> tuple[float, float]:
+    timings, peaks = [], []
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        function(path)
+        timings.append(time.perf_counter() - start)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return statistics.mean(timings), max(peaks)
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    frame_count = int(args.minutes * 60 * 44100)
+    samples = numpy.random.default_rng(0).integers(
+        -(1 << 15), 1 << 15, (frame_count, args.channels), dtype="<i2"
+    )
+    with tempfile.TemporaryDirectory() as temp_directory:
+        path = Path(temp_directory) / "stem.wav"
+        with wave.open(str(path), "wb") as file_:
+            file_.setnchannels(args.channels)
+            file_.setsampwidth(2)
+            file_.setframerate(44100)
+            file_.writeframes(samples.tobytes())
+        del samples
+        print(f"{'loader':<10} {'seconds':>8} {'peak MB':>9}")
+        loaders = [("load_array", load_array), ("stream", load_streamed)]
+        if not args.skip_audioread:
+            loaders.append(("load", load))
+        for name, function in loaders:
+            seconds, peak = measure(function, path, args.repeat)
+            print(f"{name:<10} {seconds:>8.3f} {peak / 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    run()
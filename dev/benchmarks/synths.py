@@ -0,0 +1,73 @@
+"""
+Benchmark the client-side cost of adding many synths at once.
+
+Adds ``--count`` grains to a score in a single moment, once with an ``add_synth``
+call per grain and once with a single ``add_synths`` call, and reports the mean
+time spent building the requests and rendering them to OSC.
+
+Run with ``python dev/benchmarks/synths.py``.
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from supriya import Score, default
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=10)
+    return parser
+
+
+def add_individually(score: Score, frequencies: list[float], pannings: list[float]):
+    with score.at(0):
+        for frequency, panning in zip(frequencies, pannings):
+            score.add_synth(default, amplitude=0.1, frequency=frequency, pan=panning)
+
+
+def add_vectorized(score: Score, frequencies: list[float], pannings: list[float]):
+    with score.at(0):
+        score.add_synths(
+            default,
+            len(frequencies),
+            amplitude=0.1,
+            frequency=frequencies,
+            pan=pannings,
+        )
+
+
+def measure(function, count: int) -> tuple[float, float]:
+    frequencies = [random.uniform(110, 880) for _ in range(count)]
+    pannings = [random.uniform(-1, 1) for _ in range(count)]
+    score = Score()
+    start = time.perf_counter()
+    function(score, frequencies, pannings)
+    built = time.perf_counter()
+    for bundle in score.iterate_osc_bundles():
+        bundle.to_datagram(realtime=False)
+    rendered = time.perf_counter()
+    return built - start, rendered - built
+
+
+def run() -> None:
+    args = build_parser().parse_args()
+    print(f"{'method':<12} {'build ms':>9} {'render ms':>9} {'us/synth':>9}")
+    for name, function in [
+        ("add_synth", add_individually),
+        ("add_synths", add_vectorized),
+    ]:
+        timings = [measure(function, args.count) for _ in range(args.repeat)]
+        build = statistics.mean(timing[0] for timing in timings)
+        render = statistics.mean(timing[1] for timing in timings)
+        print(
+            f"{name:<12} {build * 1000:>9.2f} {render * 1000:>9.2f}"
+            f" {(build + render) / args.count * 1e6:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
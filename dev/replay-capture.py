@@ -0,0 +1,40 @@
+"""
+Re-send a binary capture log against a running server.
+
+Record a log with ``osc_protocol.capture(log_path=...)``, then replay it with, e.g.,
+``python dev/replay-capture.py session.log --port 57110 --speed 4``.
+"""
+
+import argparse
+
+from supriya.osc import Capture, ThreadedOscProtocol
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path")
+    parser.add_argument("--ip-address", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=57110)
+    parser.add_argument("--protocol", choices=["udp", "tcp"], default="udp")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="playback speed, or 0 to send as fast as possible",
+    )
+    return parser
+
+
+def run():
+    args = build_parser().parse_args()
+    osc_protocol = ThreadedOscProtocol()
+    osc_protocol.connect(args.ip_address, args.port, protocol=args.protocol)
+    try:
+        count = Capture.replay_log(args.path, osc_protocol, speed=args.speed or None)
+    finally:
+        osc_protocol.disconnect()
+    print(f"Replayed {count} messages")
+
+
+if __name__ == "__main__":
+    run()
@@ -30,6 +30,7 @@ from .clocks import (
 )
 from .contexts import (
     AsyncServer,
+    AsyncServerCluster,
     BaseServer,
     Buffer,
     BufferGroup,
@@ -41,8 +42,10 @@ from .contexts import (
     ScopeBuffer,
     Score,
     Server,
+    ServerCluster,
     ServerLifecycleCallback,
     Synth,
+    SynthArray,
 )
 from .enums import (  # noqa
     AddAction,
@@ -75,6 +78,7 @@ __all__ = [
     "AsyncClock",
     "AsyncOfflineClock",
     "AsyncServer",
+    "AsyncServerCluster",
     "BaseClock",
     "BaseServer",
     "BootStatus",
@@ -101,10 +105,12 @@ __all__ = [
     "ScopeBuffer",
     "Score",
     "Server",
+    "ServerCluster",
     "ServerLifecycleCallback",
     "ServerLifecycleEvent",
     "ServerShutdownEvent",
     "Synth",
+    "SynthArray",
     "SynthDef",
     "SynthDefBuilder",
     "TimeUnit",
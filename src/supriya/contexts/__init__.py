@@ -2,6 +2,7 @@
 Tools for interacting with scsynth-compatible execution contexts.
 """
 
+from .clusters import AsyncServerCluster, ServerCluster
 from .core import Context
 from .entities import (
     Buffer,
@@ -13,6 +14,7 @@ from .entities import (
     Node,
     ScopeBuffer,
     Synth,
+    SynthArray,
 )
 from .nonrealtime import Score
 from .realtime import (
@@ -24,6 +26,7 @@ from .realtime import (
 
 __all__ = [
     "AsyncServer",
+    "AsyncServerCluster",
     "BaseServer",
     "Buffer",
     "BufferGroup",
@@ -36,6 +39,8 @@ __all__ = [
     "ScopeBuffer",
     "Score",
     "Server",
+    "ServerCluster",
     "ServerLifecycleCallback",
     "Synth",
+    "SynthArray",
 ]
@@ -1,22 +1,53 @@
 import bisect
 import dataclasses
+import heapq
 import threading
 
 
-@dataclasses.dataclass(order=True)
-class Block:
-    start_offset: int = 0
-    stop_offset: int = 0
+@dataclasses.dataclass(frozen=True)
+class BlockAllocatorStats:
+    """
+    A snapshot of a block allocator's usage.
+
+    :param allocation_count: The number of successful allocations.
+    :param failure_count: The number of allocations which found no large enough block.
+    :param free_count: The number of frees.
+    :param free_block_count: The number of free blocks.
+    :param free_size: The total size of all free blocks.
+    :param largest_free_block: The size of the largest free block.
+    :param used_size: The total size of all allocated blocks.
+    """
+
+    allocation_count: int
+    failure_count: int
+    free_count: int
+    free_block_count: int
+    free_size: int
+    largest_free_block: int
+    used_size: int
 
     @property
-    def size(self) -> float:
-        return self.stop_offset - self.start_offset
+    def fragmentation(self) -> float:
+        """
+        Get the fraction of free space outside the largest free block.
+
+        Zero when all free space is contiguous, approaching one as it is scattered
+        across many small blocks.
+        """
+        if not self.free_size:
+            return 0.0
+        return 1.0 - self.largest_free_block / self.free_size
 
 
 class BlockAllocator:
     """
     A block allocator.
 
+    Allocates the smallest free block large enough, preferring lower offsets among
+    blocks of the same size, and coalesces adjacent free blocks on free. Free blocks
+    are indexed by offset and segregated by size, so allocating and freeing take
+    logarithmic time.
+
     ::
 
         >>> from supriya.contexts.allocators import BlockAllocator
@@ -47,19 +78,36 @@ class BlockAllocator:
         >>> allocator.free(8)
         >>> allocator.allocate(8)
         8
+
+    ::
+
+        >>> allocator.free(0)
+        >>> stats = allocator.stats
+        >>> stats.free_size, stats.largest_free_block, stats.fragmentation
+        (4, 4, 0.0)
     """
 
     ### INITIALIZER ###
 
     def __init__(self, heap_maximum: int = 1024, heap_minimum: int = 0) -> None:
-        self._used_dict: dict[int, Block] = {}
-        self._free_heap: list[Block] = [
-            Block(
-                start_offset=heap_minimum,
-                stop_offset=heap_maximum,
-            )
-        ]
+        # allocated blocks, start offset to stop offset
+        self._used_blocks: dict[int, int] = {}
+        # free blocks, start offset to stop offset and back again
+        self._free_starts: dict[int, int] = {}
+        self._free_stops: dict[int, int] = {}
+        # free block sizes, ascending, each with a heap of start offsets, which may
+        # hold stale offsets for blocks since coalesced or allocated
+        self._free_sizes: list[int] = []
+        self._free_offsets: dict[int, list[int]] = {}
+        self._free_counts: dict[int, int] = {}
+        self._free_size = 0
+        self._used_size = 0
+        self._allocation_count = 0
+        self._failure_count = 0
+        self._free_count = 0
         self._lock = threading.Lock()
+        if heap_minimum < heap_maximum:
+            self._add_free_block(heap_minimum, heap_maximum)
 
     ### SPECIAL METHODS ###
 
@@ -72,53 +120,98 @@ class BlockAllocator:
         self.__dict__.update(state)
         self._lock = threading.Lock()
 
+    ### PRIVATE METHODS ###
+
+    def _add_free_block(self, start_offset: int, stop_offset: int) -> None:
+        size = stop_offset - start_offset
+        self._free_starts[start_offset] = stop_offset
+        self._free_stops[stop_offset] = start_offset
+        self._free_size += size
+        if size not in self._free_counts:
+            bisect.insort(self._free_sizes, size)
+            self._free_offsets[size] = []
+            self._free_counts[size] = 0
+        offsets = self._free_offsets[size]
+        self._free_counts[size] += 1
+        if len(offsets) > 2 * self._free_counts[size] + 16:
+            # too many stale offsets, so rebuild from the live ones
+            offsets[:] = sorted(
+                {
+                    offset
+                    for offset in offsets
+                    if self._free_starts.get(offset) == offset + size
+                }
+            )
+        heapq.heappush(offsets, start_offset)
+
+    def _remove_free_block(self, start_offset: int) -> int:
+        stop_offset = self._free_starts.pop(start_offset)
+        del self._free_stops[stop_offset]
+        size = stop_offset - start_offset
+        self._free_size -= size
+        self._free_counts[size] -= 1
+        if not self._free_counts[size]:
+            self._free_sizes.pop(bisect.bisect_left(self._free_sizes, size))
+            del self._free_offsets[size]
+            del self._free_counts[size]
+        return stop_offset
+
     ### PUBLIC METHODS ###
 
     def allocate(self, size: int = 1) -> int | None:
         with self._lock:
-            for i, block in enumerate(self._free_heap):
-                if size <= block.size:
-                    break
-            else:
+            if (i := bisect.bisect_left(self._free_sizes, size)) == len(
+                self._free_sizes
+            ):
+                self._failure_count += 1
                 return None
-            if size < block.size:
-                self._free_heap[i] = Block(
-                    start_offset=block.start_offset + size,
-                    stop_offset=block.stop_offset,
-                )
-            else:
-                self._free_heap.pop(i)
-            self._used_dict[block.start_offset] = Block(
-                start_offset=block.start_offset,
-                stop_offset=block.start_offset + size,
-            )
-            return int(block.start_offset)
+            block_size = self._free_sizes[i]
+            offsets = self._free_offsets[block_size]
+            while True:
+                start_offset = heapq.heappop(offsets)
+                if self._free_starts.get(start_offset) == start_offset + block_size:
+                    break
+            stop_offset = self._remove_free_block(start_offset)
+            if size < block_size:
+                self._add_free_block(start_offset + size, stop_offset)
+            self._used_blocks[start_offset] = start_offset + size
+            self._used_size += size
+            self._allocation_count += 1
+            return start_offset
 
     def free(self, index: int) -> None:
         with self._lock:
-            if (block := self._used_dict.pop(index, None)) is None:
+            if (stop_offset := self._used_blocks.pop(index, None)) is None:
                 return
-            self._free_heap.insert(
-                index := bisect.bisect(self._free_heap, block), block
-            )
-            # coalesce right
-            if (
-                index < (len(self._free_heap) - 1)
-                and self._free_heap[index].stop_offset
-                == self._free_heap[index + 1].start_offset
-            ):
-                self._free_heap[index].stop_offset = self._free_heap.pop(
-                    index + 1
-                ).stop_offset
+            self._free_count += 1
+            self._used_size -= stop_offset - index
+            start_offset = index
             # coalesce left
-            if (
-                index > 0
-                and self._free_heap[index].start_offset
-                == self._free_heap[index - 1].stop_offset
-            ):
-                self._free_heap[index - 1].stop_offset = self._free_heap.pop(
-                    index
-                ).stop_offset
+            if (left_offset := self._free_stops.get(start_offset)) is not None:
+                self._remove_free_block(left_offset)
+                start_offset = left_offset
+            # coalesce right
+            if stop_offset in self._free_starts:
+                stop_offset = self._remove_free_block(stop_offset)
+            self._add_free_block(start_offset, stop_offset)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def stats(self) -> BlockAllocatorStats:
+        """
+        Get the allocator's usage statistics.
+        """
+        with self._lock:
+            return BlockAllocatorStats(
+                allocation_count=self._allocation_count,
+                failure_count=self._failure_count,
+                free_count=self._free_count,
+                free_block_count=len(self._free_starts),
+                free_size=self._free_size,
+                largest_free_block=self._free_sizes[-1] if self._free_sizes else 0,
+                used_size=self._used_size,
+            )
 
 
 class NodeIdAllocator:
@@ -189,6 +282,9 @@ class NodeIdAllocator:
     def allocate_node_id(self, count: int = 1) -> int:
         with self._lock:
             x = self._temp
+            if 0x03FFFFFF < x + count - 1:
+                # wrap whole ranges, so they never run into the client ID bits
+                x = self._initial_node_id
             temp = x + count
             if 0x03FFFFFF < temp:
                 temp = (temp % 0x03FFFFFF) + self._initial_node_id
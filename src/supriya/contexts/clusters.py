@@ -0,0 +1,540 @@
+"""
+Tools for sharding synthesis across several realtime contexts.
+"""
+
+import abc
+import asyncio
+import concurrent.futures
+import dataclasses
+import threading
+from typing import Generic, Hashable, Iterator, Sequence, SupportsInt, TypeVar
+
+from ..enums import AddAction, CalculationRate
+from ..osc import find_free_port
+from ..scsynth import Options
+from ..typing import AddActionLike, CalculationRateLike
+from ..ugens import SynthDef, default
+from .entities import Buffer, Bus, ContextObject, Group, Synth
+from .realtime import AsyncServer, BaseServer, Server
+from .responses import StatusInfo
+
+S = TypeVar("S", bound=BaseServer)
+
+
+class PlacementPolicy(metaclass=abc.ABCMeta):
+    """
+    Base class for choosing which shard a new node lands on.
+
+    Policies only choose for nodes added without a target node. Nodes added
+    relative to another node always land on that node's shard.
+    """
+
+    @abc.abstractmethod
+    def select(self, shards: Sequence[BaseServer], key: Hashable | None = None) -> int:
+        """
+        Select the index of the shard for a new node.
+
+        :param shards: The cluster's shards.
+        :param key: The caller's placement key, if any.
+        """
+        raise NotImplementedError
+
+
+class RoundRobinPlacement(PlacementPolicy):
+    """
+    Place nodes on each shard in turn.
+
+    ::
+
+        >>> from supriya.contexts.clusters import RoundRobinPlacement
+        >>> policy = RoundRobinPlacement()
+        >>> [policy.select([None, None, None]) for _ in range(5)]
+        [0, 1, 2, 0, 1]
+    """
+
+    def __init__(self) -> None:
+        self.index = -1
+        self.lock = threading.Lock()
+
+    def select(self, shards: Sequence[BaseServer], key: Hashable | None = None) -> int:
+        with self.lock:
+            self.index = (self.index + 1) % len(shards)
+            return self.index
+
+
+class LeastLoadedPlacement(PlacementPolicy):
+    """
+    Place nodes on the shard with the lowest average CPU usage.
+
+    CPU usage comes from each shard's last ``/status`` reply, which only arrives
+    periodically. Until the next reply, each node placed on a shard is assumed to
+    cost that shard's current CPU usage per synth, so bursts of placements spread
+    out instead of piling onto one shard.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.pending: dict[int, int] = {}
+        self.statuses: dict[int, StatusInfo | None] = {}
+
+    def _estimate(self, index: int, status: StatusInfo | None) -> tuple[float, int]:
+        if self.statuses.get(index) is not status:
+            # A fresh reply already accounts for earlier placements.
+            self.statuses[index] = status
+            self.pending[index] = 0
+        pending = self.pending.get(index, 0)
+        if status is None:
+            return 0.0, pending
+        cost = status.average_cpu_usage / max(status.synth_count, 1)
+        return status.average_cpu_usage + pending * cost, status.synth_count + pending
+
+    def select(self, shards: Sequence[BaseServer], key: Hashable | None = None) -> int:
+        with self.lock:
+            index = min(
+                range(len(shards)), key=lambda i: self._estimate(i, shards[i].status)
+            )
+            self.pending[index] = self.pending.get(index, 0) + 1
+            return index
+
+
+class StickyPlacement(PlacementPolicy):
+    """
+    Place nodes sharing a key on the same shard.
+
+    The first node placed with a key chooses its shard via the fallback policy, and
+    later nodes with the same key follow it. Nodes without a key always use the
+    fallback.
+
+    ::
+
+        >>> from supriya.contexts.clusters import StickyPlacement
+        >>> policy = StickyPlacement()
+        >>> shards = [None, None, None]
+        >>> [policy.select(shards, key) for key in ["a", "b", "a", None, "b", "c"]]
+        [0, 1, 0, 2, 1, 0]
+
+    :param fallback: The policy for new keys, defaulting to round robin.
+    """
+
+    def __init__(self, fallback: PlacementPolicy | None = None) -> None:
+        self.fallback = fallback or RoundRobinPlacement()
+        self.indices: dict[Hashable, int] = {}
+        self.lock = threading.Lock()
+
+    def select(self, shards: Sequence[BaseServer], key: Hashable | None = None) -> int:
+        if key is None:
+            return self.fallback.select(shards)
+        with self.lock:
+            if (index := self.indices.get(key)) is None or index >= len(shards):
+                index = self.indices[key] = self.fallback.select(shards, key)
+            return index
+
+
+@dataclasses.dataclass(frozen=True)
+class ShardedBuffer:
+    """
+    A buffer allocated on every shard of a cluster.
+
+    Pass it as a synth control to use the buffer local to the synth's shard.
+
+    :param buffers: The buffer on each shard, in shard order.
+    """
+
+    buffers: tuple[Buffer, ...]
+
+    def __getitem__(self, index: int) -> Buffer:
+        return self.buffers[index]
+
+    def __iter__(self) -> Iterator[Buffer]:
+        return iter(self.buffers)
+
+    def __len__(self) -> int:
+        return len(self.buffers)
+
+    def free(self) -> None:
+        """
+        Free the buffer on every shard.
+        """
+        for buffer_ in self.buffers:
+            buffer_.free()
+
+
+@dataclasses.dataclass(frozen=True)
+class ShardedBus:
+    """
+    A bus allocated on every shard of a cluster.
+
+    Pass it as a synth control to use the bus local to the synth's shard.
+
+    :param buses: The bus on each shard, in shard order.
+    """
+
+    buses: tuple[Bus, ...]
+
+    def __getitem__(self, index: int) -> Bus:
+        return self.buses[index]
+
+    def __iter__(self) -> Iterator[Bus]:
+        return iter(self.buses)
+
+    def __len__(self) -> int:
+        return len(self.buses)
+
+    def free(self) -> None:
+        """
+        Free the bus on every shard.
+        """
+        for bus in self.buses:
+            bus.free()
+
+    def set(self, value: float) -> None:
+        """
+        Set the bus on every shard.
+
+        :param value: The value to set.
+        """
+        for bus in self.buses:
+            bus.set(value)
+
+    @property
+    def calculation_rate(self) -> CalculationRate:
+        """
+        Get the bus's calculation rate.
+        """
+        return self.buses[0].calculation_rate
+
+
+class BaseServerCluster(Generic[S], metaclass=abc.ABCMeta):
+    """
+    Base class for clusters of realtime contexts.
+
+    A cluster shards synthesis across several scsynth processes, each using its
+    own DSP core. Nodes land on a shard chosen by the cluster's placement policy,
+    and are ordinary :py:class:`~supriya.contexts.entities.Group` and
+    :py:class:`~supriya.contexts.entities.Synth` objects on that shard, so the
+    usual node API applies. Buses and buffers are allocated on every shard by
+    each shard's own allocators.
+
+    :param count: The number of shards.
+    :param options: The options for each shard.
+    :param policy: The placement policy, defaulting to round robin.
+    :param kwargs: Keyword arguments for options.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        count: int = 2,
+        options: Options | None = None,
+        policy: PlacementPolicy | None = None,
+        **kwargs,
+    ) -> None:
+        if count < 1:
+            raise ValueError(count)
+        self._options = dataclasses.replace(options or Options(), **kwargs)
+        self._policy = policy or RoundRobinPlacement()
+        self._shards: tuple[S, ...] = tuple(
+            self._new_shard(name=f"shard-{i}") for i in range(count)
+        )
+
+    ### SPECIAL METHODS ###
+
+    def __getitem__(self, index: int) -> S:
+        return self._shards[index]
+
+    def __iter__(self) -> Iterator[S]:
+        return iter(self._shards)
+
+    def __len__(self) -> int:
+        return len(self._shards)
+
+    ### PRIVATE METHODS ###
+
+    def _get_shard_options(self, port: int | None, **kwargs) -> Options:
+        return dataclasses.replace(
+            self._options, port=port or find_free_port(), **kwargs
+        )
+
+    @abc.abstractmethod
+    def _new_shard(self, name: str) -> S:
+        raise NotImplementedError
+
+    def _resolve_settings(self, index: int, settings: dict) -> dict:
+        return {
+            key: value[index]
+            if isinstance(value, (ShardedBuffer, ShardedBus))
+            else value
+            for key, value in settings.items()
+        }
+
+    def _select_shard(
+        self, target_node: SupportsInt | None, key: Hashable | None
+    ) -> tuple[int, S]:
+        if target_node is None:
+            index = self._policy.select(self._shards, key)
+            return index, self._shards[index]
+        if isinstance(target_node, ContextObject):
+            for index, shard in enumerate(self._shards):
+                if target_node.context is shard:
+                    return index, shard
+        # Bare node IDs are ambiguous: every shard has a node 1000.
+        raise ValueError(target_node)
+
+    ### PUBLIC METHODS ###
+
+    def add_buffer(self, **kwargs) -> ShardedBuffer:
+        """
+        Add a new buffer to every shard.
+
+        :param kwargs: Keyword arguments for
+            :py:meth:`~supriya.contexts.core.Context.add_buffer`.
+        """
+        return ShardedBuffer(
+            buffers=tuple(shard.add_buffer(**kwargs) for shard in self._shards)
+        )
+
+    def add_bus(
+        self, calculation_rate: CalculationRateLike = CalculationRate.CONTROL
+    ) -> ShardedBus:
+        """
+        Add a new bus to every shard.
+
+        :param calculation_rate: The calculation rate of the new bus.
+        """
+        return ShardedBus(
+            buses=tuple(shard.add_bus(calculation_rate) for shard in self._shards)
+        )
+
+    def add_group(
+        self,
+        *,
+        add_action: AddActionLike = AddAction.ADD_TO_HEAD,
+        target_node: SupportsInt | None = None,
+        parallel: bool = False,
+        permanent: bool = False,
+        key: Hashable | None = None,
+    ) -> Group:
+        """
+        Add a new group to a shard.
+
+        :param add_action: The add action to use when placing the new group.
+        :param target_node: The node to place the new group relative to, which
+            also determines the shard. If omitted, the placement policy chooses a
+            shard and the group goes in its default group.
+        :param parallel: Flag for creating a parallel group.
+        :param permanent: Flag for using a permanent node ID.
+        :param key: A placement key for the policy.
+        """
+        _, shard = self._select_shard(target_node, key)
+        return shard.add_group(
+            add_action=add_action,
+            target_node=target_node,
+            parallel=parallel,
+            permanent=permanent,
+        )
+
+    def add_synth(
+        self,
+        synthdef: SynthDef = default,
+        *,
+        add_action: AddActionLike = AddAction.ADD_TO_HEAD,
+        target_node: SupportsInt | None = None,
+        permanent: bool = False,
+        key: Hashable | None = None,
+        **settings,
+    ) -> Synth:
+        """
+        Add a new synth to a shard.
+
+        Sharded buses and buffers in the settings resolve to those on the synth's
+        shard.
+
+        :param synthdef: The synth's SynthDef.
+        :param add_action: The add action to use when placing the new synth.
+        :param target_node: The node to place the new synth relative to, which
+            also determines the shard. If omitted, the placement policy chooses a
+            shard and the synth goes in its default group.
+        :param permanent: Flag for using a permanent node ID.
+        :param key: A placement key for the policy.
+        :param settings: The synth's control settings.
+        """
+        index, shard = self._select_shard(target_node, key)
+        return shard.add_synth(
+            synthdef,
+            add_action=add_action,
+            target_node=target_node,
+            permanent=permanent,
+            **self._resolve_settings(index, settings),
+        )
+
+    def add_synthdefs(self, *synthdefs: SynthDef) -> None:
+        """
+        Add one or more SynthDefs to every shard.
+
+        :param synthdefs: The SynthDefs to add.
+        """
+        for shard in self._shards:
+            shard.add_synthdefs(*synthdefs)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def options(self) -> Options:
+        """
+        Get the options shared by each shard.
+        """
+        return self._options
+
+    @property
+    def policy(self) -> PlacementPolicy:
+        """
+        Get the cluster's placement policy.
+        """
+        return self._policy
+
+    @property
+    def shards(self) -> Sequence[S]:
+        """
+        Get the cluster's shards.
+        """
+        return self._shards
+
+
+class ServerCluster(BaseServerCluster[Server]):
+    """
+    A cluster of :py:class:`~supriya.contexts.realtime.Server` shards.
+
+    ::
+
+        >>> from supriya.contexts.clusters import LeastLoadedPlacement, ServerCluster
+        >>> cluster = ServerCluster(count=4, policy=LeastLoadedPlacement())
+        >>> cluster.boot()  # doctest: +SKIP
+        >>> synth = cluster.add_synth(frequency=443)  # doctest: +SKIP
+        >>> synth.set(frequency=666)  # doctest: +SKIP
+
+    :param count: The number of shards.
+    :param options: The options for each shard.
+    :param policy: The placement policy, defaulting to round robin.
+    :param kwargs: Keyword arguments for options.
+    """
+
+    ### PRIVATE METHODS ###
+
+    def _new_shard(self, name: str) -> Server:
+        return Server(name=name)
+
+    ### PUBLIC METHODS ###
+
+    def boot(self, **kwargs) -> "ServerCluster":
+        """
+        Boot every shard, in parallel, each on its own free port.
+
+        :param kwargs: Keyword arguments for options.
+        """
+        with concurrent.futures.ThreadPoolExecutor(len(self._shards)) as executor:
+            futures = [
+                executor.submit(
+                    shard.boot, options=self._get_shard_options(None, **kwargs)
+                )
+                for shard in self._shards
+            ]
+        for future in futures:
+            future.result()
+        return self
+
+    def connect(self, ports: Sequence[int], **kwargs) -> "ServerCluster":
+        """
+        Connect every shard to an already running server.
+
+        :param ports: The port of each shard's server, in shard order.
+        :param kwargs: Keyword arguments for options.
+        """
+        if len(ports) != len(self._shards):
+            raise ValueError(ports)
+        for shard, port in zip(self._shards, ports):
+            shard.connect(options=self._get_shard_options(port, **kwargs))
+        return self
+
+    def quit(self) -> "ServerCluster":
+        """
+        Quit every shard.
+        """
+        for shard in self._shards:
+            shard.quit()
+        return self
+
+    def sync(self, timeout: float = 1.0) -> "ServerCluster":
+        """
+        Sync every shard.
+
+        :param timeout: The amount of time in seconds to wait for each shard.
+        """
+        for shard in self._shards:
+            shard.sync(timeout=timeout)
+        return self
+
+
+class AsyncServerCluster(BaseServerCluster[AsyncServer]):
+    """
+    A cluster of :py:class:`~supriya.contexts.realtime.AsyncServer` shards.
+
+    :param count: The number of shards.
+    :param options: The options for each shard.
+    :param policy: The placement policy, defaulting to round robin.
+    :param kwargs: Keyword arguments for options.
+    """
+
+    ### PRIVATE METHODS ###
+
+    def _new_shard(self, name: str) -> AsyncServer:
+        return AsyncServer(name=name)
+
+    ### PUBLIC METHODS ###
+
+    async def boot(self, **kwargs) -> "AsyncServerCluster":
+        """
+        Boot every shard, concurrently, each on its own free port.
+
+        :param kwargs: Keyword arguments for options.
+        """
+        await asyncio.gather(
+            *(
+                shard.boot(options=self._get_shard_options(None, **kwargs))
+                for shard in self._shards
+            )
+        )
+        return self
+
+    async def connect(self, ports: Sequence[int], **kwargs) -> "AsyncServerCluster":
+        """
+        Connect every shard to an already running server.
+
+        :param ports: The port of each shard's server, in shard order.
+        :param kwargs: Keyword arguments for options.
+        """
+        if len(ports) != len(self._shards):
+            raise ValueError(ports)
+        await asyncio.gather(
+            *(
+                shard.connect(options=self._get_shard_options(port, **kwargs))
+                for shard, port in zip(self._shards, ports)
+            )
+        )
+        return self
+
+    async def quit(self) -> "AsyncServerCluster":
+        """
+        Quit every shard.
+        """
+        await asyncio.gather(*(shard.quit() for shard in self._shards))
+        return self
+
+    async def sync(self, timeout: float = 1.0) -> "AsyncServerCluster":
+        """
+        Sync every shard.
+
+        :param timeout: The amount of time in seconds to wait for each shard.
+        """
+        await asyncio.gather(*(shard.sync(timeout=timeout) for shard in self._shards))
+        return self
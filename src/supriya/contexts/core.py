@@ -14,6 +14,7 @@ import threading
 from collections.abc import Sequence as SequenceABC
 from os import PathLike
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Literal,
@@ -22,6 +23,7 @@ from typing import (
     SupportsFloat,
     SupportsInt,
     Type,
+    Union,
     cast,
 )
 
@@ -42,7 +44,7 @@ from ..typing import (
     SampleFormatLike,
     SupportsOsc,
 )
-from ..ugens import SynthDef
+from ..ugens import SynthDef, SynthDefCache
 from .allocators import BlockAllocator, NodeIdAllocator
 from .entities import (
     Buffer,
@@ -55,6 +57,7 @@ from .entities import (
     RootNode,
     ScopeBuffer,
     Synth,
+    SynthArray,
 )
 from .requests import (
     AllocateBuffer,
@@ -83,6 +86,7 @@ from .requests import (
     NewGroup,
     NewParallelGroup,
     NewSynth,
+    NewSynths,
     NormalizeBuffer,
     OrderNodes,
     ReadBuffer,
@@ -90,6 +94,7 @@ from .requests import (
     ReceiveSynthDefs,
     ReleaseNode,
     Request,
+    Requestable,
     RequestBundle,
     RunNode,
     SetBuffer,
@@ -102,6 +107,9 @@ from .requests import (
     ZeroBuffer,
 )
 
+if TYPE_CHECKING:
+    import numpy
+
 BUS_PATTERN = re.compile("([ac])(\\d+)")
 
 
@@ -230,8 +238,12 @@ class Context(metaclass=abc.ABCMeta):
         self._name: str | None = name
         self._node_id_allocator = NodeIdAllocator()
         self._options: Options = self._get_options(options, **kwargs)
+        # effective name -> anonymous name, if the context tracks SynthDef residency
+        self._resident_synthdefs: dict[str, str] | None = None
         self._scope_buffer_allocator: BlockAllocator | None = None
         self._sync_id: int = 0
+        self._synthdef_cache: SynthDefCache | None = None
+        self._synthdef_size_threshold: int | None = None
         self._sync_id_maximum: int = 32 << 26
         self._sync_id_minimum: int = 0
 
@@ -311,17 +323,41 @@ class Context(metaclass=abc.ABCMeta):
     def _apply_completions(
         pairs: list[tuple[Request, Completion | None]],
     ) -> list[Request]:
+        applied: list[Request] = []
+        for request, completion in pairs:
+            if completion is not None:
+                request = completion(request)
+            if isinstance(request, ReceiveSynthDefs) and not request.synthdefs:
+                # Every SynthDef was already resident, so only the completion remains.
+                if isinstance(request.on_completion, RequestBundle):
+                    applied.extend(
+                        cast(Sequence[Request], request.on_completion.contents)
+                    )
+                elif request.on_completion is not None:
+                    applied.append(cast(Request, request.on_completion))
+                continue
+            applied.append(request)
         requests: list[Request] = []
-        for key, group in itertools.groupby(
-            [
-                request if completion is None else completion(request)
-                for request, completion in pairs
-            ],
-            key=lambda x: type(x),
-        ):
+        for key, group in itertools.groupby(applied, key=lambda x: type(x)):
             requests.extend(key.merge(list(group)))
         return requests
 
+    @staticmethod
+    def _coerce_synth_control(
+        value: Sequence[SupportsFloat | str],
+    ) -> float | str | tuple[float | str, ...]:
+        processed_values: list[float | str] = []
+        for v in value:
+            if isinstance(v, str):
+                if not BUS_PATTERN.match(v):
+                    raise ValueError(v)
+                processed_values.append(v)
+            else:
+                processed_values.append(float(v))
+        if len(processed_values) == 1:
+            return processed_values[0]
+        return tuple(processed_values)
+
     @abc.abstractmethod
     def _free_id(
         self,
@@ -382,6 +418,43 @@ class Context(metaclass=abc.ABCMeta):
             return moments[-1]
         return None
 
+    def _get_synthdef_size_threshold(self) -> int | None:
+        return self._synthdef_size_threshold
+
+    def _filter_resident_synthdefs(
+        self, synthdefs: Sequence[SynthDef]
+    ) -> Sequence[SynthDef]:
+        """
+        Filter out SynthDefs already resident on the context, marking the rest so.
+        """
+        if self._resident_synthdefs is None:
+            return synthdefs
+        missing: list[SynthDef] = []
+        with self._lock:
+            for synthdef in synthdefs:
+                anonymous_name = synthdef.anonymous_name
+                effective_name = synthdef.effective_name
+                if self._resident_synthdefs.get(effective_name) != anonymous_name:
+                    self._resident_synthdefs[effective_name] = anonymous_name
+                    missing.append(synthdef)
+        return missing
+
+    def _new_receive_synthdefs(
+        self,
+        synthdefs: Sequence[SynthDef],
+        on_completion: Requestable | None = None,
+    ) -> ReceiveSynthDefs:
+        request = ReceiveSynthDefs(
+            synthdefs=synthdefs,
+            on_completion=on_completion,
+            cache=self._synthdef_cache,
+            size_threshold=self._get_synthdef_size_threshold(),
+        )
+        if self._synthdef_cache is not None:
+            for synthdef in request.get_cached_synthdefs():
+                self._synthdef_cache.store(synthdef)
+        return request
+
     def _pop_completion(self) -> None:
         self._get_completions().pop()
 
@@ -659,28 +732,20 @@ class Context(metaclass=abc.ABCMeta):
                 value = (value,)
             if value == parameter.value:
                 continue
-            processed_values: list[float | str] = []
-            for v in value:
-                if isinstance(v, str):
-                    if not BUS_PATTERN.match(v):
-                        raise ValueError(v)
-                    processed_values.append(v)
-                else:
-                    processed_values.append(float(v))
-            if len(processed_values) == 1:
-                synthdef_kwargs[parameter.name] = processed_values[0]
-            else:
-                synthdef_kwargs[parameter.name] = tuple(processed_values)
+            synthdef_kwargs[parameter.name] = self._coerce_synth_control(value)
         id_ = self._allocate_id(Node, permanent=permanent)
-        self._add_requests(
-            NewSynth(
-                add_action=add_action_,
-                synth_id=id_,
-                synthdef=synthdef,
-                target_node_id=target_node_id,
-                controls=synthdef_kwargs,
-            )
+        request: Request = NewSynth(
+            add_action=add_action_,
+            synth_id=id_,
+            synthdef=synthdef,
+            target_node_id=target_node_id,
+            controls=synthdef_kwargs,
         )
+        if self._resident_synthdefs is not None and self._filter_resident_synthdefs(
+            [synthdef]
+        ):
+            request = self._new_receive_synthdefs([synthdef], on_completion=request)
+        self._add_requests(request)
         return Synth(context=self, id_=id_, synthdef=synthdef)
 
     def add_synthdefs(
@@ -691,7 +756,10 @@ class Context(metaclass=abc.ABCMeta):
         """
         Add one or more SynthDefs to the context.
 
-        Emit ``/d_recv`` requests.
+        Emit ``/d_recv`` requests. Contexts tracking SynthDef residency skip those
+        SynthDefs already added, emitting only any completion requests if none
+        remain. Contexts with a SynthDef cache emit ``/d_load`` requests for
+        SynthDefs above the cache's size threshold.
 
         :param synthdefs: The synthdefs to add.
         :param on_completion: A callable with the buffer's context as the only argument.
@@ -701,9 +769,112 @@ class Context(metaclass=abc.ABCMeta):
         self._validate_can_request()
         if not synthdefs:
             raise ValueError
-        request = ReceiveSynthDefs(synthdefs=synthdefs)
+        request = self._new_receive_synthdefs(
+            self._filter_resident_synthdefs(synthdefs)
+        )
         return self._add_request_with_completion(request, on_completion)
 
+    def add_synths(
+        self,
+        synthdef: SynthDef,
+        count: int,
+        *,
+        add_action: AddActionLike = AddAction.ADD_TO_HEAD,
+        target_node: SupportsInt | None = None,
+        **controls: Union[
+            SupportsFloat,
+            str,
+            Sequence[SupportsFloat | str | Sequence[SupportsFloat | str]],
+            "numpy.ndarray",
+        ],
+    ) -> SynthArray:
+        """
+        Add many new synth nodes to the context at once.
+
+        Emit one ``/s_new`` request per synth, with contiguous node IDs.
+
+        Scalars, strings and buses are shared by every synth. Sequences and NumPy
+        arrays hold one value per synth and must be ``count`` long, except for
+        controls with several values, where one value per synth means a sequence of
+        sequences, or a two-dimensional array.
+
+        Synths are placed one after another relative to the target node, so adding
+        to a group's head leaves the last synth first.
+
+        :param synthdef: The :term:`SynthDef` to use for the new synths.
+        :param count: The number of synths to add.
+        :param add_action: The :term:`add action` to use when placing the new synths.
+        :param target_node: The node to place the new synths relative to.
+        :param controls: The new synths' control settings.
+        """
+        self._validate_can_request()
+        if count < 1:
+            raise ValueError(count)
+        add_action_ = AddAction.from_expr(add_action)
+        if add_action_ == AddAction.REPLACE and count > 1:
+            raise ValueError(add_action_)
+        if isinstance(target_node, Node):
+            if add_action_ not in target_node._valid_add_actions:
+                raise ValueError(add_action_)
+        target_node_id = self._resolve_node(target_node)
+        shared_controls: dict[int | str, float | str | tuple[float | str, ...]] = {}
+        synth_controls: dict[
+            int | str, Sequence[float | str | tuple[float | str, ...]]
+        ] = {}
+        for _, parameter in synthdef.indexed_parameters:
+            if parameter.name not in controls:
+                continue
+            value: Any = controls[parameter.name]
+            if hasattr(value, "tolist"):  # NumPy arrays and scalars
+                value = value.tolist()
+            multiple = len(parameter.value) > 1
+            if (
+                isinstance(value, Sequence)
+                and not isinstance(value, str)
+                and (
+                    not multiple
+                    or (
+                        len(value)
+                        and isinstance(value[0], Sequence)
+                        and not isinstance(value[0], str)
+                    )
+                )
+            ):
+                if len(value) != count:
+                    raise ValueError(parameter.name, len(value), count)
+                if multiple or any(isinstance(v, str) for v in value):
+                    synth_controls[parameter.name] = [
+                        self._coerce_synth_control(
+                            v
+                            if isinstance(v, Sequence) and not isinstance(v, str)
+                            else (v,)
+                        )
+                        for v in value
+                    ]
+                else:
+                    synth_controls[parameter.name] = [float(v) for v in value]
+                continue
+            if not isinstance(value, Sequence) or isinstance(value, str):
+                value = (value,)
+            if tuple(value) == parameter.value:
+                continue
+            shared_controls[parameter.name] = self._coerce_synth_control(value)
+        id_ = self._node_id_allocator.allocate_node_id(count)
+        request: Request = NewSynths(
+            add_action=add_action_,
+            synth_ids=range(id_, id_ + count),
+            synthdef=synthdef,
+            target_node_id=target_node_id,
+            controls=shared_controls,
+            synth_controls=synth_controls,
+        )
+        if self._resident_synthdefs is not None and self._filter_resident_synthdefs(
+            [synthdef]
+        ):
+            request = self._new_receive_synthdefs([synthdef], on_completion=request)
+        self._add_requests(request)
+        return SynthArray(context=self, id_=id_, synthdef=synthdef, count=count)
+
     def at(self, seconds=None) -> Moment:
         """
         Create a Moment.
@@ -933,6 +1104,27 @@ class Context(metaclass=abc.ABCMeta):
         self._validate_can_request()
         self._free_id(ScopeBuffer, scope_buffer.id_)
 
+    def free_synth_array(self, synth_array: SynthArray, force: bool = False) -> None:
+        """
+        Free a synth array.
+
+        Emit ``/n_free`` requests for synths without a ``gate`` control, or when
+        ``force`` is ``True``.
+
+        Emit ``/n_set <node.id_> gate 0`` requests for synths with ``gate`` controls.
+
+        :param synth_array: The synth array to free.
+        :param force: Flag for force-freeing, without releasing.
+        """
+        self._validate_can_request()
+        has_gate = "gate" in synth_array.synthdef.parameters
+        self._add_requests(
+            *(
+                ReleaseNode(node_id, force=force, has_gate=has_gate)
+                for node_id in synth_array.ids
+            )
+        )
+
     def free_synthdefs(self, *synthdefs: SynthDef) -> None:
         """
         Free one or more SynthDefs.
@@ -944,6 +1136,10 @@ class Context(metaclass=abc.ABCMeta):
         self._validate_can_request()
         if not synthdefs:
             raise ValueError
+        if self._resident_synthdefs is not None:
+            with self._lock:
+                for synthdef in synthdefs:
+                    self._resident_synthdefs.pop(synthdef.effective_name, None)
         request = FreeSynthDef(synthdefs=synthdefs)
         self._add_requests(request)
 
@@ -954,6 +1150,9 @@ class Context(metaclass=abc.ABCMeta):
         Emit ``/d_freeAll`` requests.
         """
         self._validate_can_request()
+        if self._resident_synthdefs is not None:
+            with self._lock:
+                self._resident_synthdefs.clear()
         request = FreeAllSynthDefs()
         self._add_requests(request)
 
@@ -1279,6 +1478,33 @@ class Context(metaclass=abc.ABCMeta):
         request = SetControlBus(items=[(int(bus), value)])
         self._add_requests(request)
 
+    def set_bus_array(
+        self,
+        bus: Bus,
+        values: Union["numpy.ndarray", Sequence[float]],
+        use_shared_memory: bool = False,
+    ) -> None:
+        """
+        Set a range of control buses from a NumPy array.
+
+        Emit ``/c_setn`` requests.
+
+        Writes the shared memory control buses in one slice assignment when
+        ``use_shared_memory`` is set.
+
+        :param bus: The bus to start writing at.
+        :param values: The values to write.
+        :param use_shared_memory: If true, use the shared memory interface.
+            Skip bundling the request in any open moment.
+        """
+        import numpy
+
+        self._validate_can_request()
+        if bus.calculation_rate != CalculationRate.CONTROL:
+            raise InvalidCalculationRate
+        values = numpy.asarray(values, dtype=float).reshape(-1)
+        self.set_bus_range(bus, values.tolist(), use_shared_memory=use_shared_memory)
+
     def set_bus_range(
         self, bus: Bus, values: Sequence[float], use_shared_memory: bool = False
     ) -> None:
@@ -1357,6 +1583,29 @@ class Context(metaclass=abc.ABCMeta):
         )
         self._add_requests(request)
 
+    def set_synthdef_cache(
+        self, cache: SynthDefCache | None, size_threshold: int | None = None
+    ) -> None:
+        """
+        Set the cache used to load large SynthDefs from disk.
+
+        SynthDefs compiling larger than the size threshold are written to the
+        cache and loaded via ``/d_load`` instead of being sent inline via
+        ``/d_recv``. The context's server must be able to read the cache
+        directory. Contexts have no cache until one is set. Once set, realtime
+        servers default the threshold to half their maximum datagram size when
+        the server is local and uses UDP, and otherwise keep sending inline unless
+        a threshold is given.
+
+        :param cache: The cache, or ``None`` to always send SynthDefs inline.
+        :param size_threshold: The size in bytes, or ``None`` for the context's
+            default.
+        """
+        self._synthdef_cache = cache
+        self._synthdef_size_threshold = (
+            None if size_threshold is None else int(size_threshold)
+        )
+
     def unpause_node(self, node: Node) -> None:
         """
         Unpause a node.
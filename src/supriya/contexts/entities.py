@@ -1,4 +1,5 @@
 import dataclasses
+import itertools
 import tempfile
 from os import PathLike
 from pathlib import Path
@@ -14,13 +15,14 @@ from typing import (
     Sequence,
     SupportsFloat,
     Union,
+    cast,
     overload,
 )
 
 from ..enums import AddAction, CalculationRate
 from ..exceptions import ContextError, InvalidCalculationRate, InvalidMoment
 from ..io import PlayMemo
-from ..soundfiles import load
+from ..soundfiles import load_array
 from ..typing import AddActionLike, HeaderFormatLike, SampleFormatLike, SupportsRender
 from ..ugens import SynthDef, default
 from .responses import BufferInfo, NodeInfo, QueryTreeGroup
@@ -29,6 +31,7 @@ if TYPE_CHECKING:
     import numpy
 
     from .core import Completion, Context
+    from .realtime import BaseServer
 
 
 @dataclasses.dataclass(frozen=True)
@@ -97,8 +100,6 @@ class Buffer(ContextObject):
 
     def __plot__(self) -> tuple["numpy.ndarray", float]:
         # TODO: Make this async compatible.
-        import numpy
-
         from .realtime import Server
 
         if not isinstance(self.context, Server):
@@ -107,8 +108,7 @@ class Buffer(ContextObject):
             file_path = Path(temp_directory) / "tmp.wav"
             self.write(file_path=file_path, header_format="wav", sample_format="int32")
             self.context.sync()
-            data, sample_rate = load(file_path)
-            return numpy.array(data), sample_rate
+            return load_array(file_path)
 
     def __render_memo__(
         self,
@@ -194,6 +194,37 @@ class Buffer(ContextObject):
         """
         return self.context.free_buffer(self, on_completion=on_completion)
 
+    def from_numpy(
+        self,
+        array: Union["numpy.ndarray", Sequence[float]],
+        starting_frame: int = 0,
+        *,
+        window: int = 8,
+        via: Literal["auto", "file", "osc"] = "auto",
+    ) -> Awaitable[None] | None:
+        """
+        Set the buffer's samples from a NumPy array.
+
+        Emit ``/b_setn`` and ``/sync`` requests, a datagram-sized chunk at a time,
+        or with ``via="file"`` a ``/b_read`` of a temporary file. With ``via="auto"``,
+        large transfers to servers this client booted locally use the file.
+
+        :param array: The samples to set, as a ``(frame_count, channel_count)``
+            array of frames or a flat array of interleaved samples, whose channel
+            count is then queried from the buffer.
+        :param starting_frame: The frame to start writing at.
+        :param window: The number of requests between syncs.
+        :param via: Transfer through ``"osc"`` messages or a ``"file"``, or choose
+            by size with ``"auto"``.
+        """
+        from .realtime import AsyncServer, Server
+
+        if not isinstance(self.context, (AsyncServer, Server)):
+            raise ContextError
+        return self.context.set_buffer_array(
+            self, array, starting_frame=starting_frame, window=window, via=via
+        )
+
     def generate(
         self,
         command_name: Literal["sine1", "sine2", "sine3", "cheby"],
@@ -356,6 +387,41 @@ class Buffer(ContextObject):
         """
         self.context.set_buffer_range(buffer=self, index=index, values=values)
 
+    def to_numpy(
+        self,
+        starting_frame: int = 0,
+        frame_count: int | None = None,
+        *,
+        window: int = 8,
+        via: Literal["auto", "file", "osc"] = "auto",
+    ) -> Union[Awaitable["numpy.ndarray"], "numpy.ndarray"]:
+        """
+        Get the buffer's samples as a ``(frame_count, channel_count)`` NumPy array.
+
+        Emit ``/b_query`` and ``/b_getn`` requests, a datagram-sized chunk at a time,
+        or with ``via="file"`` a ``/b_write`` to a memory-mapped temporary file. With
+        ``via="auto"``, large transfers from servers this client booted locally use
+        the file.
+
+        :param starting_frame: The frame to start reading at.
+        :param frame_count: The number of frames to read, or all remaining frames if
+            ``None``.
+        :param window: The maximum number of requests in flight.
+        :param via: Transfer through ``"osc"`` messages or a ``"file"``, or choose
+            by size with ``"auto"``.
+        """
+        from .realtime import AsyncServer, Server
+
+        if not isinstance(self.context, (AsyncServer, Server)):
+            raise ContextError
+        return self.context.get_buffer_array(
+            self,
+            starting_frame=starting_frame,
+            frame_count=frame_count,
+            window=window,
+            via=via,
+        )
+
     def write(
         self,
         file_path: PathLike,
@@ -640,6 +706,29 @@ class BusGroup(ContextObject):
             bus=self[0], count=len(self), sync=sync, use_shared_memory=use_shared_memory
         )
 
+    def get_array(
+        self,
+        *,
+        out: Optional["numpy.ndarray"] = None,
+        use_shared_memory: bool = False,
+    ) -> Union[Awaitable["numpy.ndarray"], "numpy.ndarray"]:
+        """
+        Get the control bus group's values as a NumPy array, in one call.
+
+        Emit ``/c_getn`` requests.
+
+        :param out: A float32 array to copy the values into, instead of allocating a
+            new one.
+        :param use_shared_memory: If true, use the shared memory interface.
+        """
+        from .realtime import AsyncServer, Server
+
+        if not isinstance(self.context, (AsyncServer, Server)):
+            raise ContextError
+        return self.context.get_bus_array(
+            bus=self[0], count=len(self), out=out, use_shared_memory=use_shared_memory
+        )
+
     def map_symbol(self) -> str:
         """
         Get the bus group's map symbol.
@@ -681,6 +770,26 @@ class BusGroup(ContextObject):
                 bus=self[0], values=values, use_shared_memory=use_shared_memory
             )
 
+    def set_array(
+        self,
+        values: Union["numpy.ndarray", Sequence[float]],
+        use_shared_memory: bool = False,
+    ) -> None:
+        """
+        Set the control bus group's values from a NumPy array, in one call.
+
+        Emit ``/c_setn`` requests.
+
+        :param values: The values to write, one per bus.
+        :param use_shared_memory: If true, use the shared memory interface.
+            Skips bundling the request in any open moment.
+        """
+        if len(values) != len(self):
+            raise ValueError(values)
+        self.context.set_bus_array(
+            bus=self[0], values=values, use_shared_memory=use_shared_memory
+        )
+
 
 @dataclasses.dataclass(frozen=True)
 class Node(ContextObject):
@@ -983,22 +1092,75 @@ class Group(Node):
         )
 
     @property
-    def children(self) -> list[Node]:
+    def children(self) -> "GroupChildren":
         """
         Get the group's children, as currently cached on the context.
+
+        The children are a live view, walked lazily.
         """
         from .realtime import BaseServer
 
         if not isinstance(self.context, BaseServer):
             raise ContextError
-        children: list[Node] = []
-        for id_ in self.context._node_children.get(self.id_, []):
-            if id_ in self.context._node_children:
-                children.append(Group(context=self.context, id_=id_))
-            else:
-                # cannot get synthdef name without running /g_queryTree
-                children.append(Synth(context=self.context, id_=id_, synthdef=default))
-        return children
+        return GroupChildren(group=self)
+
+
+class GroupChildren(Sequence[Node]):
+    """
+    A lazy view of a group's children, as currently cached on its context.
+
+    Iterating walks the context's linked node tree, and ``len()`` is constant
+    time. Indexing walks from the head, and slicing returns a list.
+
+    :param group: The group whose children to view.
+    """
+
+    def __init__(self, group: Group) -> None:
+        self.context = cast("BaseServer", group.context)
+        self.group = group
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (GroupChildren, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    @overload
+    def __getitem__(self, i: int) -> Node: ...
+
+    @overload
+    def __getitem__(self, s: slice) -> list[Node]: ...
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return list(self)[item]
+        if item < 0:
+            item += len(self)
+        if item >= 0:
+            for node in itertools.islice(self, item, None):
+                return node
+        raise IndexError(item)
+
+    def __iter__(self) -> Iterator[Node]:
+        for id_ in self.context._iterate_node_children(self.group.id_):
+            yield self._to_node(id_)
+
+    def __len__(self) -> int:
+        return self.context._node_child_counts.get(self.group.id_, 0)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.group!r} {list(self)!r}>"
+
+    def __reversed__(self) -> Iterator[Node]:
+        id_ = self.context._node_tails.get(self.group.id_, -1)
+        while id_ != -1:
+            yield self._to_node(id_)
+            id_ = self.context._node_previouses.get(id_, -1)
+
+    def _to_node(self, id_: int) -> Node:
+        if id_ in self.context._node_heads:
+            return Group(context=self.context, id_=id_)
+        # cannot get synthdef name without running /g_queryTree
+        return Synth(context=self.context, id_=id_, synthdef=default)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -1100,3 +1262,61 @@ class Synth(Node):
     @property
     def _valid_add_actions(self) -> Container[int]:
         return (AddAction.ADD_AFTER, AddAction.ADD_BEFORE, AddAction.REPLACE)
+
+
+@dataclasses.dataclass(frozen=True)
+class SynthArray(ContextObject):
+    r"""
+    An array of synth nodes with contiguous IDs, sharing a SynthDef.
+
+    Synths are only created when indexing or iterating.
+
+    :param context: The synth array's context.
+    :param id\_: The first synth's context ID.
+    :param synthdef: The synths' SynthDef.
+    :param count: The number of synths.
+    """
+
+    synthdef: SynthDef
+    count: int = 1
+
+    @overload
+    def __getitem__(self, i: int) -> Synth: ...
+
+    @overload
+    def __getitem__(self, s: slice) -> list[Synth]: ...
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._to_synth(id_) for id_ in self.ids[item]]
+        return self._to_synth(self.ids[item])
+
+    def __iter__(self) -> Iterator[Synth]:
+        for id_ in self.ids:
+            yield self._to_synth(id_)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _to_synth(self, id_: int) -> Synth:
+        return Synth(context=self.context, id_=id_, synthdef=self.synthdef)
+
+    def free(self, force: bool = False) -> None:
+        """
+        Free the synth array.
+
+        Emit ``/n_free`` for synths without a ``gate`` control, or when ``force``
+        is ``True``.
+
+        Emit ``/n_set <node.id_> gate 0`` for synths with ``gate`` controls.
+
+        :param force: Flag for force-freeing, without releasing.
+        """
+        self.context.free_synth_array(self, force=force)
+
+    @property
+    def ids(self) -> range:
+        """
+        Get the synth array's context IDs.
+        """
+        return range(self.id_, self.id_ + self.count)
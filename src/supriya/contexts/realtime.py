@@ -3,17 +3,27 @@ Tools for interacting with realtime execution contexts.
 """
 
 import asyncio
+import collections
 import concurrent.futures
+import functools
+import glob
+import ipaddress
 import logging
+import os
 import shlex
+import struct
+import tempfile
 import threading
+import time
 import warnings
 from collections.abc import Sequence as SequenceABC
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Awaitable,
     Callable,
     Iterable,
+    Iterator,
     Literal,
     NamedTuple,
     Optional,
@@ -42,15 +52,28 @@ from ..exceptions import (
 from ..osc import (
     AsyncOscProtocol,
     HealthCheck,
+    OscBundle,
     OscCallback,
     OscMessage,
     OscProtocol,
     OscProtocolOffline,
     ThreadedOscProtocol,
 )
-from ..scsynth import AsyncProcessProtocol, Options, ThreadedProcessProtocol
+from ..scsynth import (
+    AsyncProcessPool,
+    AsyncProcessProtocol,
+    Options,
+    ThreadedProcessPool,
+    ThreadedProcessProtocol,
+)
+from ..soundfiles import memmap, save
 from ..typing import AddActionLike, ServerLifecycleEventLike, SupportsOsc
-from ..ugens import SYSTEM_SYNTHDEFS
+from ..ugens import (
+    SYSTEM_SYNTHDEFS,
+    SynthDef,
+    compile_synthdefs,
+    decompile_synthdefs,
+)
 from .core import Context
 from .entities import (
     Buffer,
@@ -75,9 +98,12 @@ from .requests import (
     QueryTree,
     QueryVersion,
     Quit,
+    ReadBuffer,
+    SetBufferRange,
     Sync,
     ToggleNotifications,
     TraceNode,
+    WriteBuffer,
 )
 from .responses import (
     BufferInfo,
@@ -98,11 +124,17 @@ from .responses import (
 from .scopes import AmplitudeScope, FrequencyScope
 
 if TYPE_CHECKING:
+    import numpy
     from supriya_shm import ServerSHM
 
 logger = logging.getLogger(__name__)
 
 
+# A SynthDef file holding no SynthDefs: /d_recv-ing it loads nothing, but still runs
+# its completion once every asynchronous command before it has finished.
+EMPTY_SYNTHDEF_FILE = b"SCgf\x00\x00\x00\x02\x00\x00"
+
+
 class FailWarning(Warning):
     pass
 
@@ -144,6 +176,10 @@ class BaseServer(Context):
 
     _contexts: set["BaseServer"] = set()
 
+    # Buffer transfers above this many samples go through a file when choosing
+    # automatically.
+    _file_transfer_threshold: int = 1 << 16
+
     ### INITIALIZER ###
 
     def __init__(
@@ -159,12 +195,31 @@ class BaseServer(Context):
         self._lifecycle_event_callbacks: dict[
             ServerLifecycleEvent, list[ServerLifecycleCallback]
         ] = {}
+        self._maximum_datagram_size: int | None = None
         self._maximum_logins: int = 1
         self._node_active: dict[int, bool] = {}
-        self._node_children: dict[int, list[int]] = {}
+        # Each group's children form a doubly linked list, with -1 as the sentinel.
+        self._node_child_counts: dict[int, int] = {}
+        self._node_heads: dict[int, int] = {}
+        self._node_nexts: dict[int, int] = {}
         self._node_parents: dict[int, int] = {}
+        self._node_previouses: dict[int, int] = {}
+        self._node_tails: dict[int, int] = {}
+        # SynthDefs read from files loaded via /d_load or /d_loadDir, in the order
+        # the server completes them, awaiting its /done or /fail
+        self._pending_synthdef_files: collections.deque[list[SynthDef]] = (
+            collections.deque()
+        )
+        self._resident_synthdefs = {}
         self._shared_memory: Optional["ServerSHM"] = None
+        self._split_counters: dict[str, int] = dict.fromkeys(
+            ("bundles_split", "bundles_sent", "oversized_elements"), 0
+        )
         self._status: StatusInfo | None = None
+        self._system_synthdefs: dict[str, SynthDef] = dict(SYSTEM_SYNTHDEFS)
+        self._transfer_counters: dict[str, float] = dict.fromkeys(
+            ("transfers", "chunks", "samples", "seconds"), 0
+        )
 
     ### SPECIAL METHODS ###
 
@@ -195,19 +250,42 @@ class BaseServer(Context):
 
     ### PRIVATE METHODS ###
 
+    def _add_group_to_tree(self, id_: int) -> None:
+        self._node_child_counts[id_] = 0
+        self._node_heads[id_] = -1
+        self._node_tails[id_] = -1
+
     def _add_node_to_children(
         self, id_: int, parent_id: int, previous_id: int, next_id: int
     ) -> None:
         self._node_parents[id_] = parent_id
-        children = self._node_children[parent_id]
+        if parent_id not in self._node_heads:
+            return
         if previous_id == -1:
-            children.insert(0, id_)
+            next_id = self._node_heads[parent_id]
         elif next_id == -1:
-            children.append(id_)
-        elif previous_id in children:
-            children.insert(children.index(previous_id) + 1, id_)
-        elif next_id in children:
-            children.insert(children.index(next_id), id_)
+            previous_id = self._node_tails[parent_id]
+        elif self._node_parents.get(previous_id) == parent_id and (
+            previous_id in self._node_nexts
+        ):
+            next_id = self._node_nexts[previous_id]
+        elif self._node_parents.get(next_id) == parent_id and (
+            next_id in self._node_previouses
+        ):
+            previous_id = self._node_previouses[next_id]
+        else:
+            previous_id, next_id = self._node_tails[parent_id], -1
+        self._node_previouses[id_] = previous_id
+        self._node_nexts[id_] = next_id
+        if previous_id == -1:
+            self._node_heads[parent_id] = id_
+        else:
+            self._node_nexts[previous_id] = id_
+        if next_id == -1:
+            self._node_tails[parent_id] = id_
+        else:
+            self._node_previouses[next_id] = id_
+        self._node_child_counts[parent_id] += 1
 
     def _free_id(
         self,
@@ -217,6 +295,61 @@ class BaseServer(Context):
     ) -> None:
         self._get_allocator(type_, calculation_rate).free(id_)
 
+    def _get_buffer_chunks(self, index: int, count: int) -> list[tuple[int, int]]:
+        # Each sample costs four bytes plus a type tag, leaving room for the
+        # address, buffer ID, starting index and count.
+        size = max(1, (self._get_maximum_datagram_size() - 64) // 5)
+        return [
+            (i, min(size, index + count - i)) for i in range(index, index + count, size)
+        ]
+
+    def _get_buffer_transfer_path(self, mode: int) -> Path:
+        # Prefer a memory-backed filesystem, so transfer files never touch disk.
+        directory = "/dev/shm"
+        if not (os.path.isdir(directory) and os.access(directory, os.W_OK)):
+            directory = tempfile.gettempdir()
+        file_descriptor, path = tempfile.mkstemp(
+            dir=directory, prefix="supriya-", suffix=".wav"
+        )
+        # mkstemp() creates files only their owner may access, but the server may
+        # run as another user.
+        os.fchmod(file_descriptor, mode)
+        os.close(file_descriptor)
+        return Path(path)
+
+    def _get_maximum_datagram_size(self) -> int:
+        if self._maximum_datagram_size is not None:
+            return self._maximum_datagram_size
+        # Loopback has no meaningful MTU, but scsynth still reads into a fixed
+        # buffer; anywhere else, stay inside a single Ethernet frame.
+        return 8192 if self._is_loopback() else 1472
+
+    def _get_system_synthdef_batches(self) -> list[list[SynthDef]]:
+        if self._options.protocol != "udp":
+            return [list(self._system_synthdefs.values())]
+        # Leave room for the bundle, message address, type tags and blob size.
+        maximum = self._get_maximum_datagram_size() - 64
+        batches: list[list[SynthDef]] = []
+        size = maximum
+        for synthdef in self._system_synthdefs.values():
+            # Each SynthDef compiles to the shared 10-byte header plus its own bytes.
+            synthdef_size = len(compile_synthdefs(synthdef)) - 10
+            if size + synthdef_size > maximum:
+                batches.append([])
+                size = 10
+            batches[-1].append(synthdef)
+            size += synthdef_size
+        return batches
+
+    def _get_synthdef_size_threshold(self) -> int | None:
+        if self._synthdef_size_threshold is not None:
+            return self._synthdef_size_threshold
+        # Only a local server can read the cache, and only UDP limits sizes. Leave
+        # half a datagram for completion messages.
+        if self._options.protocol != "udp" or not self._is_loopback():
+            return None
+        return self._get_maximum_datagram_size() // 2
+
     def _handle_done_b_alloc(self, message: OscMessage) -> None:
         with self._lock:
             self._buffers.add(cast(int, message.contents[1]))
@@ -236,12 +369,30 @@ class BaseServer(Context):
                 self._buffers.remove(buffer_id)
             self._free_id(Buffer, buffer_id)
 
+    def _handle_done_d_load(self, message: OscMessage) -> None:
+        with self._lock:
+            if not self._pending_synthdef_files:
+                return
+            for synthdef in self._pending_synthdef_files.popleft():
+                cast(dict, self._resident_synthdefs)[synthdef.effective_name] = (
+                    synthdef.anonymous_name
+                )
+
+    def _handle_d_removed(self, message: OscMessage) -> None:
+        with self._lock:
+            cast(dict, self._resident_synthdefs).pop(message.contents[0], None)
+
     def _handle_fail(self, message: OscMessage) -> None:
         warnings.warn(
             " ".join(str(x) for x in message.contents).strip(),
             FailWarning,
         )
 
+    def _handle_fail_d_load(self, message: OscMessage) -> None:
+        with self._lock:
+            if self._pending_synthdef_files:
+                self._pending_synthdef_files.popleft()
+
     def _handle_n_end(self, message: OscMessage) -> None:
         with self._lock:
             node_id = cast(int, message.contents[0])
@@ -252,8 +403,10 @@ class BaseServer(Context):
                 self._remove_node_from_children(node_id, parent_id)
             self._free_id(Node, node_id)
             self._node_active.pop(node_id, None)
-            self._node_children.pop(node_id, None)
+            self._node_child_counts.pop(node_id, None)
+            self._node_heads.pop(node_id, None)
             self._node_parents.pop(node_id, None)
+            self._node_tails.pop(node_id, None)
 
     def _handle_n_go(self, message: OscMessage) -> None:
         with self._lock:
@@ -265,7 +418,7 @@ class BaseServer(Context):
             self._node_parents[node_id] = parent_id
             self._node_active[node_id] = True
             if is_group:
-                self._node_children[node_id] = []
+                self._add_group_to_tree(node_id)
             self._add_node_to_children(node_id, parent_id, previous_id, next_id)
 
     def _handle_n_move(self, message: OscMessage) -> None:
@@ -292,9 +445,90 @@ class BaseServer(Context):
         with self._lock:
             self._status = cast(StatusInfo, StatusInfo.from_osc(message))
 
+    def _is_loopback(self) -> bool:
+        try:
+            return ipaddress.ip_address(self._options.ip_address).is_loopback
+        except ValueError:
+            return self._options.ip_address == "localhost"
+
     def _log_prefix(self) -> str:
         return f"[{self._options.ip_address}:{self._options.port}/{self.name or hex(id(self))}] "
 
+    def _queue_synthdef_files(self, osc_message: OscBundle | OscMessage) -> None:
+        """
+        Queue the SynthDefs in local files each ``/d_load`` or ``/d_loadDir`` loads,
+        to be marked resident once the server completes loading them.
+
+        The server runs asynchronous commands in order, and only starts those in a
+        completion once its command finishes, so commands are queued level by
+        level: every command sent directly, then every command in their
+        completions, and so on.
+        """
+
+        def flatten(elements: Iterable[OscBundle | OscMessage]) -> Iterator[OscMessage]:
+            for element in elements:
+                if isinstance(element, OscBundle):
+                    yield from flatten(element.contents)
+                else:
+                    yield element
+
+        elements: list[OscBundle | OscMessage] = [osc_message]
+        while elements:
+            completions: list[OscBundle | OscMessage] = []
+            for message in flatten(elements):
+                if not message.contents:
+                    continue
+                if isinstance(
+                    completion := message.contents[-1], (OscBundle, OscMessage)
+                ):
+                    completions.append(completion)
+                if message.address == "/d_load":
+                    paths: Iterable[str | Path] = glob.glob(str(message.contents[0]))
+                elif message.address == "/d_loadDir":
+                    paths = Path(str(message.contents[0])).rglob("*.scsyndef")
+                else:
+                    continue
+                synthdefs: list[SynthDef] = []
+                for path in paths:
+                    try:
+                        synthdefs.extend(decompile_synthdefs(Path(path).read_bytes()))
+                    except (IndexError, OSError, TypeError, ValueError, struct.error):
+                        # Unreadable here (e.g. remote, or not a SynthDef): leave
+                        # untracked.
+                        continue
+                with self._lock:
+                    # Queue even if empty, so each /done pairs up with its command.
+                    self._pending_synthdef_files.append(synthdefs)
+            elements = completions
+
+    def _record_buffer_transfer(
+        self,
+        action: str,
+        buffer: Buffer,
+        samples: int,
+        chunks: int,
+        seconds: float,
+        via: str = "osc",
+    ) -> None:
+        with self._lock:
+            self._transfer_counters["transfers"] += 1
+            self._transfer_counters["chunks"] += chunks
+            self._transfer_counters["samples"] += samples
+            self._transfer_counters["seconds"] += seconds
+        logger.info(
+            self._log_prefix()
+            + f"{action} {samples} samples of buffer {buffer.id_}"
+            + (f" in {chunks} chunks" if via == "osc" else f" via {via}")
+            + f" in {seconds:.3f}s ({samples / (seconds or 1e-9):.0f} samples/s)"
+        )
+
+    def _release_buffer_transfer_path(self, path: Path) -> None:
+        # Mapped views outlive the unlink on POSIX; elsewhere the file stays behind.
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
     def _register_lifecycle_callback(
         self,
         event: ServerLifecycleEventLike | Iterable[ServerLifecycleEventLike],
@@ -322,13 +556,28 @@ class BaseServer(Context):
             self._lifecycle_event_callbacks.setdefault(event_, []).append(callback)
         return callback
 
+    def _iterate_node_children(self, parent_id: int) -> Iterator[int]:
+        # Tolerate the tree changing underfoot: a freed node just ends the walk.
+        id_ = self._node_heads.get(parent_id, -1)
+        while id_ != -1:
+            yield id_
+            id_ = self._node_nexts.get(id_, -1)
+
     def _remove_node_from_children(self, id_: int, parent_id: int) -> None:
-        if not (children := self._node_children.get(parent_id, [])):
+        if id_ not in self._node_nexts:
             return
-        try:
-            children.pop(children.index(id_))
-        except ValueError:
-            pass
+        previous_id = self._node_previouses.pop(id_)
+        next_id = self._node_nexts.pop(id_)
+        if previous_id != -1:
+            self._node_nexts[previous_id] = next_id
+        elif parent_id in self._node_heads:
+            self._node_heads[parent_id] = next_id
+        if next_id != -1:
+            self._node_previouses[next_id] = previous_id
+        elif parent_id in self._node_tails:
+            self._node_tails[parent_id] = previous_id
+        if parent_id in self._node_child_counts:
+            self._node_child_counts[parent_id] -= 1
 
     def _resolve_node(self, node: Node | SupportsInt | None) -> int:
         if node is None:
@@ -341,7 +590,12 @@ class BaseServer(Context):
             (["/done", "/b_allocRead"], self._handle_done_b_alloc_read),
             (["/done", "/b_allocReadChannel"], self._handle_done_b_alloc_read_channel),
             (["/done", "/b_free"], self._handle_done_b_free),
+            (["/done", "/d_load"], self._handle_done_d_load),
+            (["/done", "/d_loadDir"], self._handle_done_d_load),
+            (["/d_removed"], self._handle_d_removed),
             (["/fail"], self._handle_fail),
+            (["/fail", "/d_load"], self._handle_fail_d_load),
+            (["/fail", "/d_loadDir"], self._handle_fail_d_load),
             (["/n_end"], self._handle_n_end),
             (["/n_go"], self._handle_n_go),
             (["/n_move"], self._handle_n_move),
@@ -362,22 +616,87 @@ class BaseServer(Context):
             pass
 
     def _setup_system(self) -> None:
-        self._node_children[0] = []
+        self._add_group_to_tree(0)
         with self.at():
             for i in range(self._maximum_logins):
                 self.add_group(permanent=True, add_action="ADD_TO_TAIL", target_node=0)
-        for synthdef in SYSTEM_SYNTHDEFS.values():
-            with self.at():
-                self.add_synthdefs(synthdef)
+            # Pack the system SynthDefs into as few /d_recv requests as fit in a
+            # datagram, all sent in one bundle.
+            for synthdefs in self._get_system_synthdef_batches():
+                self.add_synthdefs(*synthdefs)
+
+    def _split_completion(
+        self, message: OscMessage, maximum: int
+    ) -> list[OscBundle | OscMessage]:
+        """
+        Split an asynchronous command whose completion bundle outgrows a datagram.
+
+        The command keeps as much of its completion as fits, and the rest rides in
+        the completions of empty ``/d_recv`` commands, which the server runs in
+        order after the command itself.
+        """
+        if not (
+            message.contents
+            and isinstance(completion := message.contents[-1], OscBundle)
+            and len(message.to_datagram()) + 20 > maximum
+        ):
+            return [message]
+        # Leave room for the enclosing bundle's header and element size.
+        arguments = message.contents[:-1]
+        budget = (
+            maximum
+            - 20
+            - len(OscMessage(message.address, *arguments, b"").to_datagram())
+        )
+        contents = list(completion.contents)
+        messages: list[OscBundle | OscMessage] = [
+            OscMessage(message.address, *arguments)
+        ]
+        if contents and budget > 16:
+            head = OscBundle.partition(
+                contents, timestamp=completion.timestamp, maximum=budget
+            )[0]
+            if len(head.contents) > 1 or len(head.to_datagram()) <= budget:
+                messages[0] = OscMessage(message.address, *arguments, head)
+                contents = contents[len(head.contents) :]
+        budget = (
+            maximum
+            - 20
+            - len(OscMessage("/d_recv", EMPTY_SYNTHDEF_FILE, b"").to_datagram())
+        )
+        for bundle in OscBundle.partition(
+            contents, timestamp=completion.timestamp, maximum=budget
+        ):
+            messages.append(OscMessage("/d_recv", EMPTY_SYNTHDEF_FILE, bundle))
+        return messages
 
     def _teardown_shared_memory(self) -> None:
         self._shared_memory = None
 
     def _teardown_state(self) -> None:
         self._node_active.clear()
-        self._node_children.clear()
+        self._node_child_counts.clear()
+        self._node_heads.clear()
+        self._node_nexts.clear()
         self._node_parents.clear()
+        self._node_previouses.clear()
+        self._node_tails.clear()
         self._buffers.clear()
+        cast(dict, self._resident_synthdefs).clear()
+        self._pending_synthdef_files.clear()
+
+    def _use_file_transfer(self, via: str, samples: int) -> bool:
+        if via == "auto":
+            # Only a server this client booted on this machine is known to share
+            # its filesystem.
+            return (
+                self._is_owner
+                and self._is_loopback()
+                and samples > self._file_transfer_threshold
+            )
+        if via not in ("file", "osc"):
+            raise ValueError(via)
+        return via == "file"
 
     def _validate_can_request(self) -> None:
         if self._boot_status not in (BootStatus.BOOTING, BootStatus.ONLINE):
@@ -431,6 +750,21 @@ class BaseServer(Context):
         scope.play()
         return scope
 
+    def register_system_synthdefs(self, *synthdefs: SynthDef) -> None:
+        """
+        Register SynthDefs to install alongside the system SynthDefs.
+
+        Registered SynthDefs are installed whenever the server boots or resets, and
+        immediately if the server is already online.
+
+        :param synthdefs: The SynthDefs to register.
+        """
+        with self._lock:
+            for synthdef in synthdefs:
+                self._system_synthdefs[synthdef.effective_name] = synthdef
+        if self._boot_status == BootStatus.ONLINE:
+            self.add_synthdefs(*synthdefs)
+
     def send(self, message: SequenceABC | SupportsOsc | str) -> None:
         """
         Send a message to the execution context.
@@ -440,7 +774,41 @@ class BaseServer(Context):
         if self._boot_status == BootStatus.OFFLINE:
             raise ServerOffline("Server offline!")
         osc_protocol: OscProtocol = getattr(self, "_osc_protocol")
-        osc_protocol.send(message)
+        if not isinstance(message, SupportsOsc):
+            osc_protocol.send(message)
+            return
+        osc_message = message.to_osc()
+        self._queue_synthdef_files(osc_message)
+        # Streams have no datagram limit, so only UDP bundles need splitting.
+        if osc_protocol.protocol != "udp":
+            osc_protocol.send(osc_message)
+            return
+        maximum = self._get_maximum_datagram_size()
+        timestamp: float | None = None
+        elements: SequenceABC[OscBundle | OscMessage] = [osc_message]
+        if isinstance(osc_message, OscBundle):
+            timestamp, elements = osc_message.timestamp, osc_message.contents
+        # Completions travel inside their command's datagram, so split oversized
+        # ones across further commands before partitioning.
+        contents: list[OscBundle | OscMessage] = []
+        for element in elements:
+            if isinstance(element, OscMessage):
+                contents.extend(self._split_completion(element, maximum))
+            else:
+                contents.append(element)
+        if isinstance(osc_message, OscMessage) and len(contents) == 1:
+            osc_protocol.send(osc_message)
+            return
+        bundles = OscBundle.partition(contents, timestamp=timestamp, maximum=maximum)
+        if len(bundles) > 1:
+            self._split_counters["bundles_split"] += 1
+            self._split_counters["bundles_sent"] += len(bundles)
+            self._split_counters["oversized_elements"] += sum(
+                len(bundle.contents) == 1 and len(bundle.to_datagram()) > maximum
+                for bundle in bundles
+            )
+        for bundle in bundles:
+            osc_protocol.send(bundle)
 
     def set_latency(self, latency: float) -> None:
         """
@@ -450,6 +818,19 @@ class BaseServer(Context):
         """
         self._latency = float(latency)
 
+    def set_maximum_datagram_size(self, size: int | None) -> None:
+        """
+        Set the size above which bundles are split before sending over UDP.
+
+        Defaults to 8192 bytes on loopback and 1472 bytes (one Ethernet frame)
+        elsewhere.
+
+        :param size: The size in bytes, or ``None`` to restore the default.
+        """
+        self._maximum_datagram_size = None if size is None else int(size)
+        if isinstance(osc_protocol := getattr(self, "_osc_protocol"), AsyncOscProtocol):
+            osc_protocol.maximum_datagram_size = self._get_maximum_datagram_size()
+
     def unregister_lifecycle_callback(self, callback: ServerLifecycleCallback) -> None:
         """
         Unregister a lifecycle callback.
@@ -487,6 +868,17 @@ class BaseServer(Context):
         """
         return self._shared_memory
 
+    @property
+    def split_counters(self) -> dict[str, int]:
+        """
+        Get counts of oversized bundles split by :py:meth:`send`.
+
+        ``bundles_split`` counts bundles which needed splitting, ``bundles_sent``
+        counts the smaller bundles sent in their place, and ``oversized_elements``
+        counts single messages too large to fit in any datagram.
+        """
+        return dict(self._split_counters)
+
     @property
     def status(self) -> StatusInfo | None:
         """
@@ -494,6 +886,19 @@ class BaseServer(Context):
         """
         return self._status
 
+    @property
+    def transfer_counters(self) -> dict[str, float]:
+        """
+        Get totals for chunked buffer transfers into and out of NumPy arrays.
+
+        ``transfers`` counts transfers, ``chunks`` the ``/b_getn`` or ``/b_setn``
+        requests they were split into, ``samples`` the samples moved and
+        ``seconds`` the time spent, so ``samples / seconds`` is the throughput
+        achieved.
+        """
+        with self._lock:
+            return dict(self._transfer_counters)
+
 
 class Server(BaseServer):
     """
@@ -529,6 +934,7 @@ class Server(BaseServer):
         self._osc_protocol: ThreadedOscProtocol = ThreadedOscProtocol(
             name=name, on_panic_callback=lambda: on_panic(ServerShutdownEvent.OSC_PANIC)
         )
+        self._process_pool: ThreadedProcessPool | None = None
         self._process_protocol: ThreadedProcessProtocol = ThreadedProcessProtocol(
             name=name,
             on_panic_callback=lambda: on_panic(ServerShutdownEvent.PROCESS_PANIC),
@@ -559,6 +965,7 @@ class Server(BaseServer):
             ip_address=self._options.ip_address,
             port=self._options.port,
             healthcheck=DEFAULT_HEALTHCHECK,
+            protocol=self._options.protocol,
         )
         try:
             self._setup_notifications()
@@ -656,17 +1063,38 @@ class Server(BaseServer):
 
     ### PUBLIC METHODS ###
 
-    def boot(self, *, options: Options | None = None, **kwargs) -> "Server":
+    def boot(
+        self,
+        *,
+        options: Options | None = None,
+        pool: ThreadedProcessPool | None = None,
+        **kwargs,
+    ) -> "Server":
         """
         Boot the server.
 
         :param options: The context's options.
+        :param pool: A pool of standby processes to boot from, skipping the wait
+            for scsynth to start. The pool's options replace the context's.
+            Rebooting boots from the same pool.
         :param kwargs: Keyword arguments for options.
         """
         if self._boot_status != BootStatus.OFFLINE:
             raise ServerOnline("Server already online!")
+        if pool is not None:
+            if options is not None or kwargs:
+                raise ValueError("Options come from the pool")
+            process_protocol = pool.acquire()
+            process_protocol.name = self._name
+            process_protocol.on_panic_callback = (
+                self._process_protocol.on_panic_callback
+            )
+            self._process_protocol = process_protocol
+            self._options = process_protocol.options
+        else:
+            self._options = self._get_options(options or self._options, **kwargs)
+        self._process_pool = pool
         self._boot_status = BootStatus.BOOTING
-        self._options = self._get_options(options or self._options, **kwargs)
         self._boot_future = concurrent.futures.Future()
         self._exit_future = concurrent.futures.Future()
         self._shutdown_future = concurrent.futures.Future()
@@ -770,6 +1198,114 @@ class Server(BaseServer):
         self._add_requests(request)
         return None
 
+    def get_buffer_array(
+        self,
+        buffer: Buffer,
+        starting_frame: int = 0,
+        frame_count: int | None = None,
+        *,
+        window: int = 8,
+        timeout: float = 1.0,
+        via: Literal["auto", "file", "osc"] = "auto",
+    ) -> "numpy.ndarray":
+        """
+        Get a buffer's samples as a NumPy array.
+
+        Emit ``/b_query`` and ``/b_getn`` requests.
+
+        Splits the transfer into datagram-sized ``/b_getn`` requests, keeping up to
+        ``window`` of them in flight, and copies each reply straight into a
+        ``(frame_count, channel_count)`` float32 array.
+
+        With ``via="file"``, instead emit a ``/b_write`` of a float WAV file into a
+        memory-backed temporary directory, and return a copy-on-write memory map of
+        its samples. This is much faster for large transfers, but the server must
+        share the client's filesystem and be able to write to its temporary
+        directory. With ``via="auto"``, transfers of more than 65,536 samples from
+        servers this client booted on the loopback interface use the file.
+
+        :param buffer: The buffer whose samples to get.
+        :param starting_frame: The frame to start reading at.
+        :param frame_count: The number of frames to read, or all remaining frames if
+            ``None``.
+        :param window: The maximum number of requests in flight.
+        :param timeout: The seconds to wait for each reply.
+        :param via: Transfer through ``"osc"`` messages or a ``"file"``, or choose
+            by size with ``"auto"``.
+        """
+        import numpy
+
+        info = cast(BufferInfo, self.query_buffer(buffer)).items[0]
+        if frame_count is None:
+            frame_count = info.frame_count - starting_frame
+        if self._use_file_transfer(via, frame_count * info.channel_count):
+            path = self._get_buffer_transfer_path(0o666)
+            start = time.perf_counter()
+            try:
+                self.send(
+                    WriteBuffer(
+                        buffer_id=buffer,
+                        path=path,
+                        frame_count=frame_count,
+                        header_format="wav",
+                        sample_format="float",
+                        starting_frame=starting_frame,
+                    )
+                )
+                self.sync(timeout=timeout)
+                mapped, _ = memmap(path)
+            finally:
+                self._release_buffer_transfer_path(path)
+            self._record_buffer_transfer(
+                "read", buffer, mapped.size, 1, time.perf_counter() - start, via="file"
+            )
+            return mapped
+        array = numpy.empty((frame_count, info.channel_count), dtype=numpy.float32)
+        samples = array.reshape(-1)
+        offset = starting_frame * info.channel_count
+        chunks = self._get_buffer_chunks(offset, samples.size)
+        semaphore = threading.Semaphore(window)
+        futures: list[concurrent.futures.Future[None]] = []
+        callbacks: list[OscCallback] = []
+
+        def on_reply(future: concurrent.futures.Future[None], message: OscMessage):
+            index, count = (
+                cast(int, message.contents[1]),
+                cast(int, message.contents[2]),
+            )
+            samples[index - offset : index - offset + count] = cast(
+                Sequence[float], message.contents[3:]
+            )
+            semaphore.release()
+            if not future.done():
+                future.set_result(None)
+
+        start = time.perf_counter()
+        try:
+            for index, count in chunks:
+                if not semaphore.acquire(timeout=timeout):
+                    raise concurrent.futures.TimeoutError
+                future: concurrent.futures.Future[None] = concurrent.futures.Future()
+                futures.append(future)
+                callbacks.append(
+                    self._osc_protocol.register(
+                        pattern=["/b_setn", buffer.id_, index],
+                        procedure=functools.partial(on_reply, future),
+                        once=True,
+                    )
+                )
+                self.send(GetBufferRange(buffer_id=buffer, items=[(index, count)]))
+            for future in futures:
+                future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            for callback in callbacks:
+                self._osc_protocol.unregister(callback)
+            raise
+        self._record_buffer_transfer(
+            "read", buffer, samples.size, len(chunks), time.perf_counter() - start
+        )
+        return array
+
     def get_buffer_range(
         self, buffer: Buffer, index: int, count: int, sync: bool = True
     ) -> Sequence[float] | None:
@@ -817,6 +1353,45 @@ class Server(BaseServer):
         self._add_requests(request)
         return None
 
+    def get_bus_array(
+        self,
+        bus: Bus,
+        count: int,
+        *,
+        out: Optional["numpy.ndarray"] = None,
+        use_shared_memory: bool = False,
+    ) -> "numpy.ndarray":
+        """
+        Get a range of control bus values as a NumPy array.
+
+        Emit ``/c_getn`` requests.
+
+        Copies the shared memory control buses into the array in one slice when
+        ``use_shared_memory`` is set.
+
+        :param bus: The control bus to start reading at.
+        :param count: The number of contiguous buses whose values to get.
+        :param out: A float32 array of ``count`` values to copy into, instead of
+            allocating a new one, e.g. when polling many buses at frame rate.
+        :param use_shared_memory: If true, use the shared memory interface.
+        """
+        import numpy
+
+        if bus.calculation_rate != CalculationRate.CONTROL:
+            raise InvalidCalculationRate
+        if out is None:
+            out = numpy.empty(count, dtype=numpy.float32)
+        values: Sequence[float]
+        if use_shared_memory and self._shared_memory is not None:
+            values = self._shared_memory[int(bus) : int(bus) + count]
+        else:
+            request = GetControlBusRange(items=[(int(bus), count)])
+            values = cast(
+                GetControlBusRangeInfo, request.communicate(server=self)
+            ).items[0][-1]
+        out[:] = values
+        return out
+
     def get_bus_range(
         self, bus: Bus, count: int, sync: bool = True, use_shared_memory: bool = False
     ) -> Sequence[float] | None:
@@ -996,7 +1571,7 @@ class Server(BaseServer):
         Reboot the server.
         """
         self.quit()
-        self.boot()
+        self.boot(pool=self._process_pool)
         return self
 
     def register_lifecycle_callback(
@@ -1056,6 +1631,118 @@ class Server(BaseServer):
         self.sync()
         return self
 
+    def set_buffer_array(
+        self,
+        buffer: Buffer,
+        array: "numpy.ndarray | Sequence[float]",
+        starting_frame: int = 0,
+        *,
+        window: int = 8,
+        timeout: float = 1.0,
+        via: Literal["auto", "file", "osc"] = "auto",
+    ) -> None:
+        """
+        Set a buffer's samples from a NumPy array.
+
+        Emit ``/b_setn`` and ``/sync`` requests.
+
+        Splits the transfer into datagram-sized ``/b_setn`` requests, following
+        every ``window`` of them with a ``/sync``, and waits for each sync before
+        sending more than two windows ahead of it.
+
+        With ``via="file"``, instead save a float WAV file into a memory-backed
+        temporary directory and emit a ``/b_read`` of it. This is much faster for
+        large transfers, but the server must share the client's filesystem. With
+        ``via="auto"``, transfers of more than 65,536 samples to servers this client
+        booted on the loopback interface use the file.
+
+        :param buffer: The buffer whose samples to set.
+        :param array: The samples to set, as a ``(frame_count, channel_count)``
+            array of frames or a flat array of interleaved samples, whose channel
+            count is then queried from the buffer.
+        :param starting_frame: The frame to start writing at.
+        :param window: The number of requests between syncs.
+        :param timeout: The seconds to wait for each sync.
+        :param via: Transfer through ``"osc"`` messages or a ``"file"``, or choose
+            by size with ``"auto"``.
+        """
+        import numpy
+
+        array = numpy.asarray(array, dtype=numpy.float32)
+        samples = array.reshape(-1)
+        if array.ndim > 1:
+            channel_count = array.shape[1]
+        else:
+            info = cast(BufferInfo, self.query_buffer(buffer)).items[0]
+            channel_count = info.channel_count
+        if self._use_file_transfer(via, samples.size):
+            path = self._get_buffer_transfer_path(0o644)
+            start = time.perf_counter()
+            try:
+                save(
+                    path,
+                    samples.reshape(-1, channel_count),
+                    self._options.sample_rate or 44100,
+                )
+                self.send(
+                    ReadBuffer(
+                        buffer_id=buffer,
+                        path=path,
+                        starting_frame_in_buffer=starting_frame,
+                    )
+                )
+                self.sync(timeout=timeout)
+            finally:
+                self._release_buffer_transfer_path(path)
+            self._record_buffer_transfer(
+                "wrote",
+                buffer,
+                samples.size,
+                1,
+                time.perf_counter() - start,
+                via="file",
+            )
+            return
+        offset = starting_frame * channel_count
+        chunks = self._get_buffer_chunks(offset, samples.size)
+        futures: collections.deque[concurrent.futures.Future[None]] = (
+            collections.deque()
+        )
+
+        callbacks: list[OscCallback] = []
+
+        def on_synced(
+            future: concurrent.futures.Future[None], message: OscMessage
+        ) -> None:
+            future.set_result(None)
+
+        start = time.perf_counter()
+        try:
+            for i, (index, count) in enumerate(chunks, 1):
+                values = samples[index - offset : index - offset + count].tolist()
+                self.send(SetBufferRange(buffer_id=buffer, items=[(index, values)]))
+                if i % window and i < len(chunks):
+                    continue
+                future: concurrent.futures.Future[None] = concurrent.futures.Future()
+                futures.append(future)
+                callbacks.append(
+                    self._osc_protocol.register(
+                        pattern=["/synced", sync_id := self._get_next_sync_id()],
+                        procedure=functools.partial(on_synced, future),
+                        once=True,
+                    )
+                )
+                self.send(Sync(sync_id=sync_id))
+                while len(futures) > 2 or (futures and i == len(chunks)):
+                    futures.popleft().result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            for callback in callbacks:
+                self._osc_protocol.unregister(callback)
+            raise
+        self._record_buffer_transfer(
+            "wrote", buffer, samples.size, len(chunks), time.perf_counter() - start
+        )
+
     def sync(self, sync_id: int | None = None, timeout: float = 1.0) -> "Server":
         """
         Sync the server.
@@ -1162,6 +1849,7 @@ class AsyncServer(BaseServer):
         self._osc_protocol: AsyncOscProtocol = AsyncOscProtocol(
             name=name, on_panic_callback=lambda: on_panic(ServerShutdownEvent.OSC_PANIC)
         )
+        self._process_pool: AsyncProcessPool | None = None
         self._process_protocol: AsyncProcessProtocol = AsyncProcessProtocol(
             name=name,
             on_panic_callback=lambda: on_panic(ServerShutdownEvent.PROCESS_PANIC),
@@ -1188,10 +1876,12 @@ class AsyncServer(BaseServer):
             await self._on_lifecycle_event(ServerLifecycleEvent.PROCESS_BOOTED)
         logger.info(log_prefix + "connecting ...")
         await self._on_lifecycle_event(ServerLifecycleEvent.CONNECTING)
+        self._osc_protocol.maximum_datagram_size = self._get_maximum_datagram_size()
         await self._osc_protocol.connect(
             ip_address=self._options.ip_address,
             port=self._options.port,
             healthcheck=DEFAULT_HEALTHCHECK,
+            protocol=self._options.protocol,
         )
         try:
             await self._setup_notifications()
@@ -1295,17 +1985,38 @@ class AsyncServer(BaseServer):
 
     ### PUBLIC METHODS ###
 
-    async def boot(self, *, options: Options | None = None, **kwargs) -> "AsyncServer":
+    async def boot(
+        self,
+        *,
+        options: Options | None = None,
+        pool: AsyncProcessPool | None = None,
+        **kwargs,
+    ) -> "AsyncServer":
         """
         Boot the server.
 
         :param options: The context's options.
+        :param pool: A pool of standby processes to boot from, skipping the wait
+            for scsynth to start. The pool's options replace the context's.
+            Rebooting boots from the same pool.
         :param kwargs: Keyword arguments for options.
         """
         if self._boot_status != BootStatus.OFFLINE:
             raise ServerOnline("Server already online!")
+        if pool is not None:
+            if options is not None or kwargs:
+                raise ValueError("Options come from the pool")
+            process_protocol = await pool.acquire()
+            process_protocol.name = self._name
+            process_protocol.on_panic_callback = (
+                self._process_protocol.on_panic_callback
+            )
+            self._process_protocol = process_protocol
+            self._options = process_protocol.options
+        else:
+            self._options = self._get_options(options or self._options, **kwargs)
+        self._process_pool = pool
         self._boot_status = BootStatus.BOOTING
-        self._options = self._get_options(options or self._options, **kwargs)
         loop = asyncio.get_running_loop()
         self._boot_future = loop.create_future()
         self._exit_future = loop.create_future()
@@ -1404,6 +2115,115 @@ class AsyncServer(BaseServer):
         self._add_requests(request)
         return None
 
+    async def get_buffer_array(
+        self,
+        buffer: Buffer,
+        starting_frame: int = 0,
+        frame_count: int | None = None,
+        *,
+        window: int = 8,
+        timeout: float = 1.0,
+        via: Literal["auto", "file", "osc"] = "auto",
+    ) -> "numpy.ndarray":
+        """
+        Get a buffer's samples as a NumPy array.
+
+        Emit ``/b_query`` and ``/b_getn`` requests.
+
+        Splits the transfer into datagram-sized ``/b_getn`` requests, keeping up to
+        ``window`` of them in flight, and copies each reply straight into a
+        ``(frame_count, channel_count)`` float32 array.
+
+        With ``via="file"``, instead emit a ``/b_write`` of a float WAV file into a
+        memory-backed temporary directory, and return a copy-on-write memory map of
+        its samples. This is much faster for large transfers, but the server must
+        share the client's filesystem and be able to write to its temporary
+        directory. With ``via="auto"``, transfers of more than 65,536 samples from
+        servers this client booted on the loopback interface use the file.
+
+        :param buffer: The buffer whose samples to get.
+        :param starting_frame: The frame to start reading at.
+        :param frame_count: The number of frames to read, or all remaining frames if
+            ``None``.
+        :param window: The maximum number of requests in flight.
+        :param timeout: The seconds to wait for each reply.
+        :param via: Transfer through ``"osc"`` messages or a ``"file"``, or choose
+            by size with ``"auto"``.
+        """
+        import numpy
+
+        info = cast(BufferInfo, await self.query_buffer(buffer)).items[0]
+        if frame_count is None:
+            frame_count = info.frame_count - starting_frame
+        if self._use_file_transfer(via, frame_count * info.channel_count):
+            path = self._get_buffer_transfer_path(0o666)
+            start = time.perf_counter()
+            try:
+                self.send(
+                    WriteBuffer(
+                        buffer_id=buffer,
+                        path=path,
+                        frame_count=frame_count,
+                        header_format="wav",
+                        sample_format="float",
+                        starting_frame=starting_frame,
+                    )
+                )
+                await self.sync(timeout=timeout)
+                mapped, _ = memmap(path)
+            finally:
+                self._release_buffer_transfer_path(path)
+            self._record_buffer_transfer(
+                "read", buffer, mapped.size, 1, time.perf_counter() - start, via="file"
+            )
+            return mapped
+        array = numpy.empty((frame_count, info.channel_count), dtype=numpy.float32)
+        samples = array.reshape(-1)
+        offset = starting_frame * info.channel_count
+        chunks = self._get_buffer_chunks(offset, samples.size)
+        semaphore = asyncio.Semaphore(window)
+        futures: list[asyncio.Future[None]] = []
+        callbacks: list[OscCallback] = []
+
+        def on_reply(future: asyncio.Future[None], message: OscMessage):
+            index, count = (
+                cast(int, message.contents[1]),
+                cast(int, message.contents[2]),
+            )
+            samples[index - offset : index - offset + count] = cast(
+                Sequence[float], message.contents[3:]
+            )
+            semaphore.release()
+            if not future.done():
+                future.set_result(None)
+
+        start = time.perf_counter()
+        try:
+            for index, count in chunks:
+                await asyncio.wait_for(semaphore.acquire(), timeout=timeout)
+                future: asyncio.Future[None] = (
+                    asyncio.get_running_loop().create_future()
+                )
+                futures.append(future)
+                callbacks.append(
+                    self._osc_protocol.register(
+                        pattern=["/b_setn", buffer.id_, index],
+                        procedure=functools.partial(on_reply, future),
+                        once=True,
+                    )
+                )
+                self.send(GetBufferRange(buffer_id=buffer, items=[(index, count)]))
+            for future in futures:
+                await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            for callback in callbacks:
+                self._osc_protocol.unregister(callback)
+            raise
+        self._record_buffer_transfer(
+            "read", buffer, samples.size, len(chunks), time.perf_counter() - start
+        )
+        return array
+
     async def get_buffer_range(
         self, buffer: Buffer, index: int, count: int, sync: bool = True
     ) -> Sequence[float] | None:
@@ -1451,6 +2271,45 @@ class AsyncServer(BaseServer):
         self._add_requests(request)
         return None
 
+    async def get_bus_array(
+        self,
+        bus: Bus,
+        count: int,
+        *,
+        out: Optional["numpy.ndarray"] = None,
+        use_shared_memory: bool = False,
+    ) -> "numpy.ndarray":
+        """
+        Get a range of control bus values as a NumPy array.
+
+        Emit ``/c_getn`` requests.
+
+        Copies the shared memory control buses into the array in one slice when
+        ``use_shared_memory`` is set.
+
+        :param bus: The control bus to start reading at.
+        :param count: The number of contiguous buses whose values to get.
+        :param out: A float32 array of ``count`` values to copy into, instead of
+            allocating a new one, e.g. when polling many buses at frame rate.
+        :param use_shared_memory: If true, use the shared memory interface.
+        """
+        import numpy
+
+        if bus.calculation_rate != CalculationRate.CONTROL:
+            raise InvalidCalculationRate
+        if out is None:
+            out = numpy.empty(count, dtype=numpy.float32)
+        values: Sequence[float]
+        if use_shared_memory and self._shared_memory is not None:
+            values = self._shared_memory[int(bus) : int(bus) + count]
+        else:
+            request = GetControlBusRange(items=[(int(bus), count)])
+            values = cast(
+                GetControlBusRangeInfo, await request.communicate_async(server=self)
+            ).items[0][-1]
+        out[:] = values
+        return out
+
     async def get_bus_range(
         self, bus: Bus, count: int, sync: bool = True, use_shared_memory: bool = False
     ) -> Sequence[float] | None:
@@ -1634,7 +2493,7 @@ class AsyncServer(BaseServer):
         Reboot the server.
         """
         await self.quit()
-        await self.boot()
+        await self.boot(pool=self._process_pool)
         return self
 
     def register_lifecycle_callback(
@@ -1694,6 +2553,116 @@ class AsyncServer(BaseServer):
         await self.sync()
         return self
 
+    async def set_buffer_array(
+        self,
+        buffer: Buffer,
+        array: "numpy.ndarray | Sequence[float]",
+        starting_frame: int = 0,
+        *,
+        window: int = 8,
+        timeout: float = 1.0,
+        via: Literal["auto", "file", "osc"] = "auto",
+    ) -> None:
+        """
+        Set a buffer's samples from a NumPy array.
+
+        Emit ``/b_setn`` and ``/sync`` requests.
+
+        Splits the transfer into datagram-sized ``/b_setn`` requests, following
+        every ``window`` of them with a ``/sync``, and waits for each sync before
+        sending more than two windows ahead of it.
+
+        With ``via="file"``, instead save a float WAV file into a memory-backed
+        temporary directory and emit a ``/b_read`` of it. This is much faster for
+        large transfers, but the server must share the client's filesystem. With
+        ``via="auto"``, transfers of more than 65,536 samples to servers this client
+        booted on the loopback interface use the file.
+
+        :param buffer: The buffer whose samples to set.
+        :param array: The samples to set, as a ``(frame_count, channel_count)``
+            array of frames or a flat array of interleaved samples, whose channel
+            count is then queried from the buffer.
+        :param starting_frame: The frame to start writing at.
+        :param window: The number of requests between syncs.
+        :param timeout: The seconds to wait for each sync.
+        :param via: Transfer through ``"osc"`` messages or a ``"file"``, or choose
+            by size with ``"auto"``.
+        """
+        import numpy
+
+        array = numpy.asarray(array, dtype=numpy.float32)
+        samples = array.reshape(-1)
+        if array.ndim > 1:
+            channel_count = array.shape[1]
+        else:
+            info = cast(BufferInfo, await self.query_buffer(buffer)).items[0]
+            channel_count = info.channel_count
+        if self._use_file_transfer(via, samples.size):
+            path = self._get_buffer_transfer_path(0o644)
+            start = time.perf_counter()
+            try:
+                save(
+                    path,
+                    samples.reshape(-1, channel_count),
+                    self._options.sample_rate or 44100,
+                )
+                self.send(
+                    ReadBuffer(
+                        buffer_id=buffer,
+                        path=path,
+                        starting_frame_in_buffer=starting_frame,
+                    )
+                )
+                await self.sync(timeout=timeout)
+            finally:
+                self._release_buffer_transfer_path(path)
+            self._record_buffer_transfer(
+                "wrote",
+                buffer,
+                samples.size,
+                1,
+                time.perf_counter() - start,
+                via="file",
+            )
+            return
+        offset = starting_frame * channel_count
+        chunks = self._get_buffer_chunks(offset, samples.size)
+        futures: collections.deque[asyncio.Future[None]] = collections.deque()
+
+        callbacks: list[OscCallback] = []
+
+        def on_synced(future: asyncio.Future[None], message: OscMessage) -> None:
+            future.set_result(None)
+
+        start = time.perf_counter()
+        try:
+            for i, (index, count) in enumerate(chunks, 1):
+                values = samples[index - offset : index - offset + count].tolist()
+                self.send(SetBufferRange(buffer_id=buffer, items=[(index, values)]))
+                if i % window and i < len(chunks):
+                    continue
+                future: asyncio.Future[None] = (
+                    asyncio.get_running_loop().create_future()
+                )
+                futures.append(future)
+                callbacks.append(
+                    self._osc_protocol.register(
+                        pattern=["/synced", sync_id := self._get_next_sync_id()],
+                        procedure=functools.partial(on_synced, future),
+                        once=True,
+                    )
+                )
+                self.send(Sync(sync_id=sync_id))
+                while len(futures) > 2 or (futures and i == len(chunks)):
+                    await asyncio.wait_for(futures.popleft(), timeout=timeout)
+        except asyncio.TimeoutError:
+            for callback in callbacks:
+                self._osc_protocol.unregister(callback)
+            raise
+        self._record_buffer_transfer(
+            "wrote", buffer, samples.size, len(chunks), time.perf_counter() - start
+        )
+
     async def sync(
         self, sync_id: int | None = None, timeout: float = 1.0
     ) -> "AsyncServer":
@@ -5,8 +5,10 @@ Classes for modeling requests to :term:`scsynth`.
 import asyncio
 import dataclasses
 import logging
+import time
 from abc import ABC, abstractmethod
 from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from os import PathLike
 from typing import (
     TYPE_CHECKING,
@@ -20,7 +22,7 @@ from uqbar.objects import new
 from ..enums import AddAction, HeaderFormat, RequestName, SampleFormat
 from ..osc import OscArgument, OscBundle, OscMessage
 from ..typing import AddActionLike, HeaderFormatLike, SampleFormatLike, SupportsOsc
-from ..ugens import SynthDef, compile_synthdefs
+from ..ugens import SynthDef, SynthDefCache, compile_synthdefs
 from .responses import Response
 
 if TYPE_CHECKING:
@@ -49,6 +51,19 @@ class Requestable(ABC):
     ]:
         raise NotImplementedError
 
+    def _on_reply(
+        self,
+        future: "Future[Response] | asyncio.Future[Response]",
+        message: OscMessage,
+        server: (
+            "supriya.contexts.realtime.Server | supriya.contexts.realtime.AsyncServer"
+        ),
+        start: float,
+    ) -> None:
+        if (metrics := server._osc_protocol.metrics) is not None:
+            metrics.record_round_trip(type(self).__name__, time.perf_counter() - start)
+        future.set_result(Response.from_osc(message))
+
     ### PUBLIC METHODS ###
 
     def communicate(
@@ -63,14 +78,20 @@ class Requestable(ABC):
             server.send(self)
             return None
         future: Future[Response] = Future()
-        server._osc_protocol.register(
+        osc_callback = server._osc_protocol.register(
             pattern=success_pattern,
             failure_pattern=failure_pattern,
-            procedure=lambda message: future.set_result(Response.from_osc(message)),
-            once=True,
+            procedure=lambda message: self._on_reply(future, message, server, start),
+            pending=True,
         )
+        start = time.perf_counter()
         server.send(requestable)
-        return future.result(timeout=timeout)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # No response received, so make sure to cleanup
+            server._osc_protocol.unregister(osc_callback)
+            raise
 
     async def communicate_async(
         self, server: "supriya.contexts.realtime.AsyncServer", timeout: float = 1.0
@@ -87,9 +108,10 @@ class Requestable(ABC):
         osc_callback = server._osc_protocol.register(
             pattern=success_pattern,
             failure_pattern=failure_pattern,
-            procedure=lambda message: future.set_result(Response.from_osc(message)),
-            once=True,
+            procedure=lambda message: self._on_reply(future, message, server, start),
+            pending=True,
         )
+        start = time.perf_counter()
         server.send(requestable)
         try:
             await asyncio.wait_for(future, timeout=timeout)
@@ -162,9 +184,16 @@ class RequestBundle(Requestable):
     ### PUBLIC METHODS ###
 
     def to_osc(self) -> OscBundle:
-        return OscBundle(
-            contents=[x.to_osc() for x in self.contents], timestamp=self.timestamp
-        )
+        contents: list[OscBundle | OscMessage] = []
+        for x in self.contents:
+            osc = x.to_osc()
+            # requests expanding to many messages are spliced in, so they can be
+            # partitioned along with their neighbors
+            if isinstance(x, Request) and isinstance(osc, OscBundle):
+                contents.extend(osc.contents)
+            else:
+                contents.append(osc)
+        return OscBundle(contents=contents, timestamp=self.timestamp)
 
 
 @dataclasses.dataclass
@@ -1356,6 +1385,77 @@ class NewSynth(Request):
         return OscMessage(RequestName.SYNTH_NEW, *contents)
 
 
+@dataclasses.dataclass
+class NewSynths(Request):
+    """
+    Many ``/s_new`` requests, sharing a SynthDef and placement.
+
+    Controls in ``controls`` are shared by every synth, while controls in
+    ``synth_controls`` hold one value per synth.
+
+    ::
+
+        >>> from supriya import default
+        >>> from supriya.contexts.requests import NewSynths
+        >>> request = NewSynths(
+        ...     synthdef=default,
+        ...     synth_ids=range(1001, 1004),
+        ...     add_action="ADD_TO_TAIL",
+        ...     target_node_id=1000,
+        ...     controls={"amplitude": 0.5},
+        ...     synth_controls={"frequency": [440.0, 550.0, 660.0]},
+        ... )
+        >>> for message in request.to_osc().contents:
+        ...     message
+        ...
+        OscMessage('/s_new', 'supriya:default', 1001, 1, 1000, 'amplitude', 0.5, 'frequency', 440.0)
+        OscMessage('/s_new', 'supriya:default', 1002, 1, 1000, 'amplitude', 0.5, 'frequency', 550.0)
+        OscMessage('/s_new', 'supriya:default', 1003, 1, 1000, 'amplitude', 0.5, 'frequency', 660.0)
+    """
+
+    synthdef: SynthDef | str
+    synth_ids: Sequence[SupportsInt]
+    add_action: AddActionLike
+    target_node_id: SupportsInt
+    controls: dict[int | str, float | str | tuple[float | str, ...]] | None = None
+    synth_controls: (
+        dict[int | str, Sequence[float | str | tuple[float | str, ...]]] | None
+    ) = None
+
+    def to_osc(self) -> OscBundle:
+        name = (
+            self.synthdef.effective_name
+            if isinstance(self.synthdef, SynthDef)
+            else self.synthdef
+        )
+        add_action = int(AddAction.from_expr(self.add_action))
+        target_node_id = int(self.target_node_id)
+        controls = self.controls or {}
+        synth_controls = self.synth_controls or {}
+        items: list[tuple[int | str, OscArgument, Sequence | None]] = []
+        for key in sorted({*controls, *synth_controls}):
+            if key in synth_controls:
+                items.append((key, None, synth_controls[key]))
+            else:
+                items.append((key, controls[key], None))
+        messages: list[OscBundle | OscMessage] = []
+        for i, synth_id in enumerate(self.synth_ids):
+            contents: list[OscArgument] = [
+                name,
+                int(synth_id),
+                add_action,
+                target_node_id,
+            ]
+            for key, value, column in items:
+                if column is not None:
+                    value = column[i]
+                if isinstance(value, tuple) and len(value) == 1:
+                    value = value[0]
+                contents.extend((key, value))
+            messages.append(OscMessage(RequestName.SYNTH_NEW, *contents))
+        return OscBundle(contents=messages)
+
+
 @dataclasses.dataclass
 class NormalizeBuffer(Request):
     """
@@ -1685,15 +1785,66 @@ class ReceiveSynthDefs(Request):
         ...     "/d_recv", default.compile(), OscMessage('/s_new', 'supriya:default', 1000, 1, 1),
         ... )
         True
+
+    With a cache and a size threshold, SynthDefs compiling larger than the threshold
+    are loaded from the cache via chained ``/d_load`` requests instead. Building the
+    request doesn't write to the cache, so store those SynthDefs before sending it:
+
+    ::
+
+        >>> import tempfile
+        >>> from supriya.ugens import SynthDefCache
+        >>> cache = SynthDefCache(tempfile.mkdtemp())
+        >>> request = ReceiveSynthDefs(
+        ...     synthdefs=[default],
+        ...     cache=cache,
+        ...     size_threshold=256,
+        ... )
+        >>> request.to_osc() == OscMessage("/d_load", str(cache.get_path(default)))
+        True
+
+    ::
+
+        >>> [cache.store(x).name for x in request.get_cached_synthdefs()]
+        ['d47e85613bb28f459b3e4a165cf3008b-supriya%3Adefault.scsyndef']
     """
 
     synthdefs: Sequence[SynthDef]
     on_completion: Requestable | None = None
+    cache: SynthDefCache | None = None
+    size_threshold: int | None = None
+
+    def _is_cached(self, synthdef: SynthDef) -> bool:
+        return (
+            self.cache is not None
+            and self.size_threshold is not None
+            and len(compile_synthdefs(synthdef)) > self.size_threshold
+        )
+
+    def get_cached_synthdefs(self) -> list[SynthDef]:
+        """
+        Get the SynthDefs to load from the cache rather than send inline.
+        """
+        return [synthdef for synthdef in self.synthdefs if self._is_cached(synthdef)]
 
     def to_osc(self) -> OscMessage:
-        contents: list[OscArgument] = [compile_synthdefs(*self.synthdefs)]
-        if self.on_completion:
-            contents.append(self.on_completion.to_osc())
+        synthdefs: Sequence[SynthDef] = self.synthdefs
+        on_completion = self.on_completion
+        if self.cache is not None and self.size_threshold is not None:
+            synthdefs, paths = [], []
+            for synthdef in self.synthdefs:
+                if self._is_cached(synthdef):
+                    paths.append(self.cache.get_path(synthdef))
+                else:
+                    synthdefs.append(synthdef)
+            # Chain the loads innermost-last so the completion runs after all of them.
+            for path in reversed(paths):
+                on_completion = LoadSynthDefs(path=path, on_completion=on_completion)
+            if not synthdefs and isinstance(on_completion, LoadSynthDefs):
+                return on_completion.to_osc()
+        contents: list[OscArgument] = [compile_synthdefs(*synthdefs)]
+        if on_completion:
+            contents.append(on_completion.to_osc())
         return OscMessage(RequestName.SYNTHDEF_RECEIVE, *contents)
 
 
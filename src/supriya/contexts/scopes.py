@@ -1,5 +1,6 @@
+import asyncio
 from threading import Lock
-from typing import TYPE_CHECKING, Literal, cast
+from typing import TYPE_CHECKING, AsyncIterator, Literal, cast
 
 from ..enums import AddAction, CalculationRate, ServerLifecycleEvent
 from ..exceptions import ServerOffline
@@ -9,9 +10,87 @@ from ..ugens.system import AMPLITUDE_SCOPE_SYNTHDEFS, FREQUENCY_SCOPE_SYNTHDEFS
 from .entities import Bus, BusGroup, Node, ScopeBuffer, Synth
 
 if TYPE_CHECKING:
+    import numpy
+
     from .realtime import BaseServer, ServerLifecycleCallback
 
 
+class _ScopeRing:
+    """
+    A ring of preallocated frames, filled from a scope's shared memory buffer by a
+    single polling task and read by any number of subscribers.
+    """
+
+    def __init__(self, scope: "BaseScope", size: int) -> None:
+        import numpy
+
+        if scope.context._shared_memory is None or scope.scope_buffer is None:
+            raise ValueError
+        channel_count, max_frames = scope.context._shared_memory.describe_scope_buffer(
+            int(scope.scope_buffer)
+        )
+        self.arrays = [
+            numpy.zeros((max_frames, channel_count), dtype=numpy.float32)
+            for _ in range(size)
+        ]
+        self.channel_count = channel_count
+        self.closed = False
+        self.condition = asyncio.Condition()
+        self.frame_counts = [0] * size
+        self.rates: list[float] = []
+        self.scope = scope
+        # the number of frames published so far
+        self.sequence = 0
+        self.task: asyncio.Task | None = None
+
+    def get(self, sequence: int) -> "numpy.ndarray":
+        index = sequence % len(self.arrays)
+        return self.arrays[index][: self.frame_counts[index]]
+
+    async def poll(self) -> None:
+        loop = asyncio.get_running_loop()
+        counters = self.scope._stream_counters
+        deadline = loop.time()
+        try:
+            while self.rates and self.scope.status == "online":
+                if self.publish(*self.scope.read()):
+                    async with self.condition:
+                        self.condition.notify_all()
+                interval = 1.0 / max(self.rates)
+                deadline += interval
+                if (delay := deadline - loop.time()) < 0:
+                    # skip the ticks we overran rather than bursting to catch up
+                    late = int(-delay // interval) + 1
+                    counters["late"] += late
+                    deadline += late * interval
+                    delay = deadline - loop.time()
+                await asyncio.sleep(delay)
+        except ValueError:
+            pass  # stopped between checking the status and reading
+        finally:
+            self.closed = True
+            if self.scope._ring is self:
+                self.scope._ring = None
+            async with self.condition:
+                self.condition.notify_all()
+
+    def publish(self, frame_count: int, data: list[float]) -> bool:
+        counters = self.scope._stream_counters
+        counters["polls"] += 1
+        if not frame_count:
+            counters["unchanged"] += 1
+            return False
+        index = self.sequence % len(self.arrays)
+        array = self.arrays[index]
+        frame_count = min(frame_count, len(array), len(data) // self.channel_count)
+        sample_count = frame_count * self.channel_count
+        array.reshape(-1)[:sample_count] = data[:sample_count]
+        self.frame_counts[index] = frame_count
+        self.sequence += 1
+        counters["frames"] += 1
+        return True
+
+
 class BaseScope:
     """
     Base class for scopes.
@@ -36,8 +115,12 @@ class BaseScope:
         self.lifecycle_callback: ServerLifecycleCallback | None = None
         self.lock = Lock()
         self.max_frames = 0
+        self._ring: _ScopeRing | None = None
         self.scope_buffer: ScopeBuffer | None = None
         self.status: Literal["online", "offline"] = "offline"
+        self._stream_counters: dict[str, int] = dict.fromkeys(
+            ("polls", "frames", "unchanged", "dropped", "late"), 0
+        )
         self.synth: Synth | None = None
         self.target_node: Node = target_node or self.context.root_node
 
@@ -94,6 +177,8 @@ class BaseScope:
     def stop(self) -> None:
         """
         Stop the scope.
+
+        Any streams end once their polling task next wakes.
         """
         with self.lock:
             if self.status == "offline":
@@ -115,6 +200,69 @@ class BaseScope:
                 self.lifecycle_callback = None
             self.status = "offline"
 
+    async def stream(
+        self, fps: float = 60.0, ring_size: int = 8
+    ) -> AsyncIterator["numpy.ndarray"]:
+        """
+        Stream frames from an online scope.
+
+        A single task polls the scope's shared memory buffer at the highest rate
+        any stream requests, skipping polls where the scope has not changed, and
+        copies each new frame into a ring of preallocated arrays shared by every
+        stream. Streams falling more than a ring behind skip ahead, counting the
+        frames they miss in :py:attr:`stream_counters`.
+
+        Each ``(frame_count, channel_count)`` frame is a view into the ring, valid
+        until the ring wraps around to it again. Copy it to keep it longer.
+
+        ::
+
+            >>> async for frame in scope.stream(fps=60):  # doctest: +SKIP
+            ...     draw(frame)
+            ...
+
+        :param fps: The frames per second to poll at.
+        :param ring_size: The number of frames in the ring, if this stream starts
+            the polling task.
+        """
+        if fps <= 0:
+            raise ValueError(fps)
+        if not self.status == "online":
+            raise ValueError
+        if (ring := self._ring) is None:
+            ring = self._ring = _ScopeRing(self, ring_size)
+            ring.task = asyncio.get_running_loop().create_task(ring.poll())
+        ring.rates.append(fps)
+        sequence = ring.sequence
+        try:
+            while True:
+
+                def is_ready(sequence: int = sequence) -> bool:
+                    return ring.closed or ring.sequence > sequence
+
+                async with ring.condition:
+                    await ring.condition.wait_for(is_ready)
+                if ring.sequence == sequence:
+                    return
+                if (missed := ring.sequence - sequence - len(ring.arrays)) > 0:
+                    self._stream_counters["dropped"] += missed
+                    sequence += missed
+                yield ring.get(sequence)
+                sequence += 1
+        finally:
+            ring.rates.remove(fps)
+
+    @property
+    def stream_counters(self) -> dict[str, int]:
+        """
+        Get the scope's streaming statistics.
+
+        Counts the buffer ``polls``, the new ``frames`` published, the ``unchanged``
+        polls skipped, the frames ``dropped`` by streams falling behind, and the
+        ``late`` ticks skipped by an overrunning polling task.
+        """
+        return dict(self._stream_counters)
+
 
 class AmplitudeScope(BaseScope):
     """
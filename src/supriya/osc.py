@@ -1,22 +1,31 @@
 import asyncio
+import bisect
 import collections
 import concurrent.futures
 import contextlib
 import dataclasses
 import datetime
+import functools
+import heapq
+import itertools
 import logging
 import pprint
+import re
+import selectors
 import socket
-import socketserver
 import struct
 import threading
 import time
 from collections.abc import Sequence as SequenceABC
 from enum import Enum
-from queue import Empty, Queue
+from os import PathLike
+from pathlib import Path
+from queue import SimpleQueue
 from typing import (
     Any,
+    AsyncGenerator,
     Awaitable,
+    BinaryIO,
     Callable,
     Generator,
     Iterator,
@@ -48,6 +57,10 @@ SYSTEM_EPOCH = datetime.date(*time.gmtime(0)[0:3])
 NTP_EPOCH = datetime.date(1900, 1, 1)
 NTP_DELTA = (SYSTEM_EPOCH - NTP_EPOCH).days * 24 * 3600
 
+_ADDRESS_PATTERN_CHARACTERS = frozenset("*?[]{}")
+_MAXIMUM_ADDRESS_PATTERN_EXPANSIONS = 64
+_SINGLE_WILDCARD_CHARACTERS = frozenset("*?[]")
+
 
 OscAddress: TypeAlias = Enum | int | str
 OscArgument: TypeAlias = Union[
@@ -187,7 +200,7 @@ class OscMessage:
     ### SPECIAL METHODS ###
 
     def __eq__(self, other) -> bool:
-        if type(self) is not type(other):
+        if not isinstance(other, OscMessage):
             return False
         if self.address != other.address:
             return False
@@ -204,141 +217,23 @@ class OscMessage:
     def __str__(self) -> str:
         return format_datagram(bytearray(self.to_datagram()))
 
-    ### PRIVATE METHODS ###
-
-    @staticmethod
-    def _decode_blob(data: bytes) -> tuple[bytes, bytes]:
-        actual_length, remainder = struct.unpack(">I", data[:4])[0], data[4:]
-        padded_length = actual_length
-        if actual_length % 4 != 0:
-            padded_length = (actual_length // 4 + 1) * 4
-        return remainder[:padded_length][:actual_length], remainder[padded_length:]
-
-    @staticmethod
-    def _decode_string(data: bytes) -> tuple[str, bytes]:
-        actual_length = data.index(b"\x00")
-        padded_length = (actual_length // 4 + 1) * 4
-        return str(data[:actual_length], "ascii"), data[padded_length:]
-
-    @staticmethod
-    def _encode_string(value: str) -> bytes:
-        result = bytes(value + "\x00", "ascii")
-        if len(result) % 4 != 0:
-            width = (len(result) // 4 + 1) * 4
-            result = result.ljust(width, b"\x00")
-        return result
-
-    @staticmethod
-    def _encode_blob(value: bytes) -> bytes:
-        result = bytes(struct.pack(">I", len(value)) + value)
-        if len(result) % 4 != 0:
-            width = (len(result) // 4 + 1) * 4
-            result = result.ljust(width, b"\x00")
-        return result
-
-    @classmethod
-    def _encode_value(cls, value: OscArgument) -> tuple[str, bytes]:
-        type_tags, encoded_value = "", b""
-        if isinstance(value, Enum):
-            if isinstance(value.value, str):
-                type_tags += "s"
-                encoded_value = cls._encode_string(value.value)
-            else:
-                type_tags += "i"
-                encoded_value += struct.pack(">i", value.value)
-        elif isinstance(value, (OscBundle, OscMessage)):
-            type_tags += "b"
-            encoded_value = cls._encode_blob(value.to_datagram())
-        elif isinstance(value, (bytearray, bytes)):
-            type_tags += "b"
-            encoded_value = cls._encode_blob(value)
-        elif isinstance(value, str):
-            type_tags += "s"
-            encoded_value = cls._encode_string(value)
-        elif isinstance(value, bool):
-            type_tags += "T" if value else "F"
-        elif isinstance(value, float):
-            type_tags += "f"
-            encoded_value += struct.pack(">f", value)
-        elif isinstance(value, int):
-            type_tags += "i"
-            encoded_value += struct.pack(">i", value)
-        elif value is None:
-            type_tags += "N"
-        elif isinstance(value, SequenceABC):
-            type_tags += "["
-            for sub_value in value:
-                sub_type_tags, sub_encoded_value = cls._encode_value(sub_value)
-                type_tags += sub_type_tags
-                encoded_value += sub_encoded_value
-            type_tags += "]"
-        else:
-            message = "Cannot encode {!r}".format(value)
-            raise TypeError(message)
-        return type_tags, encoded_value
-
     ### PUBLIC METHODS ###
 
     def to_datagram(self) -> bytes:
-        # address can be a string or (in SuperCollider) an int
-        if isinstance(self.address, str):
-            encoded_address = self._encode_string(self.address)
-        else:
-            encoded_address = struct.pack(">i", self.address)
-        encoded_type_tags = ","
-        encoded_contents = b""
-        for value in self.contents or ():
-            type_tags, encoded_value = self._encode_value(value)
-            encoded_type_tags += type_tags
-            encoded_contents += encoded_value
-        return (
-            encoded_address + self._encode_string(encoded_type_tags) + encoded_contents
-        )
+        return _encode(*_compile_message(self))
 
     @classmethod
-    def from_datagram(cls, datagram: bytes) -> "OscMessage":
-        remainder = datagram
-        address, remainder = cls._decode_string(remainder)
-        type_tags, remainder = cls._decode_string(remainder)
-        contents: list[OscArgument] = []
-        array_stack = [contents]
-        for type_tag in type_tags[1:]:
-            if type_tag == "i":
-                value, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "f":
-                value, remainder = struct.unpack(">f", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "d":
-                value, remainder = struct.unpack(">d", remainder[:8])[0], remainder[8:]
-                array_stack[-1].append(value)
-            elif type_tag == "s":
-                value, remainder = cls._decode_string(remainder)
-                array_stack[-1].append(value)
-            elif type_tag == "b":
-                value, remainder = cls._decode_blob(remainder)
-                for class_ in (OscBundle, OscMessage):
-                    try:
-                        value = class_.from_datagram(value)
-                        break
-                    except Exception:
-                        pass
-                array_stack[-1].append(value)
-            elif type_tag == "T":
-                array_stack[-1].append(True)
-            elif type_tag == "F":
-                array_stack[-1].append(False)
-            elif type_tag == "N":
-                array_stack[-1].append(None)
-            elif type_tag == "[":
-                array: list[OscArgument] = []
-                array_stack[-1].append(array)
-                array_stack.append(array)
-            elif type_tag == "]":
-                array_stack.pop()
-            else:
-                raise RuntimeError(f"Unable to parse type {type_tag!r}")
-        return cls(address, *contents)
+    def from_datagram(
+        cls, datagram: bytes | bytearray | memoryview, *, decode_blobs: bool = True
+    ) -> "OscMessage":
+        """
+        Decode a message from a datagram.
+
+        :param datagram: The datagram to decode.
+        :param decode_blobs: Flag for decoding blobs containing OSC messages or bundles.
+        """
+        data = datagram if isinstance(datagram, bytes) else bytes(datagram)
+        return _decode_message(data, 0, len(data), decode_blobs)
 
     def to_list(self):
         result = [self.address]
@@ -432,6 +327,11 @@ class OscBundle:
             if not isinstance(x, prototype):
                 raise ValueError(contents)
         self.contents = tuple(contents)
+        # Contents compiled while partitioning: contents, size, segments and the
+        # address and size of each message, reused while the contents are unchanged
+        self._compiled: tuple[tuple, int, list, list[tuple[OscAddress, int]]] | None = (
+            None
+        )
 
     ### SPECIAL METHODS ###
 
@@ -460,14 +360,6 @@ class OscBundle:
 
     ### PRIVATE METHODS ###
 
-    @staticmethod
-    def _decode_date(data: bytes) -> tuple[float | None, bytes]:
-        data, remainder = data[:8], data[8:]
-        if data == IMMEDIATELY:
-            return None, remainder
-        date = (struct.unpack(">Q", data)[0] / SECONDS_TO_NTP_TIMESTAMP) - NTP_DELTA
-        return date, remainder
-
     @staticmethod
     def _encode_date(seconds: float | None, realtime: bool = True) -> bytes:
         if seconds is None:
@@ -481,54 +373,80 @@ class OscBundle:
     ### PUBLIC METHODS ###
 
     @classmethod
-    def from_datagram(cls, datagram: bytes) -> "OscBundle":
-        if not datagram.startswith(BUNDLE_PREFIX):
+    def from_datagram(
+        cls, datagram: bytes | bytearray | memoryview, *, decode_blobs: bool = True
+    ) -> "OscBundle":
+        """
+        Decode a bundle from a datagram.
+
+        :param datagram: The datagram to decode.
+        :param decode_blobs: Flag for decoding blobs containing OSC messages or bundles.
+        """
+        data = datagram if isinstance(datagram, bytes) else bytes(datagram)
+        if not data.startswith(BUNDLE_PREFIX):
             raise ValueError("datagram is not a bundle")
-        remainder = datagram[8:]
-        timestamp, remainder = cls._decode_date(remainder)
-        contents = []
-        while len(remainder):
-            length, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-            item: OscBundle | OscMessage
-            if remainder.startswith(BUNDLE_PREFIX):
-                item = cls.from_datagram(remainder[:length])
-            else:
-                item = OscMessage.from_datagram(remainder[:length])
-            contents.append(item)
-            remainder = remainder[length:]
-        osc_bundle = cls(timestamp=timestamp, contents=tuple(contents))
-        return osc_bundle
+        return _decode_bundle(data, 0, len(data), decode_blobs)
 
     @classmethod
     def partition(
-        cls, messages: list[OscMessage], timestamp: float | None = None
+        cls,
+        messages: SequenceABC[Union["OscBundle", "OscMessage"]],
+        timestamp: float | None = None,
+        *,
+        maximum: int = 8192,
     ) -> list["OscBundle"]:
-        bundles = []
-        contents = []
-        messages_ = collections.deque(messages)
-        remaining = maximum = 8192 - len(BUNDLE_PREFIX) - 4
-        while messages_:
-            message = messages_.popleft()
-            datagram = message.to_datagram()
-            remaining -= len(datagram) + 4
-            if remaining > 0:
-                contents.append(message)
-            else:
-                bundles.append(cls(timestamp=timestamp, contents=contents))
-                contents = [message]
-                remaining = maximum
+        """
+        Partition messages into bundles whose datagrams fit in ``maximum`` bytes.
+
+        Order is preserved and every bundle shares the same timestamp. Messages too
+        large to share a bundle with anything else are bundled alone. Each bundle
+        encodes from the messages compiled while sizing it, without recompiling them.
+
+        ::
+
+            >>> from supriya.osc import OscBundle, OscMessage
+            >>> messages = [OscMessage("/n_free", i) for i in range(1000)]
+            >>> bundles = OscBundle.partition(messages, timestamp=1.5, maximum=1024)
+            >>> len(bundles), len(bundles[0].contents)
+            (20, 50)
+
+        ::
+
+            >>> all(len(bundle.to_datagram()) <= 1024 for bundle in bundles)
+            True
+
+        :param messages: The messages (or bundles) to partition.
+        :param timestamp: The timestamp of each resulting bundle.
+        :param maximum: The maximum datagram size in bytes.
+        """
+
+        def append() -> None:
+            bundle = cls(timestamp=timestamp, contents=contents)
+            # Keep the segments compiled for sizing, so encoding doesn't recompile
+            bundle._compiled = (bundle.contents, size - header_size, segments, sizes)
+            bundles.append(bundle)
+
+        bundles: list[OscBundle] = []
+        contents: list[OscBundle | OscMessage] = []
+        segments: list[_Segment] = []
+        sizes: list[tuple[OscAddress, int]] = []
+        size = header_size = len(BUNDLE_PREFIX) + 8
+        for message in messages:
+            message_sizes: list[tuple[OscAddress, int]] = []
+            message_size, message_segments = _compile_element(message, message_sizes)
+            if contents and size + message_size > maximum:
+                append()
+                contents, segments, sizes, size = [], [], [], header_size
+            contents.append(message)
+            segments.extend(message_segments)
+            sizes.extend(message_sizes)
+            size += message_size
         if contents:
-            bundles.append(cls(timestamp=timestamp, contents=contents))
+            append()
         return bundles
 
     def to_datagram(self, realtime: bool = True) -> bytes:
-        datagram: bytes = BUNDLE_PREFIX
-        datagram += self._encode_date(self.timestamp, realtime=realtime)
-        for content in self.contents:
-            content_datagram = content.to_datagram()
-            datagram += struct.pack(">i", len(content_datagram))
-            datagram += content_datagram
-        return datagram
+        return _encode(*_compile_bundle(self, realtime=realtime))
 
     def to_list(self):
         result = [self.timestamp]
@@ -539,6 +457,737 @@ class OscBundle:
         return self
 
 
+class LazyOscMessage(OscMessage):
+    """
+    An OSC message which defers decoding its arguments until they're accessed.
+
+    The address and type tags are decoded up front, so callbacks can be matched by
+    address without paying to decode arguments nobody asked for.
+
+    ::
+
+        >>> from supriya.osc import LazyOscMessage, OscMessage
+        >>> datagram = OscMessage("/n_go", 1000, 1, -1, -1, 0).to_datagram()
+        >>> message = LazyOscMessage.from_datagram(datagram)
+        >>> message.address, message.type_tags
+        ('/n_go', ',iiiii')
+
+    ::
+
+        >>> message.contents
+        (1000, 1, -1, -1, 0)
+
+    ::
+
+        >>> message == OscMessage("/n_go", 1000, 1, -1, -1, 0)
+        True
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, datagram: bytes, *, decode_blobs: bool = True) -> None:
+        address, offset = _decode_string(datagram, 0, len(datagram))
+        type_tags, offset = _decode_string(datagram, offset, len(datagram))
+        self.address = address
+        self.type_tags = type_tags
+        self._contents: tuple[OscArgument, ...] | None = None
+        self._datagram = datagram
+        self._decode_blobs = decode_blobs
+        self._offset = offset
+
+    ### PUBLIC METHODS ###
+
+    @classmethod
+    def from_datagram(
+        cls, datagram: bytes | bytearray | memoryview, *, decode_blobs: bool = True
+    ) -> "LazyOscMessage":
+        """
+        Decode a message's address and type tags from a datagram.
+
+        :param datagram: The datagram to decode.
+        :param decode_blobs: Flag for decoding blobs containing OSC messages or bundles.
+        """
+        data = datagram if isinstance(datagram, bytes) else bytes(datagram)
+        return cls(data, decode_blobs=decode_blobs)
+
+    def to_datagram(self) -> bytes:
+        return self._datagram
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def contents(self) -> tuple[OscArgument, ...]:  # type: ignore[override]
+        """
+        Get the message's arguments, decoding them on first access.
+        """
+        if self._contents is None:
+            self._contents = tuple(
+                _decode_arguments(
+                    self._datagram,
+                    self._offset,
+                    len(self._datagram),
+                    self.type_tags,
+                    self._decode_blobs,
+                )
+            )
+        return self._contents
+
+
+_Segment: TypeAlias = list  # [format, values]
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_struct(format_: str) -> struct.Struct:
+    return struct.Struct(">" + format_)
+
+
+def _compile_arguments(
+    values: SequenceABC[OscArgument],
+    type_tags: list[str],
+    formats: list[str],
+    data: list,
+    segments: list[_Segment],
+) -> int:
+    """
+    Compile OSC arguments into struct formats and values, returning their size.
+
+    Arguments accumulate into ``formats`` and ``data``, so runs of arguments share a
+    single struct. Nested messages and bundles flush the current run into
+    ``segments`` and append their own segments after it.
+    """
+    size = 0
+    for value in values:
+        type_ = type(value)
+        if type_ is float:
+            type_tags.append("f")
+            formats.append("f")
+            data.append(value)
+            size += 4
+        elif type_ is int:
+            type_tags.append("i")
+            formats.append("i")
+            data.append(value)
+            size += 4
+        elif type_ is str:
+            encoded = cast(str, value).encode("ascii")
+            length = (len(encoded) // 4 + 1) * 4
+            type_tags.append("s")
+            formats.append(f"{length}s")
+            data.append(encoded)
+            size += length
+        elif isinstance(value, Enum):
+            if isinstance(value.value, str):
+                encoded = value.value.encode("ascii")
+                length = (len(encoded) // 4 + 1) * 4
+                type_tags.append("s")
+                formats.append(f"{length}s")
+                data.append(encoded)
+                size += length
+            else:
+                type_tags.append("i")
+                formats.append("i")
+                data.append(value.value)
+                size += 4
+        elif isinstance(value, (OscBundle, OscMessage)):
+            if isinstance(value, OscBundle):
+                nested_size, nested_segments = _compile_bundle(value)
+            else:
+                nested_size, nested_segments = _compile_message(value)
+            type_tags.append("b")
+            formats.append("I")
+            data.append(nested_size)
+            segments.append(["".join(formats), data[:]])
+            segments.extend(nested_segments)
+            formats.clear()
+            data.clear()
+            size += 4 + nested_size
+        elif isinstance(value, (bytearray, bytes)):
+            length = (len(value) + 3) // 4 * 4
+            type_tags.append("b")
+            formats.append(f"I{length}s")
+            data.extend((len(value), value))
+            size += 4 + length
+        elif isinstance(value, str):
+            encoded = value.encode("ascii")
+            length = (len(encoded) // 4 + 1) * 4
+            type_tags.append("s")
+            formats.append(f"{length}s")
+            data.append(encoded)
+            size += length
+        elif isinstance(value, bool):
+            type_tags.append("T" if value else "F")
+        elif isinstance(value, float):
+            type_tags.append("f")
+            formats.append("f")
+            data.append(value)
+            size += 4
+        elif isinstance(value, int):
+            type_tags.append("i")
+            formats.append("i")
+            data.append(value)
+            size += 4
+        elif value is None:
+            type_tags.append("N")
+        elif isinstance(value, SequenceABC):
+            type_tags.append("[")
+            size += _compile_arguments(value, type_tags, formats, data, segments)
+            type_tags.append("]")
+        else:
+            raise TypeError(f"Cannot encode {value!r}")
+    return size
+
+
+def _compile_bundle(
+    bundle: OscBundle,
+    realtime: bool = True,
+    sizes: list[tuple[OscAddress, int]] | None = None,
+) -> tuple[int, list[_Segment]]:
+    """
+    Compile a bundle into its encoded size and a list of struct segments.
+
+    If ``sizes`` is given, the address and encoded size of every message in the
+    bundle, however deeply nested, are appended to it.
+    """
+    size = 16
+    segments: list[_Segment] = [
+        ["8s8s", [BUNDLE_PREFIX, OscBundle._encode_date(bundle.timestamp, realtime)]]
+    ]
+    if (compiled := bundle._compiled) is not None and compiled[0] is bundle.contents:
+        _, contents_size, contents_segments, contents_sizes = compiled
+        if sizes is not None:
+            sizes.extend(contents_sizes)
+        return size + contents_size, segments + contents_segments
+    for content in bundle.contents:
+        content_size, content_segments = _compile_element(content, sizes)
+        segments.extend(content_segments)
+        size += content_size
+    return size, segments
+
+
+def _compile_element(
+    content: OscBundle | OscMessage, sizes: list[tuple[OscAddress, int]] | None
+) -> tuple[int, list[_Segment]]:
+    """
+    Compile a bundle element into its encoded size, including its length prefix,
+    and a list of struct segments.
+    """
+    if isinstance(content, OscMessage):
+        content_size, content_segments = _compile_message(content)
+        if sizes is not None:
+            sizes.append((content.address, content_size))
+    else:
+        content_size, content_segments = _compile_bundle(content, sizes=sizes)
+    # Fold the element's length prefix into the element's first segment
+    first_segment = content_segments[0]
+    first_segment[0] = "i" + first_segment[0]
+    first_segment[1].insert(0, content_size)
+    return 4 + content_size, content_segments
+
+
+def _compile_message(message: OscMessage) -> tuple[int, list[_Segment]]:
+    """
+    Compile a message into its encoded size and a list of struct segments.
+    """
+    type_tags: list[str] = [","]
+    formats: list[str] = []
+    data: list[Any] = []
+    segments: list[_Segment] = []
+    size = _compile_arguments(message.contents, type_tags, formats, data, segments)
+    segments.append(["".join(formats), data])
+    encoded_type_tags = "".join(type_tags).encode("ascii")
+    type_tags_length = (len(encoded_type_tags) // 4 + 1) * 4
+    address: bytes | int
+    # address can be a string or (in SuperCollider) an int
+    if isinstance(message.address, str):
+        address = message.address.encode("ascii")
+        address_length = (len(address) // 4 + 1) * 4
+        header_format = f"{address_length}s{type_tags_length}s"
+    else:
+        address, address_length = message.address, 4
+        header_format = f"i{type_tags_length}s"
+    first_segment = segments[0]
+    first_segment[0] = header_format + first_segment[0]
+    first_segment[1][:0] = (address, encoded_type_tags)
+    return address_length + type_tags_length + size, segments
+
+
+def _encode(size: int, segments: list[_Segment]) -> bytes:
+    """
+    Pack compiled segments into a single preallocated buffer.
+    """
+    buffer = bytearray(size)
+    offset = 0
+    for format_, values in segments:
+        # Don't let one-off jumbo formats, e.g. long /b_setn runs, crowd the cache
+        if len(format_) > 256:
+            struct_ = struct.Struct(">" + format_)
+        else:
+            struct_ = _get_struct(format_)
+        struct_.pack_into(buffer, offset, *values)
+        offset += struct_.size
+    return bytes(buffer)
+
+
+_BLOB_LENGTH = struct.Struct(">I")
+_INT = struct.Struct(">i")
+_NTP_TIMESTAMP = struct.Struct(">Q")
+_MSG_DONTWAIT: int = getattr(socket, "MSG_DONTWAIT", 0)
+_CAPTURE_LOG_PREFIX = b"#osclog\x00"
+_CAPTURE_LOG_RECORD = struct.Struct(">dcI")  # timestamp, label, datagram length
+_FIXED_WIDTH_RUN = re.compile("[dfi]+")
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_type_tags(type_tags: str) -> tuple[tuple[str, Any], ...]:
+    """
+    Compile a message's type tags into a reusable decoding plan.
+
+    Runs of fixed-width arguments collapse into a single struct, so e.g. the samples
+    in a ``/b_getn.reply`` unpack in one call.
+    """
+    plan: list[tuple[str, Any]] = []
+    index, count = 1, len(type_tags)
+    while index < count:
+        type_tag = type_tags[index]
+        if type_tag in "dfi":
+            run = cast(re.Match, _FIXED_WIDTH_RUN.match(type_tags, index)).group()
+            index += len(run)
+            if run.count(type_tag) == len(run):
+                run = f"{len(run)}{type_tag}"
+            plan.append(("#", struct.Struct(">" + run)))
+            continue
+        elif type_tag == "T":
+            plan.append(("=", True))
+        elif type_tag == "F":
+            plan.append(("=", False))
+        elif type_tag == "N":
+            plan.append(("=", None))
+        elif type_tag in "[]bs":
+            plan.append((type_tag, None))
+        else:
+            raise RuntimeError(f"Unable to parse type {type_tag!r}")
+        index += 1
+    return tuple(plan)
+
+
+def _decode_blob(
+    data: bytes, offset: int, end: int, decode_blobs: bool
+) -> tuple["bytes | OscBundle | OscMessage", int]:
+    """
+    Decode a blob at ``offset``, returning it and the offset following it.
+
+    Blobs are only decoded as OSC when they begin with a bundle prefix or an address.
+    """
+    length = _BLOB_LENGTH.unpack_from(data, offset)[0]
+    start, stop = offset + 4, offset + 4 + length
+    if stop > end:
+        raise ValueError("blob overruns message")
+    next_offset = start + (length + 3) // 4 * 4
+    if decode_blobs and length:
+        if data.startswith(BUNDLE_PREFIX, start):
+            with contextlib.suppress(RuntimeError, ValueError, struct.error):
+                return _decode_bundle(data, start, stop, decode_blobs), next_offset
+        elif data[start] == 47:  # "/"
+            with contextlib.suppress(RuntimeError, ValueError, struct.error):
+                return _decode_message(data, start, stop, decode_blobs), next_offset
+    return data[start:stop], next_offset
+
+
+def _decode_bundle(data: bytes, offset: int, end: int, decode_blobs: bool) -> OscBundle:
+    """
+    Decode a bundle spanning ``data[offset:end]``.
+    """
+    timestamp: float | None = None
+    if (ntp_timestamp := _NTP_TIMESTAMP.unpack_from(data, offset + 8)[0]) != 1:
+        timestamp = ntp_timestamp / SECONDS_TO_NTP_TIMESTAMP - NTP_DELTA
+    offset += 16
+    contents: list[OscBundle | OscMessage] = []
+    while offset < end:
+        length = _INT.unpack_from(data, offset)[0]
+        offset += 4
+        if length < 0 or offset + length > end:
+            raise ValueError("bundle element overruns bundle")
+        if data.startswith(BUNDLE_PREFIX, offset):
+            contents.append(_decode_bundle(data, offset, offset + length, decode_blobs))
+        else:
+            contents.append(
+                _decode_message(data, offset, offset + length, decode_blobs)
+            )
+        offset += length
+    return OscBundle(timestamp=timestamp, contents=contents)
+
+
+def _decode_arguments(
+    data: bytes, offset: int, end: int, type_tags: str, decode_blobs: bool
+) -> list[OscArgument]:
+    """
+    Decode the arguments spanning ``data[offset:end]`` described by ``type_tags``.
+    """
+    contents: list[OscArgument] = []
+    array_stack = [contents]
+    for opcode, operand in _compile_type_tags(type_tags):
+        if opcode == "#":
+            if offset + operand.size > end:
+                raise ValueError("arguments overrun message")
+            array_stack[-1].extend(operand.unpack_from(data, offset))
+            offset += operand.size
+        elif opcode == "s":
+            value, offset = _decode_string(data, offset, end)
+            array_stack[-1].append(value)
+        elif opcode == "b":
+            blob, offset = _decode_blob(data, offset, end, decode_blobs)
+            array_stack[-1].append(blob)
+        elif opcode == "=":
+            array_stack[-1].append(operand)
+        elif opcode == "[":
+            array: list[OscArgument] = []
+            array_stack[-1].append(array)
+            array_stack.append(array)
+        else:
+            array_stack.pop()
+    return contents
+
+
+def _decode_message(
+    data: bytes, offset: int, end: int, decode_blobs: bool
+) -> OscMessage:
+    """
+    Decode a message spanning ``data[offset:end]``.
+    """
+    address, offset = _decode_string(data, offset, end)
+    type_tags, offset = _decode_string(data, offset, end)
+    return OscMessage(
+        address, *_decode_arguments(data, offset, end, type_tags, decode_blobs)
+    )
+
+
+def _decode_string(data: bytes, offset: int, end: int) -> tuple[str, int]:
+    """
+    Decode a null-terminated string at ``offset``, returning it and the padded offset
+    following it.
+    """
+    stop = data.index(b"\x00", offset, end)
+    return data[offset:stop].decode("ascii"), offset + ((stop - offset) // 4 + 1) * 4
+
+
+def _frame_datagram(datagram: bytes) -> bytes:
+    """
+    Prefix ``datagram`` with its length, for stream-oriented transports.
+    """
+    return _BLOB_LENGTH.pack(len(datagram)) + datagram
+
+
+def _coalesce_datagrams(datagrams: Sequence[bytes], maximum: int) -> list[bytes]:
+    """
+    Pack consecutive datagrams sharing a timetag into bundles of at most ``maximum``
+    bytes.
+
+    Messages share the immediate timetag, and bundles are merged by splicing their
+    elements together, so nothing is re-encoded and order is preserved.
+
+    ::
+
+        >>> from supriya.osc import OscBundle, OscMessage
+        >>> datagrams = [
+        ...     OscMessage("/n_free", 1000).to_datagram(),
+        ...     OscMessage("/n_free", 1001).to_datagram(),
+        ...     OscBundle(timestamp=10, contents=[OscMessage("/g_new", 1)]).to_datagram(),
+        ...     OscBundle(timestamp=10, contents=[OscMessage("/g_new", 2)]).to_datagram(),
+        ... ]
+        >>> for datagram in _coalesce_datagrams(datagrams, 8192):
+        ...     OscBundle.from_datagram(datagram)
+        ...
+        OscBundle(contents=[OscMessage('/n_free', 1000), OscMessage('/n_free', 1001)])
+        OscBundle(timestamp=10.0, contents=[OscMessage('/g_new', 1), OscMessage('/g_new', 2)])
+    """
+    coalesced: list[bytes] = []
+    elements: list[bytes] = []
+    timetag, size, single = b"", 16, b""
+    for datagram in datagrams:
+        if datagram.startswith(BUNDLE_PREFIX):
+            datagram_timetag, element = datagram[8:16], datagram[16:]
+        else:
+            datagram_timetag = IMMEDIATELY
+            element = _BLOB_LENGTH.pack(len(datagram)) + datagram
+        if elements and (datagram_timetag != timetag or size + len(element) > maximum):
+            if len(elements) == 1:
+                coalesced.append(single)
+            else:
+                coalesced.append(BUNDLE_PREFIX + timetag + b"".join(elements))
+            elements, size = [], 16
+        if not elements:
+            timetag, single = datagram_timetag, datagram
+        elements.append(element)
+        size += len(element)
+    if len(elements) == 1:
+        coalesced.append(single)
+    elif elements:
+        coalesced.append(BUNDLE_PREFIX + timetag + b"".join(elements))
+    return coalesced
+
+
+def compile_address_pattern(pattern: str) -> re.Pattern:
+    """
+    Compile an OSC 1.0 address pattern into a regular expression.
+
+    ``?`` matches any single character, ``*`` any run of characters, ``[a-z]`` (or
+    ``[!a-z]``) any character in (or not in) a set, and ``{foo,bar}`` any of the
+    listed strings. No wildcard matches across a ``/``. Brackets and braces that are
+    unterminated, or brackets that list no characters, match literally.
+
+    ::
+
+        >>> from supriya.osc import compile_address_pattern
+        >>> regex = compile_address_pattern("/n_{go,end}")
+        >>> [bool(regex.fullmatch(x)) for x in ("/n_go", "/n_end", "/n_off")]
+        [True, True, False]
+
+    ::
+
+        >>> regex = compile_address_pattern("/b_[!a-m]*")
+        >>> [bool(regex.fullmatch(x)) for x in ("/b_set", "/b_info", "/b_set/x")]
+        [True, False, False]
+
+    ::
+
+        >>> bool(compile_address_pattern("/b_[]").fullmatch("/b_[]"))
+        True
+
+    Raises ``ValueError`` if a character range is reversed, as in ``[z-a]``.
+
+    :param pattern: The address pattern to compile.
+    """
+    parts: list[str] = []
+    index, length = 0, len(pattern)
+    while index < length:
+        character = pattern[index]
+        if character == "*":
+            parts.append("[^/]*")
+        elif character == "?":
+            parts.append("[^/]")
+        elif (
+            character == "["
+            and (end := pattern.find("]", index + 1)) != -1
+            and (members := pattern[index + 1 : end]) not in ("", "!")
+        ):
+            negated = members.startswith("!")
+            if negated:
+                members = members[1:]
+            members = "".join(
+                "-" if x == "-" and 0 < i < len(members) - 1 else re.escape(x)
+                for i, x in enumerate(members)
+            )
+            parts.append(f"[^/{members}]" if negated else f"[{members}]")
+            index = end
+        elif character == "{" and (end := pattern.find("}", index + 1)) != -1:
+            choices = pattern[index + 1 : end].split(",")
+            parts.append("(?:" + "|".join(re.escape(x) for x in choices) + ")")
+            index = end
+        else:
+            parts.append(re.escape(character))
+        index += 1
+    try:
+        return re.compile("".join(parts))
+    except re.error as exception:
+        raise ValueError(f"invalid address pattern: {pattern!r}") from exception
+
+
+def is_address_pattern(address: Any) -> bool:
+    """
+    Test if ``address`` is an OSC address pattern rather than a plain address.
+
+    :param address: The address to test.
+    """
+    return isinstance(address, str) and not _ADDRESS_PATTERN_CHARACTERS.isdisjoint(
+        address
+    )
+
+
+def _expand_address_pattern(part: str) -> list[str] | None:
+    """
+    Expand an address part whose only wildcards are ``{...}`` choices into the
+    literal strings it matches, or return ``None`` if it can't be expanded.
+    """
+    if not _SINGLE_WILDCARD_CHARACTERS.isdisjoint(part):
+        return None
+    pieces: list[list[str]] = []
+    index = 0
+    while (start := part.find("{", index)) != -1:
+        if (end := part.find("}", start + 1)) == -1:
+            break
+        pieces.extend(([part[index:start]], part[start + 1 : end].split(",")))
+        index = end + 1
+    pieces.append([part[index:]])
+    expansions = [""]
+    for piece in pieces:
+        expansions = [x + y for x in expansions for y in piece]
+        if len(expansions) > _MAXIMUM_ADDRESS_PATTERN_EXPANSIONS:
+            return None
+    return expansions
+
+
+class _AddressPatternNode:
+    __slots__ = ("buckets", "expansions", "literals", "patterns", "wildcards")
+
+    def __init__(self) -> None:
+        self.buckets: dict[str, list[tuple[re.Pattern, _AddressPatternNode]]] | None = (
+            None
+        )
+        self.expansions: dict[str, list[_AddressPatternNode]] = {}
+        self.literals: dict[str, _AddressPatternNode] = {}
+        self.patterns: set[str] = set()
+        self.wildcards: dict[str, _AddressPatternNode] = {}
+
+    def index(self) -> dict[str, list[tuple[re.Pattern, "_AddressPatternNode"]]]:
+        # Choice-only wildcards are indexed by each string they expand to. The
+        # rest are bucketed by their leading literal character, with those that
+        # start with a wildcard under "", so a part is only tested against the
+        # wildcards that could possibly match it.
+        self.buckets, self.expansions = {}, {}
+        for part, child in self.wildcards.items():
+            if (expansions := _expand_address_pattern(part)) is not None:
+                # dict.fromkeys() drops repeated choices, e.g. {a,a}
+                for expansion in dict.fromkeys(expansions):
+                    self.expansions.setdefault(expansion, []).append(child)
+                continue
+            key = "" if part[0] in _ADDRESS_PATTERN_CHARACTERS else part[0]
+            self.buckets.setdefault(key, []).append(
+                (compile_address_pattern(part), child)
+            )
+        return self.buckets
+
+
+class AddressPatternTrie:
+    """
+    A dispatch trie of OSC address patterns, keyed by address part.
+
+    Literal parts are looked up directly, as are the strings that choice-only
+    parts like ``{go,end}`` expand to, and the remaining wildcard parts at each
+    level are bucketed by their leading character and only tested by regular
+    expression against parts they could match, so matching an address costs
+    time proportional to its depth rather than to the number of patterns.
+    Matches are memoized per address until the trie changes.
+
+    ::
+
+        >>> from supriya.osc import AddressPatternTrie
+        >>> trie = AddressPatternTrie()
+        >>> for pattern in ["/n_*", "/n_{go,end}", "/voice/*/gate", "/voice/1/*"]:
+        ...     trie.add(pattern)
+        ...
+        >>> sorted(trie.match("/n_go"))
+        ['/n_*', '/n_{go,end}']
+
+    ::
+
+        >>> sorted(trie.match("/voice/1/gate"))
+        ['/voice/*/gate', '/voice/1/*']
+    """
+
+    ### CLASS VARIABLES ###
+
+    MAXIMUM_CACHE_SIZE = 4096
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self.cache: dict[str, tuple[str, ...]] = {}
+        self.root = _AddressPatternNode()
+
+    ### PUBLIC METHODS ###
+
+    def add(self, pattern: str) -> None:
+        """
+        Add an address pattern.
+
+        :param pattern: The address pattern to add.
+        """
+        node = self.root
+        for part in pattern.split("/"):
+            if is_address_pattern(part):
+                if part not in node.wildcards:
+                    node.wildcards[part] = _AddressPatternNode()
+                    node.buckets = None
+                node = node.wildcards[part]
+            else:
+                node = node.literals.setdefault(part, _AddressPatternNode())
+        node.patterns.add(pattern)
+        self.cache.clear()
+
+    def match(self, address: str) -> tuple[str, ...]:
+        """
+        Get the address patterns matching ``address``.
+
+        :param address: The address to match.
+        """
+        if (patterns := self.cache.get(address)) is not None:
+            return patterns
+        nodes = [self.root]
+        for part in address.split("/"):
+            next_nodes: list[_AddressPatternNode] = []
+            for node in nodes:
+                if (child := node.literals.get(part)) is not None:
+                    next_nodes.append(child)
+                if not node.wildcards:
+                    continue
+                buckets = node.buckets if node.buckets is not None else node.index()
+                next_nodes.extend(node.expansions.get(part, ()))
+                for key in ("", part[:1]) if part else ("",):
+                    for regex, child in buckets.get(key, ()):
+                        if regex.fullmatch(part):
+                            next_nodes.append(child)
+            if not (nodes := next_nodes):
+                break
+        patterns = tuple(pattern for node in nodes for pattern in node.patterns)
+        if len(self.cache) >= self.MAXIMUM_CACHE_SIZE:
+            self.cache.clear()
+        self.cache[address] = patterns
+        return patterns
+
+    def remove(self, pattern: str) -> None:
+        """
+        Remove an address pattern.
+
+        :param pattern: The address pattern to remove.
+        """
+        path: list[tuple[_AddressPatternNode, str, bool]] = []
+        node = self.root
+        for part in pattern.split("/"):
+            path.append((node, part, wildcard := is_address_pattern(part)))
+            child = (node.wildcards if wildcard else node.literals).get(part)
+            if child is None:
+                return
+            node = child
+        node.patterns.discard(pattern)
+        # Prune now-empty nodes from the bottom up.
+        for parent, part, wildcard in reversed(path):
+            if node.patterns or node.literals or node.wildcards:
+                break
+            if wildcard:
+                del parent.wildcards[part]
+                parent.buckets = None
+            else:
+                del parent.literals[part]
+            node = parent
+        self.cache.clear()
+
+
+def _split_frames(buffer: bytearray) -> list[bytes]:
+    """
+    Pop every complete length-prefixed frame off the front of ``buffer``.
+    """
+    frames: list[bytes] = []
+    offset, end = 0, len(buffer)
+    while end - offset >= 4:
+        (size,) = _BLOB_LENGTH.unpack_from(buffer, offset)
+        if end - offset - 4 < size:
+            break
+        frames.append(bytes(buffer[offset + 4 : offset + 4 + size]))
+        offset += 4 + size
+    del buffer[:offset]
+    return frames
+
+
 def format_messages(messages: Sequence[OscBundle | OscMessage]) -> str:
     """
     Format a sequence of OSC messages as a string.
@@ -595,6 +1244,7 @@ class OscCallback(NamedTuple):
     once: bool = False
     args: tuple | None = None
     kwargs: dict | None = None
+    pending: bool = False
 
     def unregister(self) -> None:
         self.protocol.unregister(self)
@@ -610,31 +1260,527 @@ class HealthCheck:
     max_attempts: int = 5
 
 
+class OscMetrics:
+    """
+    Per-address traffic counters for an OSC protocol.
+
+    Counts messages and bytes sent and received per address, the time spent
+    dispatching callbacks per address, and round-trip latency histograms per
+    request type. Messages sent inside bundles count their own encoded size under
+    their own addresses, and bundles count only their framing under ``#bundle``, so
+    the bytes across all addresses add up to the bytes sent.
+
+    ::
+
+        >>> from supriya.osc import OscBundle, OscMessage, OscMetrics
+        >>> metrics = OscMetrics()
+        >>> metrics.record_sent(OscMessage("/n_free", 1000), 16)
+        >>> metrics.record_round_trip("QueryNode", 0.0015)
+        >>> snapshot = metrics.snapshot()
+        >>> snapshot["sent"]
+        {'/n_free': {'count': 1, 'bytes': 16}}
+
+    ::
+
+        >>> snapshot["round_trips"]["QueryNode"]["count"]
+        1
+
+    ::
+
+        >>> bundle = OscBundle(contents=[OscMessage("/n_free", 1001)])
+        >>> metrics.record_sent(bundle, len(bundle.to_datagram()))
+        >>> metrics.snapshot()["sent"]
+        {'/n_free': {'count': 2, 'bytes': 32}, '#bundle': {'count': 1, 'bytes': 20}}
+    """
+
+    ### CLASS VARIABLES ###
+
+    ROUND_TRIP_BOUNDS = (
+        0.0005,
+        0.001,
+        0.002,
+        0.005,
+        0.01,
+        0.02,
+        0.05,
+        0.1,
+        0.2,
+        0.5,
+        1.0,
+        float("inf"),
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.reset()
+
+    ### PRIVATE METHODS ###
+
+    ### PUBLIC METHODS ###
+
+    def record_dispatch(self, address: OscAddress, elapsed: float) -> None:
+        """
+        Record the time taken to run the callbacks for a received message.
+        """
+        with self.lock:
+            if (timings := self.dispatch.get(address)) is None:
+                self.dispatch[address] = [1, elapsed, elapsed]
+            else:
+                timings[0] += 1
+                timings[1] += elapsed
+                timings[2] = max(timings[2], elapsed)
+
+    def record_received(self, address: OscAddress, size: int) -> None:
+        """
+        Record a received message.
+        """
+        with self.lock:
+            if (counts := self.received.get(address)) is None:
+                self.received[address] = [1, size]
+            else:
+                counts[0] += 1
+                counts[1] += size
+
+    def record_round_trip(self, name: str, elapsed: float) -> None:
+        """
+        Record the latency of a request answered by a reply.
+        """
+        index = bisect.bisect_left(self.ROUND_TRIP_BOUNDS, elapsed)
+        with self.lock:
+            if (buckets := self.round_trips.get(name)) is None:
+                buckets = self.round_trips[name] = [0] * len(self.ROUND_TRIP_BOUNDS)
+            buckets[index] += 1
+
+    def record_sent(
+        self,
+        message: "OscBundle | OscMessage",
+        size: int,
+        message_sizes: SequenceABC[tuple[OscAddress, int]] | None = None,
+    ) -> None:
+        """
+        Record a sent message or bundle.
+
+        :param message: The message or bundle sent.
+        :param size: The size of its datagram in bytes.
+        :param message_sizes: The address and encoded size of every message in a
+            bundle, as collected while encoding it. Compiled from the bundle if
+            omitted.
+        """
+        if isinstance(message, OscBundle) and message_sizes is None:
+            compiled_sizes: list[tuple[OscAddress, int]] = []
+            _compile_bundle(message, sizes=compiled_sizes)
+            message_sizes = compiled_sizes
+        with self.lock:
+            if isinstance(message, OscBundle):
+                for message_address, message_size in message_sizes or ():
+                    if (counts := self.sent.get(message_address)) is None:
+                        self.sent[message_address] = [1, message_size]
+                    else:
+                        counts[0] += 1
+                        counts[1] += message_size
+                    size -= message_size
+                address: OscAddress = "#bundle"
+            else:
+                address = message.address
+            if (counts := self.sent.get(address)) is None:
+                self.sent[address] = [1, size]
+            else:
+                counts[0] += 1
+                counts[1] += size
+
+    def reset(self) -> None:
+        """
+        Reset all counters.
+        """
+        with self.lock:
+            self.dispatch: dict[OscAddress, list[float]] = {}
+            self.received: dict[OscAddress, list[int]] = {}
+            self.round_trips: dict[str, list[int]] = {}
+            self.sent: dict[OscAddress, list[int]] = {}
+            self.start_time = time.time()
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get a point-in-time copy of all counters.
+        """
+        with self.lock:
+            return {
+                "timestamp": time.time(),
+                "elapsed": time.time() - self.start_time,
+                "sent": {
+                    address: {"count": count, "bytes": size}
+                    for address, (count, size) in self.sent.items()
+                },
+                "received": {
+                    address: {"count": count, "bytes": size}
+                    for address, (count, size) in self.received.items()
+                },
+                "dispatch": {
+                    address: {"count": int(count), "total": total, "maximum": maximum}
+                    for address, (count, total, maximum) in self.dispatch.items()
+                },
+                "round_trips": {
+                    name: {
+                        "count": sum(buckets),
+                        "buckets": dict(zip(self.ROUND_TRIP_BOUNDS, buckets)),
+                    }
+                    for name, buckets in self.round_trips.items()
+                },
+            }
+
+    async def stream(
+        self, interval: float = 1.0
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Yield a snapshot every ``interval`` seconds.
+
+        :param interval: The time between snapshots in seconds.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            yield self.snapshot()
+
+
+class SendPacer:
+    """
+    A token-bucket send queue for an OSC protocol.
+
+    Datagrams are released no faster than ``messages_per_second`` and
+    ``bytes_per_second`` allow, soonest-due first: messages are due when sent and
+    timestamped bundles are due at their timestamp, but never before anything
+    queued ahead of them, so an overdue bundle can't overtake the ``/d_recv`` it
+    depends on. Traffic is followed by periodic
+    ``/sync`` probes, and any probe left unanswered for ``probe_timeout`` seconds
+    is counted as lost, as scsynth silently drops what overruns its receive buffer.
+
+    ::
+
+        >>> from supriya.osc import OscBundle, OscMessage, SendPacer
+        >>> pacer = SendPacer(messages_per_second=100)
+        >>> pacer.push(OscMessage("/n_free", 1000).to_datagram(), now=0.0)
+        True
+        >>> pacer.push(OscBundle(timestamp=1, contents=[]).to_datagram(), now=0.0)
+        False
+        >>> pacer.push(OscMessage("/n_free", 1001).to_datagram(), now=0.0)
+        False
+        >>> datagrams, delay = pacer.pop(now=0.0)
+        >>> [OscMessage.from_datagram(x) for x in datagrams], round(delay, 3)
+        ([OscMessage('/n_free', 1000)], 0.01)
+
+    ::
+
+        >>> datagrams, delay = pacer.pop(now=0.01)
+        >>> [OscBundle.from_datagram(x) for x in datagrams], round(delay, 3)
+        ([OscBundle(timestamp=1.0)], 0.01)
+
+    :param messages_per_second: The maximum message rate, if any.
+    :param bytes_per_second: The maximum byte rate, if any.
+    :param burst: Seconds' worth of tokens which may be spent at once.
+    :param probe_interval: Seconds between ``/sync`` probes while sending, or
+        ``None`` to disable probing.
+    :param probe_timeout: Seconds after which an unanswered probe counts as lost.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        messages_per_second: float | None = None,
+        bytes_per_second: float | None = None,
+        *,
+        burst: float = 0.01,
+        probe_interval: float | None = 1.0,
+        probe_timeout: float = 2.0,
+    ) -> None:
+        self.messages_per_second = messages_per_second
+        self.bytes_per_second = bytes_per_second
+        self.message_capacity = max(1.0, (messages_per_second or 0) * burst)
+        self.byte_capacity = max(1.0, (bytes_per_second or 0) * burst)
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.lock = threading.Lock()
+        self.message_tokens = self.message_capacity
+        self.byte_tokens = self.byte_capacity
+        self.last_refill = time.monotonic()
+        # (due, sequence, pushed at, datagram, probe id)
+        self.queue: list[tuple[float, int, float, bytes, int | None]] = []
+        self.sequence = 0
+        # The latest due time queued, while anything is.
+        self.latest_due = 0.0
+        # probe id -> [released at, token]
+        self.probes: dict[int, list] = {}
+        # Negative ids can't collide with any client's sync id range.
+        self.probe_ids = itertools.count(-1, -1)
+        self.traffic_since: float | None = None
+        self.counters = {
+            "delay": 0.0,
+            "maximum_delay": 0.0,
+            "maximum_queue_depth": 0,
+            "probes_acknowledged": 0,
+            "probes_lost": 0,
+            "probes_sent": 0,
+            "released": 0,
+        }
+
+    ### PRIVATE METHODS ###
+
+    def _refill(self, now: float) -> None:
+        elapsed, self.last_refill = max(0.0, now - self.last_refill), now
+        if self.messages_per_second:
+            self.message_tokens = min(
+                self.message_capacity,
+                self.message_tokens + elapsed * self.messages_per_second,
+            )
+        if self.bytes_per_second:
+            self.byte_tokens = min(
+                self.byte_capacity, self.byte_tokens + elapsed * self.bytes_per_second
+            )
+
+    def _wait(self, size: int) -> float:
+        wait = 0.0
+        if self.messages_per_second:
+            wait = (1.0 - self.message_tokens) / self.messages_per_second
+        if self.bytes_per_second:
+            # Datagrams larger than the bucket wait for a full bucket, then overdraw.
+            needed = min(float(size), self.byte_capacity)
+            wait = max(wait, (needed - self.byte_tokens) / self.bytes_per_second)
+        return wait
+
+    ### PUBLIC METHODS ###
+
+    def acknowledge(self, probe_id: int) -> None:
+        """
+        Acknowledge a probe's reply.
+
+        :param probe_id: The probe's sync ID.
+        """
+        with self.lock:
+            if self.probes.pop(probe_id, None) is not None:
+                self.counters["probes_acknowledged"] += 1
+
+    def drain(self) -> list[bytes]:
+        """
+        Release everything queued, regardless of tokens.
+        """
+        with self.lock:
+            datagrams = [x[3] for x in sorted(self.queue)]
+            self.queue.clear()
+            self.probes.clear()
+            return datagrams
+
+    def expire(self, now: float | None = None) -> list[Any]:
+        """
+        Expire unanswered probes, returning their tokens.
+
+        :param now: The current monotonic time.
+        """
+        now = time.monotonic() if now is None else now
+        expired: list[Any] = []
+        with self.lock:
+            for probe_id, (released_at, token) in tuple(self.probes.items()):
+                if released_at is not None and now - released_at > self.probe_timeout:
+                    del self.probes[probe_id]
+                    self.counters["probes_lost"] += 1
+                    expired.append(token)
+        return expired
+
+    def next_deadline(self, now: float | None = None) -> float | None:
+        """
+        Get the seconds until the next probe is due or may expire, if any.
+
+        :param now: The current monotonic time.
+        """
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            deadlines = [
+                released_at + self.probe_timeout - now
+                for released_at, _ in self.probes.values()
+                if released_at is not None
+            ]
+            if self.probe_interval is not None and self.traffic_since is not None:
+                deadlines.append(self.traffic_since + self.probe_interval - now)
+        return max(0.0, min(deadlines)) if deadlines else None
+
+    def pop(self, now: float | None = None) -> tuple[list[bytes], float | None]:
+        """
+        Release as many queued datagrams as tokens allow.
+
+        Returns the released datagrams and the seconds until the next could be
+        released, if any remain.
+
+        :param now: The current monotonic time.
+        """
+        now = time.monotonic() if now is None else now
+        released: list[bytes] = []
+        with self.lock:
+            self._refill(now)
+            while self.queue:
+                _, _, pushed_at, datagram, probe_id = self.queue[0]
+                if (wait := self._wait(len(datagram))) > 1e-6:
+                    return released, wait
+                heapq.heappop(self.queue)
+                self.message_tokens -= 1.0
+                self.byte_tokens -= len(datagram)
+                delay = now - pushed_at
+                self.counters["delay"] += delay
+                self.counters["maximum_delay"] = max(
+                    self.counters["maximum_delay"], delay
+                )
+                self.counters["released"] += 1
+                if probe_id is not None and probe_id in self.probes:
+                    self.probes[probe_id][0] = now
+                released.append(datagram)
+        return released, None
+
+    def push(
+        self,
+        datagram: bytes,
+        *,
+        now: float | None = None,
+        probe: tuple[int, Any] | None = None,
+    ) -> bool:
+        """
+        Queue a datagram, returning true if the queue was empty.
+
+        :param datagram: The datagram to queue.
+        :param now: The current monotonic time.
+        :param probe: The sync ID and token of a probe, if the datagram is one.
+        """
+        now = time.monotonic() if now is None else now
+        due, timestamped = now, False
+        if (
+            datagram.startswith(BUNDLE_PREFIX)
+            and (timetag := datagram[8:16]) != IMMEDIATELY
+        ):
+            # Convert the NTP timetag to the monotonic clock.
+            seconds = struct.unpack(">Q", timetag)[0] * NTP_TIMESTAMP_TO_SECONDS
+            due = now + seconds - NTP_DELTA - time.time()
+            timestamped = True
+        probe_id = None
+        with self.lock:
+            was_empty = not self.queue
+            # Messages are due in push order already; bundles wait their turn.
+            if timestamped and not was_empty:
+                due = max(due, self.latest_due)
+            self.latest_due = due if was_empty else max(due, self.latest_due)
+            if probe is not None:
+                probe_id = probe[0]
+                self.probes[probe_id] = [None, probe[1]]
+            heapq.heappush(self.queue, (due, self.sequence, now, datagram, probe_id))
+            self.sequence += 1
+            self.counters["maximum_queue_depth"] = max(
+                self.counters["maximum_queue_depth"], len(self.queue)
+            )
+            if probe is None and self.traffic_since is None:
+                self.traffic_since = now
+            return was_empty
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get a point-in-time copy of the pacer's counters.
+        """
+        with self.lock:
+            counters = dict(self.counters)
+            counters["queue_depth"] = len(self.queue)
+            counters["mean_delay"] = counters["delay"] / max(1, counters["released"])
+            counters["probes_pending"] = len(self.probes)
+            return counters
+
+    def start_probe(self, now: float | None = None) -> int | None:
+        """
+        Start a probe if one is due, returning its sync ID.
+
+        :param now: The current monotonic time.
+        """
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            if (
+                self.probe_interval is None
+                or self.traffic_since is None
+                or now - self.traffic_since < self.probe_interval
+            ):
+                return None
+            self.traffic_since = None
+            self.counters["probes_sent"] += 1
+            return next(self.probe_ids)
+
+
 class CaptureEntry(NamedTuple):
     timestamp: float
     label: Literal["R", "S"]
     message: OscBundle | OscMessage
     raw_message: SequenceABC | SupportsOsc | str | None = None
+    datagram: bytes | None = None
 
 
 class Capture:
+    """
+    A transcript of the messages an OSC protocol sends and receives.
+
+    By default every entry is kept in memory. With ``maximum_size``, entries are
+    kept in a ring buffer holding only the most recent entries whose datagrams fit
+    in that many bytes. With ``log_path``, every entry's timestamp and datagram are
+    also appended to a binary log by a background thread, for reading back with
+    :py:meth:`read_log` or re-sending with :py:meth:`replay_log`.
+
+    :param osc_protocol: The OSC protocol to capture.
+    :param maximum_size: The ring buffer's budget in datagram bytes, or ``None`` to
+        keep everything. Only the datagrams count against it: each entry also
+        holds its message objects, which typically take several times the
+        datagram's size in memory.
+    :param log_path: An optional path to append a binary log to.
+    """
+
     ### INITIALIZER ###
 
-    def __init__(self, osc_protocol: "OscProtocol") -> None:
+    def __init__(
+        self,
+        osc_protocol: "OscProtocol",
+        *,
+        maximum_size: int | None = None,
+        log_path: PathLike | str | None = None,
+    ) -> None:
         self.osc_protocol = osc_protocol
-        self.entries: list[CaptureEntry] = []
+        self.entries: list[CaptureEntry] | collections.deque[CaptureEntry] = (
+            [] if maximum_size is None else collections.deque()
+        )
+        self.log_path = Path(log_path) if log_path is not None else None
+        self.log_queue: SimpleQueue[tuple[float, str, bytes] | None] | None = None
+        self.log_thread: threading.Thread | None = None
+        self.maximum_size = maximum_size
+        self.size = 0
 
     ### SPECIAL METHODS ###
 
     def __enter__(self) -> "Capture":
+        self.entries.clear()
+        self.size = 0
+        if self.log_path is not None:
+            file_ = self.log_path.open("ab")
+            if not file_.tell():
+                file_.write(_CAPTURE_LOG_PREFIX)
+            self.log_queue = SimpleQueue()
+            self.log_thread = threading.Thread(
+                target=self._write_log, args=(file_, self.log_queue), daemon=True
+            )
+            self.log_thread.start()
         self.osc_protocol.captures.add(self)
-        self.entries[:] = []
         return self
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         self.osc_protocol.captures.remove(self)
+        if self.log_queue is not None and self.log_thread is not None:
+            self.log_queue.put(None)
+            self.log_thread.join()
+            self.log_queue = self.log_thread = None
 
     def __getitem__(self, i: int | slice) -> CaptureEntry | list[CaptureEntry]:
+        if isinstance(self.entries, list):
+            return self.entries[i]
+        elif isinstance(i, slice):
+            return list(self.entries)[i]
         return self.entries[i]
 
     def __iter__(self) -> Iterator[CaptureEntry]:
@@ -643,6 +1789,20 @@ class Capture:
     def __len__(self) -> int:
         return len(self.entries)
 
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _write_log(
+        file_: BinaryIO, log_queue: "SimpleQueue[tuple[float, str, bytes] | None]"
+    ) -> None:
+        with file_:
+            while (record := log_queue.get()) is not None:
+                timestamp, label, datagram = record
+                file_.write(
+                    _CAPTURE_LOG_RECORD.pack(timestamp, label.encode(), len(datagram))
+                )
+                file_.write(datagram)
+
     ### PUBLIC METHODS ###
 
     def add_entry(
@@ -651,15 +1811,30 @@ class Capture:
         label: Literal["R", "S"],
         message: OscBundle | OscMessage,
         raw_message: SequenceABC | SupportsOsc | str | None = None,
+        datagram: bytes | None = None,
     ) -> None:
+        if datagram is None and (
+            self.maximum_size is not None or self.log_queue is not None
+        ):
+            datagram = message.to_datagram()
+        if self.log_queue is not None:
+            self.log_queue.put((timestamp, label, cast(bytes, datagram)))
         self.entries.append(
             CaptureEntry(
                 timestamp=timestamp,
                 label=label,
                 message=message,
                 raw_message=raw_message,
+                datagram=datagram,
             )
         )
+        if self.maximum_size is None:
+            return
+        self.size += len(cast(bytes, datagram))
+        while self.size > self.maximum_size and self.entries:
+            self.size -= len(
+                cast(bytes, cast(collections.deque, self.entries).popleft().datagram)
+            )
 
     def filtered(
         self, sent: bool = True, received: bool = True, status: bool = False
@@ -679,6 +1854,78 @@ class Capture:
             entries.append(entry)
         return entries
 
+    @staticmethod
+    def read_log(path: PathLike | str) -> Iterator[CaptureEntry]:
+        """
+        Read back the entries of a binary capture log.
+
+        :param path: The log's path.
+        """
+        with open(path, "rb") as file_:
+            if file_.read(len(_CAPTURE_LOG_PREFIX)) != _CAPTURE_LOG_PREFIX:
+                raise ValueError(f"{path} is not a capture log")
+            # Read one record at a time, so long logs never load whole.
+            while header := file_.read(_CAPTURE_LOG_RECORD.size):
+                if len(header) < _CAPTURE_LOG_RECORD.size:
+                    raise ValueError(f"{path} is truncated")
+                timestamp, label, size = _CAPTURE_LOG_RECORD.unpack(header)
+                if len(datagram := file_.read(size)) < size:
+                    raise ValueError(f"{path} is truncated")
+                message: OscBundle | OscMessage
+                if datagram.startswith(BUNDLE_PREFIX):
+                    message = OscBundle.from_datagram(datagram)
+                else:
+                    message = LazyOscMessage.from_datagram(datagram)
+                yield CaptureEntry(
+                    timestamp=timestamp,
+                    label=cast(Literal["R", "S"], label.decode()),
+                    message=message,
+                    datagram=datagram,
+                )
+
+    @classmethod
+    def replay_log(
+        cls,
+        path: PathLike | str,
+        osc_protocol: "OscProtocol",
+        *,
+        speed: float | None = 1.0,
+    ) -> int:
+        """
+        Re-send the sent entries of a binary capture log.
+
+        Entries are re-sent with their original spacing divided by ``speed``, and
+        bundle timestamps are shifted (and scaled) to match. Returns the number of
+        entries sent.
+
+        :param path: The log's path.
+        :param osc_protocol: The OSC protocol to send with.
+        :param speed: The playback speed, or ``None`` to send as fast as possible.
+        """
+
+        def retime(message: OscBundle | OscMessage) -> OscBundle | OscMessage:
+            if not isinstance(message, OscBundle):
+                return message
+            timestamp = message.timestamp
+            if timestamp is not None:
+                timestamp = start + (timestamp - origin) / (speed or 1.0)
+            return OscBundle(
+                timestamp=timestamp, contents=[retime(x) for x in message.contents]
+            )
+
+        count, origin, start = 0, 0.0, time.time()
+        for entry in cls.read_log(path):
+            if entry.label != "S":
+                continue
+            if not count:
+                origin = entry.timestamp
+            if speed and (delay := (entry.timestamp - origin) / speed) > 0:
+                if (remaining := start + delay - time.time()) > 0:
+                    time.sleep(remaining)
+            osc_protocol.send(retime(entry.message))
+            count += 1
+        return count
+
 
 class OscProtocol:
     ### INITIALIZER ###
@@ -693,12 +1940,22 @@ class OscProtocol:
     ) -> None:
         self.callbacks: dict[Any, Any] = {}
         self.captures: set[Capture] = set()
+        # address pattern -> callbacks, shaped like self.callbacks
+        self.pattern_callbacks: dict[str, Any] = {}
+        self.pattern_trie = AddressPatternTrie()
+        # address -> pattern length -> pattern -> FIFO of pending callbacks
+        self.pending_callbacks: dict[
+            Any, dict[int, dict[tuple, collections.deque[OscCallback]]]
+        ] = {}
         self.healthcheck: HealthCheck | None = None
         self.healthcheck_osc_callback: OscCallback | None = None
+        self.metrics: OscMetrics | None = None
+        self.pacer: SendPacer | None = None
         self.attempts = 0
         self.ip_address = "127.0.0.1"
         self.name = name
         self.port = 57551
+        self.protocol = "udp"
         self.on_connect_callback = on_connect_callback
         self.on_disconnect_callback = on_disconnect_callback
         self.on_panic_callback = on_panic_callback
@@ -721,8 +1978,18 @@ class OscProtocol:
         patterns = [callback.pattern]
         if callback.failure_pattern:
             patterns.append(callback.failure_pattern)
+        if callback.pending:
+            for address, *rest in patterns:
+                self.pending_callbacks.setdefault(address, {}).setdefault(
+                    len(rest), {}
+                ).setdefault(tuple(rest), collections.deque()).append(callback)
+            return
         for pattern in patterns:
             callback_map = self.callbacks
+            if is_address_pattern(pattern[0]):
+                callback_map = self.pattern_callbacks
+                if pattern[0] not in callback_map:
+                    self.pattern_trie.add(cast(str, pattern[0]))
             for item in pattern:
                 callbacks, callback_map = callback_map.setdefault(item, ([], {}))
             callbacks.append(callback)
@@ -741,20 +2008,44 @@ class OscProtocol:
         self.status = BootStatus.QUITTING
         if self.healthcheck_osc_callback is not None:
             self.unregister(self.healthcheck_osc_callback)
+        if self.pacer is not None:
+            # Don't strand queued messages on a clean exit.
+            for datagram in self.pacer.drain():
+                if not panicked:
+                    self._transmit(datagram)
         return None
 
     def _match_callbacks(self, message) -> list[OscCallback]:
-        items = (message.address,) + message.contents
-        matching_callbacks = []
-        callback_map = self.callbacks
-        for item in items:
-            if item not in callback_map:
-                break
-            callbacks, callback_map = callback_map[item]
+        # Match the address first, so unwanted messages are never fully decoded
+        matching_callbacks: list[OscCallback] = []
+        entries = []
+        if message.address in self.callbacks:
+            entries.append(self.callbacks[message.address])
+        if self.pattern_callbacks and isinstance(message.address, str):
+            for pattern in self.pattern_trie.match(message.address):
+                entries.append(self.pattern_callbacks[pattern])
+        for callbacks, callback_map in entries:
             matching_callbacks.extend(callbacks)
+            if callback_map:
+                for item in message.contents:
+                    if item not in callback_map:
+                        break
+                    callbacks, callback_map = callback_map[item]
+                    matching_callbacks.extend(callbacks)
         for callback in matching_callbacks:
             if callback.once:
                 self.unregister(callback)
+        if message.address in self.pending_callbacks:
+            # Only the oldest pending callback per pattern claims each reply, and
+            # it's removed immediately so the next reply goes to the next in line.
+            for length, pending_callbacks in tuple(
+                self.pending_callbacks[message.address].items()
+            ):
+                key = tuple(message.contents[:length]) if length else ()
+                if key in pending_callbacks:
+                    callback = pending_callbacks[key][0]
+                    self._remove_callback(callback)
+                    matching_callbacks.append(callback)
         return matching_callbacks
 
     def _on_connect(self, *, boot_future: FutureLike[bool]) -> Awaitable[None] | None:
@@ -808,8 +2099,31 @@ class OscProtocol:
         patterns = [callback.pattern]
         if callback.failure_pattern:
             patterns.append(callback.failure_pattern)
+        if callback.pending:
+            for address, *rest in patterns:
+                by_length = self.pending_callbacks.get(address, {})
+                by_pattern = by_length.get(len(rest), {})
+                queue = by_pattern.get(tuple(rest))
+                if queue is None or callback not in queue:
+                    continue
+                queue.remove(callback)
+                if not queue:
+                    del by_pattern[tuple(rest)]
+                if not by_pattern:
+                    del by_length[len(rest)]
+                if not by_length:
+                    del self.pending_callbacks[address]
+            return
         for pattern in patterns:
-            delete(list(pattern), self.callbacks)
+            if not is_address_pattern(pattern[0]):
+                delete(list(pattern), self.callbacks)
+                continue
+            delete(list(pattern), self.pattern_callbacks)
+            if pattern[0] not in self.pattern_callbacks:
+                self.pattern_trie.remove(cast(str, pattern[0]))
+
+    def _pace(self, datagram: bytes) -> None:
+        raise NotImplementedError
 
     def _register(
         self,
@@ -820,6 +2134,7 @@ class OscProtocol:
         once: bool = False,
         args: tuple | None = None,
         kwargs: dict | None = None,
+        pending: bool = False,
     ) -> OscCallback:
         if isinstance(pattern, (str, int, float)):
             pattern = [pattern]
@@ -836,9 +2151,10 @@ class OscProtocol:
             pattern=tuple(pattern),
             failure_pattern=failure_pattern,
             procedure=procedure,
-            once=bool(once),
+            once=bool(once) or bool(pending),
             args=args,
             kwargs=kwargs,
+            pending=bool(pending),
         )
 
     def _send(self, raw_message: SequenceABC | SupportsOsc | str) -> bytes:
@@ -856,25 +2172,74 @@ class OscProtocol:
         osc_out_logger.debug(
             f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] {message!r}"
         )
+        if self.metrics is not None and isinstance(message, OscBundle):
+            # Collect each bundled message's size during the one encode
+            message_sizes: list[tuple[OscAddress, int]] = []
+            datagram = _encode(*_compile_bundle(message, sizes=message_sizes))
+            self.metrics.record_sent(message, len(datagram), message_sizes)
+        else:
+            datagram = message.to_datagram()
+            if self.metrics is not None:
+                self.metrics.record_sent(message, len(datagram))
         for capture in self.captures:
             capture.add_entry(
                 timestamp=time.time(),
                 label="S",
                 message=message,
                 raw_message=raw_message,
+                datagram=datagram,
             )
-        datagram = message.to_datagram()
         udp_out_logger.debug(
             f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] {datagram!r}"
         )
         return datagram
 
+    def _transmit(self, datagram: bytes) -> None:
+        raise NotImplementedError
+
+    def _service_pacer(self) -> float | None:
+        """
+        Probe, release and expire as the pacer requires.
+
+        Returns the seconds until the pacer next needs servicing, if ever.
+        """
+        if (pacer := self.pacer) is None:
+            return None
+        if (probe_id := pacer.start_probe()) is not None:
+            callback = self.register(
+                pattern=["/synced", probe_id],
+                procedure=lambda _: pacer.acknowledge(probe_id),
+                pending=True,
+            )
+            pacer.push(
+                self._send(OscMessage("/sync", probe_id)), probe=(probe_id, callback)
+            )
+        datagrams, delay = pacer.pop()
+        for datagram in datagrams:
+            self._transmit(datagram)
+        for callback in pacer.expire():
+            osc_protocol_logger.warning(
+                f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
+                f"probe {callback.pattern[1]} unanswered, messages may have been lost"
+            )
+            self.unregister(callback)
+        if (deadline := pacer.next_deadline()) is not None:
+            delay = deadline if delay is None else min(delay, deadline)
+        return delay
+
     def _setup(
-        self, ip_address: str, port: int, healthcheck: HealthCheck | None
+        self,
+        ip_address: str,
+        port: int,
+        healthcheck: HealthCheck | None,
+        protocol: str = "udp",
     ) -> None:
+        if protocol not in ("tcp", "udp"):
+            raise ValueError(protocol)
         self.status = BootStatus.BOOTING
         self.ip_address = ip_address
         self.port = port
+        self.protocol = protocol
         self.healthcheck = healthcheck
         if self.healthcheck:
             self.healthcheck_osc_callback = self.register(
@@ -882,21 +2247,41 @@ class OscProtocol:
                 procedure=self._on_healthcheck_passed,
             )
 
+    def _log_callback_error(self, callback: OscCallback, message: OscMessage) -> None:
+        osc_protocol_logger.exception(
+            f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
+            f"callback {callback.procedure!r} failed handling {message!r}"
+        )
+
+    def _log_datagram_error(self, datagram: bytes) -> None:
+        osc_protocol_logger.exception(
+            f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
+            f"failed handling datagram {datagram!r}"
+        )
+
     def _validate_receive(
         self, datagram
     ) -> Generator[tuple[OscCallback, OscMessage], None, None]:
-        udp_in_logger.debug(
-            f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] {datagram}"
-        )
-        try:
-            message = OscMessage.from_datagram(datagram)
-        except Exception:
-            raise
-        osc_in_logger.debug(
-            f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] {message!r}"
-        )
+        if udp_in_logger.isEnabledFor(logging.DEBUG):
+            udp_in_logger.debug(
+                f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
+                f"{datagram}"
+            )
+        message = LazyOscMessage.from_datagram(datagram)
+        if self.metrics is not None:
+            self.metrics.record_received(message.address, len(datagram))
+        if osc_in_logger.isEnabledFor(logging.DEBUG):
+            osc_in_logger.debug(
+                f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
+                f"{message!r}"
+            )
         for capture in self.captures:
-            capture.add_entry(timestamp=time.time(), label="R", message=message)
+            capture.add_entry(
+                timestamp=time.time(),
+                label="R",
+                message=message,
+                datagram=message.to_datagram(),
+            )
         for callback in self._match_callbacks(message):
             yield callback, message
 
@@ -905,8 +2290,65 @@ class OscProtocol:
     def activate_healthcheck(self) -> None:
         raise NotImplementedError
 
-    def capture(self) -> "Capture":
-        return Capture(self)
+    def enable_metrics(self, enabled: bool = True) -> "OscMetrics | None":
+        """
+        Start (or stop) collecting per-address traffic metrics.
+
+        Returns the metrics being collected, if any.
+
+        :param enabled: Whether to collect metrics.
+        """
+        if not enabled:
+            self.metrics = None
+        elif self.metrics is None:
+            self.metrics = OscMetrics()
+        return self.metrics
+
+    def enable_pacing(
+        self,
+        messages_per_second: float | None = None,
+        bytes_per_second: float | None = None,
+        *,
+        burst: float = 0.01,
+        probe_interval: float | None = 1.0,
+        probe_timeout: float = 2.0,
+    ) -> "SendPacer | None":
+        """
+        Start (or stop) pacing sent messages through a token bucket.
+
+        Pacing stops, releasing anything still queued, if neither rate is given.
+        Returns the pacer in use, if any, whose snapshot reports queue depth,
+        pacing delay and probe losses.
+
+        :param messages_per_second: The maximum message rate, if any.
+        :param bytes_per_second: The maximum byte rate, if any.
+        :param burst: Seconds' worth of tokens which may be spent at once.
+        :param probe_interval: Seconds between ``/sync`` probes while sending, or
+            ``None`` to disable probing.
+        :param probe_timeout: Seconds after which an unanswered probe counts as
+            lost.
+        """
+        if (pacer := self.pacer) is not None:
+            self.pacer = None
+            for datagram in pacer.drain():
+                self._transmit(datagram)
+        if messages_per_second is not None or bytes_per_second is not None:
+            self.pacer = SendPacer(
+                messages_per_second,
+                bytes_per_second,
+                burst=burst,
+                probe_interval=probe_interval,
+                probe_timeout=probe_timeout,
+            )
+        return self.pacer
+
+    def capture(
+        self,
+        *,
+        maximum_size: int | None = None,
+        log_path: PathLike | str | None = None,
+    ) -> "Capture":
+        return Capture(self, maximum_size=maximum_size, log_path=log_path)
 
     def disconnect(self) -> Awaitable[None] | None:
         raise NotImplementedError
@@ -920,6 +2362,7 @@ class OscProtocol:
         once: bool = False,
         args: tuple | None = None,
         kwargs: dict | None = None,
+        pending: bool = False,
     ) -> OscCallback:
         raise NotImplementedError
 
@@ -931,27 +2374,6 @@ class OscProtocol:
 
 
 class ThreadedOscProtocol(OscProtocol):
-    class Server(socketserver.UDPServer):
-        osc_protocol: "ThreadedOscProtocol"
-
-        def verify_request(self, request, client_address) -> bool:
-            self.osc_protocol._process_command_queue()
-            return True
-
-        def service_actions(self) -> None:
-            if cast(HealthCheck, self.osc_protocol.healthcheck).active:
-                self.osc_protocol._run_healthcheck()
-
-    class Handler(socketserver.BaseRequestHandler):
-        def handle(self) -> None:
-            data = self.request[0]
-            for callback, message in cast(
-                ThreadedOscProtocol.Server, self.server
-            ).osc_protocol._validate_receive(data):
-                callback.procedure(
-                    message, *(callback.args or ()), **(callback.kwargs or {})
-                )
-
     ### INITIALIZER ###
 
     def __init__(
@@ -970,23 +2392,26 @@ class ThreadedOscProtocol(OscProtocol):
             on_panic_callback=on_panic_callback,
         )
         self.boot_future: concurrent.futures.Future[bool] = concurrent.futures.Future()
+        self.buffer = bytearray()
         self.exit_future: concurrent.futures.Future[bool] = concurrent.futures.Future()
-        self.command_queue: Queue[tuple[Literal["add", "remove"], OscCallback]] = (
-            Queue()
-        )
+        self.command_queue: collections.deque[
+            tuple[Literal["add", "remove"], OscCallback]
+        ] = collections.deque()
         self.healthcheck_deadline = 0.0
         self.lock = threading.RLock()
+        self.osc_socket: socket.socket | None = None
+        self.osc_thread: threading.Thread | None = None
+        self.shutdown_requested = False
+        self.wakeup_sockets: tuple[socket.socket, socket.socket] | None = None
 
     ### PRIVATE METHODS ###
 
     def _disconnect(self, panicked: bool = False) -> None:
         super()._disconnect(panicked=panicked)
-        if not self.osc_server._BaseServer__shutdown_request:  # type: ignore
-            # We set the shutdown request flag rather than call .shutdown()
-            # because this is often being called from _inside_ the server
-            # thread.
-            # N.B. Can't figure out how to make Mypy play nice with this.
-            self.osc_server._BaseServer__shutdown_request = True  # type: ignore
+        # Flag the loop rather than join it, because this is often being called
+        # from _inside_ the loop's thread.
+        self.shutdown_requested = True
+        self._wakeup()
         self._on_disconnect(
             boot_future=self.boot_future,
             exit_future=self.exit_future,
@@ -1021,16 +2446,63 @@ class ThreadedOscProtocol(OscProtocol):
             self._on_connect(boot_future=self.boot_future)
 
     def _process_command_queue(self) -> None:
-        while self.command_queue.qsize():
-            try:
-                action, callback = self.command_queue.get()
-            except Empty:
-                continue
+        while self.command_queue:
+            action, callback = self.command_queue.popleft()
             if action == "add":
                 self._add_callback(callback)
             elif action == "remove":
                 self._remove_callback(callback)
 
+    def _receive(self, osc_socket: socket.socket, buffer: bytearray) -> bool:
+        """
+        Drain every datagram (or stream frame) currently readable from the socket.
+
+        Returns false if the connection was closed.
+        """
+        view = memoryview(buffer)
+        while True:
+            try:
+                size = osc_socket.recv_into(buffer, 0, _MSG_DONTWAIT)
+            except (BlockingIOError, InterruptedError):
+                return True
+            except OSError:
+                if self.protocol == "tcp":
+                    return False
+                # e.g. ICMP port unreachable, surfaced on the next read
+                return True
+            if self.protocol == "tcp":
+                if not size:
+                    return False
+                self.buffer.extend(view[:size])
+                datagrams = _split_frames(self.buffer)
+            else:
+                datagrams = [bytes(view[:size])]
+            for datagram in datagrams:
+                # Registrations made by earlier callbacks apply to later replies.
+                self._process_command_queue()
+                start, message = time.perf_counter(), None
+                try:
+                    for callback, message in self._validate_receive(datagram):
+                        try:
+                            callback.procedure(
+                                message,
+                                *(callback.args or ()),
+                                **(callback.kwargs or {}),
+                            )
+                        except Exception:
+                            self._log_callback_error(callback, message)
+                except Exception:
+                    # A malformed datagram must not take the receive thread down.
+                    self._log_datagram_error(datagram)
+                    continue
+                if self.metrics is not None and message is not None:
+                    self.metrics.record_dispatch(
+                        message.address, time.perf_counter() - start
+                    )
+            if not _MSG_DONTWAIT:
+                # Without non-blocking reads, only the first read is safe.
+                return True
+
     def _run_healthcheck(self) -> None:
         if self.healthcheck is None:
             return
@@ -1057,22 +2529,86 @@ class ThreadedOscProtocol(OscProtocol):
             return
         self._disconnect(panicked=True)
 
-    def _server_factory(self, ip_address, port) -> "Server":
-        server = self.Server(
-            (self.ip_address, self.port), self.Handler, bind_and_activate=False
-        )
-        server.osc_protocol = self
-        return server
+    def _serve(
+        self,
+        osc_socket: socket.socket,
+        wakeup_sockets: tuple[socket.socket, socket.socket],
+    ) -> None:
+        buffer = bytearray(65536)
+        selector = selectors.DefaultSelector()
+        selector.register(osc_socket, selectors.EVENT_READ)
+        selector.register(wakeup_sockets[0], selectors.EVENT_READ)
+        try:
+            # A quick reconnect replaces the socket before this loop sees the flag.
+            while not self.shutdown_requested and self.osc_socket is osc_socket:
+                timeout = None
+                if (healthcheck := self.healthcheck) and healthcheck.active:
+                    self._run_healthcheck()
+                    timeout = max(0.0, self.healthcheck_deadline - time.time())
+                if (delay := self._service_pacer()) is not None:
+                    timeout = delay if timeout is None else min(timeout, delay)
+                ready = selector.select(timeout)
+                # Apply (un)registrations before handling any replies to them.
+                self._process_command_queue()
+                for key, _ in ready:
+                    if key.fileobj is wakeup_sockets[0]:
+                        with contextlib.suppress(BlockingIOError, InterruptedError):
+                            while wakeup_sockets[0].recv(4096):
+                                pass
+                    elif not self._receive(osc_socket, buffer):
+                        if self.status in (BootStatus.BOOTING, BootStatus.ONLINE):
+                            self._disconnect(panicked=True)
+                        return
+        finally:
+            selector.close()
+            osc_socket.close()
+            for wakeup_socket in wakeup_sockets:
+                wakeup_socket.close()
+
+    def _pace(self, datagram: bytes) -> None:
+        if cast(SendPacer, self.pacer).push(datagram):
+            # A busy loop is already waiting on the queue's next release.
+            self._wakeup()
+
+    def _transmit(self, datagram: bytes) -> None:
+        osc_socket = cast(socket.socket, self.osc_socket)
+        if self.protocol == "tcp":
+            # Frames must not interleave when several threads send at once.
+            with self.lock:
+                osc_socket.sendall(_frame_datagram(datagram))
+        else:
+            osc_socket.sendto(datagram, (self.ip_address, self.port))
+
+    def _wakeup(self) -> None:
+        if self.wakeup_sockets is None:
+            return
+        # A full buffer (or a closed socket) means the loop is already awake.
+        with contextlib.suppress(OSError):
+            self.wakeup_sockets[1].send(b"\x00")
 
     ### PUBLIC METHODS ###
 
     def activate_healthcheck(self) -> None:
         if self._activate_healthcheck():
             cast(HealthCheck, self.healthcheck).active = True
+            self._wakeup()
 
     def connect(
-        self, ip_address: str, port: int, *, healthcheck: HealthCheck | None = None
+        self,
+        ip_address: str,
+        port: int,
+        *,
+        healthcheck: HealthCheck | None = None,
+        protocol: str = "udp",
     ) -> None:
+        """
+        Connect to a server.
+
+        :param ip_address: The server's IP address.
+        :param port: The server's port.
+        :param healthcheck: An optional healthcheck to run while connected.
+        :param protocol: The transport, either ``"udp"`` or ``"tcp"``.
+        """
         if self.status != BootStatus.OFFLINE:
             osc_protocol_logger.info(
                 f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
@@ -1083,14 +2619,30 @@ class ThreadedOscProtocol(OscProtocol):
             f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
             "connecting ..."
         )
-        self._setup(ip_address, port, healthcheck)
+        self._setup(ip_address, port, healthcheck, protocol)
         self.healthcheck_deadline = time.time()
         self.boot_future = concurrent.futures.Future()
         self.exit_future = concurrent.futures.Future()
-        self.osc_server = self._server_factory(ip_address, port)
-        self.osc_server_thread = threading.Thread(target=self.osc_server.serve_forever)
-        self.osc_server_thread.daemon = True
-        self.osc_server_thread.start()
+        self.buffer.clear()
+        self.shutdown_requested = False
+        if self.protocol == "tcp":
+            try:
+                osc_socket = socket.create_connection((ip_address, port))
+            except OSError:
+                self.status = BootStatus.OFFLINE
+                raise
+            osc_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            osc_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.osc_socket = osc_socket
+        self.wakeup_sockets = socket.socketpair()
+        for wakeup_socket in self.wakeup_sockets:
+            wakeup_socket.setblocking(False)
+        self.osc_thread = threading.Thread(
+            target=self._serve, args=(self.osc_socket, self.wakeup_sockets)
+        )
+        self.osc_thread.daemon = True
+        self.osc_thread.start()
         if not self.healthcheck:
             self._on_connect(boot_future=self.boot_future)
 
@@ -1112,12 +2664,19 @@ class ThreadedOscProtocol(OscProtocol):
         once: bool = False,
         args: tuple | None = None,
         kwargs: dict | None = None,
+        pending: bool = False,
     ) -> OscCallback:
         """
         Register a callback.
+
+        The pattern's address may be an OSC address pattern, e.g. ``/n_*`` or
+        ``/b_{set,setn}``, while any items after it still match exactly.
+
+        Pending callbacks are queued behind any others with the same pattern, and
+        each matching message is claimed by the oldest of them, exactly once.
         """
         # Command queue prevents lock contention.
-        self.command_queue.put(
+        self.command_queue.append(
             (
                 "add",
                 callback := self._register(
@@ -1127,30 +2686,30 @@ class ThreadedOscProtocol(OscProtocol):
                     once=once,
                     args=args,
                     kwargs=kwargs,
+                    pending=pending,
                 ),
             )
         )
+        self._wakeup()
         return callback
 
     def send(self, message: SequenceABC | SupportsOsc | str) -> None:
-        try:
-            self.osc_server.socket.sendto(
-                self._send(message),
-                (self.ip_address, self.port),
-            )
-        except OSError:
-            # print(message)
-            raise
+        datagram = self._send(message)
+        if self.pacer is not None:
+            self._pace(datagram)
+        else:
+            self._transmit(datagram)
 
     def unregister(self, callback: OscCallback) -> None:
         """
         Unregister a callback.
         """
         # Command queue prevents lock contention.
-        self.command_queue.put(("remove", callback))
+        self.command_queue.append(("remove", callback))
+        self._wakeup()
 
 
-class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
+class AsyncOscProtocol(asyncio.DatagramProtocol, asyncio.Protocol, OscProtocol):
     ### INITIALIZER ###
 
     def __init__(
@@ -1172,11 +2731,28 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         self.boot_future: asyncio.Future[bool] = asyncio.Future()
         self.exit_future: asyncio.Future[bool] = asyncio.Future()
         self.background_tasks: set[asyncio.Task] = set()
+        self.buffer = bytearray()
+        self.coalesce_counters = {"datagrams": 0, "flushes": 0, "messages": 0}
+        self.coalesce_maximum: int | None = None
+        self.coalesce_window: float | None = None
+        self.flush_handle: asyncio.Handle | None = None
         self.healthcheck_task: asyncio.Task | None = None
+        self.maximum_datagram_size = 8192
+        self.pacer_handle: asyncio.Handle | None = None
+        self.pending_datagrams: list[bytes] = []
 
     ### PRIVATE METHODS ###
 
     async def _disconnect(self, panicked: bool = False) -> None:
+        if not panicked:
+            self.flush()
+        elif self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        self.pending_datagrams.clear()
+        if self.pacer_handle is not None:
+            self.pacer_handle.cancel()
+            self.pacer_handle = None
         super()._disconnect(panicked=panicked)
         self.transport.close()
         if self.healthcheck_task:
@@ -1214,6 +2790,20 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         if self.status == BootStatus.BOOTING:
             await self._on_connect(boot_future=self.boot_future)
 
+    def _pace(self, datagram: bytes) -> None:
+        if cast(SendPacer, self.pacer).push(datagram):
+            # Don't leave the first datagram behind a timer set for a later probe.
+            if self.pacer_handle is not None:
+                self.pacer_handle.cancel()
+            self.pacer_handle = asyncio.get_running_loop().call_soon(self._run_pacer)
+
+    def _run_pacer(self) -> None:
+        self.pacer_handle = None
+        if (delay := self._service_pacer()) is not None:
+            self.pacer_handle = asyncio.get_running_loop().call_later(
+                delay, self._run_pacer
+            )
+
     async def _run_healthcheck(self) -> None:
         if self.healthcheck is None:
             return
@@ -1246,17 +2836,45 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
             f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
             "connection lost!"
         )
+        # Only TCP connections can be lost out from under us.
+        if self.status in (BootStatus.BOOTING, BootStatus.ONLINE):
+            loop = asyncio.get_running_loop()
+            self.background_tasks.add(
+                task := loop.create_task(self._disconnect(panicked=True))
+            )
+            task.add_done_callback(self.background_tasks.discard)
+
+    def data_received(self, data) -> None:
+        self.buffer.extend(data)
+        for frame in _split_frames(self.buffer):
+            self.datagram_received(frame, (self.ip_address, self.port))
 
     def datagram_received(self, data, addr) -> None:
         loop = asyncio.get_running_loop()
-        for callback, message in self._validate_receive(data):
-            if asyncio.iscoroutine(
-                result := callback.procedure(
-                    message, *(callback.args or ()), **(callback.kwargs or {})
-                )
-            ):
-                self.background_tasks.add(task := loop.create_task(result))
-                task.add_done_callback(self.background_tasks.discard)
+        start, message = time.perf_counter(), None
+        try:
+            for callback, message in self._validate_receive(data):
+                try:
+                    result = callback.procedure(
+                        message, *(callback.args or ()), **(callback.kwargs or {})
+                    )
+                except Exception:
+                    self._log_callback_error(callback, message)
+                    continue
+                if asyncio.iscoroutine(result):
+                    self.background_tasks.add(task := loop.create_task(result))
+                    task.add_done_callback(self.background_tasks.discard)
+        except Exception:
+            self._log_datagram_error(data)
+            return
+        if self.metrics is not None and message is not None:
+            self.metrics.record_dispatch(message.address, time.perf_counter() - start)
+
+    def _transmit(self, datagram: bytes) -> None:
+        if self.protocol == "tcp":
+            self.transport.write(_frame_datagram(datagram))
+        else:
+            self.transport.sendto(datagram)
 
     def error_received(self, exc) -> None:
         osc_out_logger.warning(
@@ -1273,8 +2891,21 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
             )
 
     async def connect(
-        self, ip_address: str, port: int, *, healthcheck: HealthCheck | None = None
+        self,
+        ip_address: str,
+        port: int,
+        *,
+        healthcheck: HealthCheck | None = None,
+        protocol: str = "udp",
     ):
+        """
+        Connect to a server.
+
+        :param ip_address: The server's IP address.
+        :param port: The server's port.
+        :param healthcheck: An optional healthcheck to run while connected.
+        :param protocol: The transport, either ``"udp"`` or ``"tcp"``.
+        """
         if self.status != BootStatus.OFFLINE:
             osc_protocol_logger.info(
                 f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
@@ -1285,13 +2916,21 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
             f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
             "connecting ..."
         )
-        self._setup(ip_address, port, healthcheck)
+        self._setup(ip_address, port, healthcheck, protocol)
         loop = asyncio.get_running_loop()
         self.boot_future = loop.create_future()
         self.exit_future = loop.create_future()
-        _, protocol = await loop.create_datagram_endpoint(
-            lambda: self, remote_addr=(ip_address, port)
-        )
+        try:
+            if self.protocol == "tcp":
+                self.buffer.clear()
+                await loop.create_connection(lambda: self, ip_address, port)
+            else:
+                await loop.create_datagram_endpoint(
+                    lambda: self, remote_addr=(ip_address, port)
+                )
+        except OSError:
+            self.status = BootStatus.OFFLINE
+            raise
         if self.healthcheck and self.healthcheck.active:
             self.healthcheck_task = loop.create_task(self._run_healthcheck())
         elif not self.healthcheck:
@@ -1306,6 +2945,54 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
             return
         await self._disconnect()
 
+    def enable_coalescing(
+        self, window: float | None = 0.0, *, maximum: int | None = None
+    ) -> None:
+        """
+        Enable or disable send-side coalescing.
+
+        While coalescing, sent messages are held until the end of the current event
+        loop iteration, or until ``window`` seconds have passed, then consecutive
+        messages sharing a timestamp are packed into bundles and flushed together.
+
+        :param window: Seconds to hold messages for, ``0.0`` to hold them until the
+            loop's next iteration, or ``None`` to disable coalescing.
+        :param maximum: The maximum size in bytes of each coalesced datagram, or
+            ``None`` to use :attr:`maximum_datagram_size`. Never exceeds
+            :attr:`maximum_datagram_size`, which a server sets to its own datagram
+            limit when it connects.
+        """
+        if window is None:
+            self.flush()
+        self.coalesce_window = window
+        self.coalesce_maximum = maximum
+
+    def flush(self) -> None:
+        """
+        Send any messages held for coalescing.
+        """
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if not self.pending_datagrams:
+            return
+        maximum = self.maximum_datagram_size
+        if self.coalesce_maximum is not None:
+            maximum = min(maximum, self.coalesce_maximum)
+        datagrams = _coalesce_datagrams(self.pending_datagrams, maximum)
+        self.coalesce_counters["messages"] += len(self.pending_datagrams)
+        self.coalesce_counters["datagrams"] += len(datagrams)
+        self.coalesce_counters["flushes"] += 1
+        self.pending_datagrams.clear()
+        if self.pacer is not None:
+            for datagram in datagrams:
+                self._pace(datagram)
+        elif self.protocol == "tcp":
+            self.transport.write(b"".join(_frame_datagram(x) for x in datagrams))
+        else:
+            for datagram in datagrams:
+                self.transport.sendto(datagram)
+
     def register(
         self,
         pattern: Sequence[float | str],
@@ -1315,9 +3002,16 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         once: bool = False,
         args: tuple | None = None,
         kwargs: dict | None = None,
+        pending: bool = False,
     ) -> OscCallback:
         """
         Register a callback.
+
+        The pattern's address may be an OSC address pattern, e.g. ``/n_*`` or
+        ``/b_{set,setn}``, while any items after it still match exactly.
+
+        Pending callbacks are queued behind any others with the same pattern, and
+        each matching message is claimed by the oldest of them, exactly once.
         """
         self._add_callback(
             callback := self._register(
@@ -1327,12 +3021,26 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
                 once=once,
                 args=args,
                 kwargs=kwargs,
+                pending=pending,
             )
         )
         return callback
 
     def send(self, message: SequenceABC | SupportsOsc | str) -> None:
-        self.transport.sendto(self._send(message))
+        if self.coalesce_window is not None:
+            self.pending_datagrams.append(self._send(message))
+            if self.flush_handle is None:
+                loop = asyncio.get_running_loop()
+                if self.coalesce_window:
+                    self.flush_handle = loop.call_later(
+                        self.coalesce_window, self.flush
+                    )
+                else:
+                    self.flush_handle = loop.call_soon(self.flush)
+        elif self.pacer is not None:
+            self._pace(self._send(message))
+        else:
+            self._transmit(self._send(message))
 
     def unregister(self, callback: OscCallback) -> None:
         self._remove_callback(callback)
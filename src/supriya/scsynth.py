@@ -1,6 +1,8 @@
 import asyncio
 import atexit
+import collections
 import concurrent.futures
+import dataclasses
 import enum
 import logging
 import os
@@ -614,6 +616,255 @@ class AsyncProcessProtocol(asyncio.SubprocessProtocol, ProcessProtocol):
         )
 
 
+class ProcessPool:
+    """
+    A pool of warm standby scsynth processes.
+
+    Each process boots on its own free port, using the pool's options otherwise.
+    Acquiring a process hands over a booted one and boots its replacement in the
+    background, so servers booting from the pool skip waiting for scsynth to start.
+
+    :param size: The number of standby processes to keep booted.
+    :param options: The options to boot each process with.
+    :param kwargs: Keyword arguments for options.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, size: int = 1, options: Options | None = None, **kwargs):
+        if size < 1:
+            raise ValueError(size)
+        self.closed = False
+        self.options = dataclasses.replace(options or Options(), **kwargs)
+        self.size = size
+
+    ### PRIVATE METHODS ###
+
+    def _get_options(self) -> Options:
+        from .osc import find_free_port
+
+        return dataclasses.replace(self.options, port=find_free_port())
+
+
+class ThreadedProcessPool(ProcessPool):
+    """
+    A pool of warm standby scsynth processes for :py:class:`~supriya.Server`.
+
+    ::
+
+        >>> from supriya import Server
+        >>> from supriya.scsynth import ThreadedProcessPool
+        >>> with ThreadedProcessPool(size=2) as pool:  # doctest: +SKIP
+        ...     server = Server().boot(pool=pool)
+        ...     server.quit()
+
+    :param size: The number of standby processes to keep booted.
+    :param options: The options to boot each process with.
+    :param kwargs: Keyword arguments for options.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, size: int = 1, options: Options | None = None, **kwargs):
+        super().__init__(size, options, **kwargs)
+        self.executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self.futures: collections.deque[
+            concurrent.futures.Future[ThreadedProcessProtocol]
+        ] = collections.deque()
+        self.lock = threading.Lock()
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "ThreadedProcessPool":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    ### PRIVATE METHODS ###
+
+    def _boot(self) -> ThreadedProcessProtocol:
+        process_protocol = ThreadedProcessProtocol()
+        process_protocol.boot(self._get_options())
+        return process_protocol
+
+    def _replenish(self) -> None:
+        with self.lock:
+            if self.closed or self.executor is None:
+                return
+            while len(self.futures) < self.size:
+                self.futures.append(self.executor.submit(self._boot))
+
+    ### PUBLIC METHODS ###
+
+    def acquire(self) -> ThreadedProcessProtocol:
+        """
+        Acquire a booted process, waiting for one if none are ready yet.
+
+        Raises :py:class:`~supriya.exceptions.ServerCannotBoot` if as many processes
+        in a row as the pool's size failed to boot.
+        """
+        self.start()
+        failures = 0
+        while True:
+            with self.lock:
+                if self.closed or self.executor is None:
+                    raise RuntimeError("Pool closed")
+                # Prefer whichever process finished booting first.
+                future = next((x for x in self.futures if x.done()), self.futures[0])
+                self.futures.remove(future)
+                # Replace it before releasing the lock, so other threads never
+                # find the pool empty.
+                self.futures.append(self.executor.submit(self._boot))
+            try:
+                process_protocol = future.result()
+            except ServerCannotBoot:
+                # Another standby process may still be healthy; skip this one.
+                if (failures := failures + 1) >= self.size:
+                    raise
+                continue
+            # Standby processes may have died while idle; skip them.
+            if process_protocol.status == BootStatus.ONLINE:
+                return process_protocol
+
+    def close(self) -> None:
+        """
+        Quit every standby process and stop booting replacements.
+        """
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            futures, self.futures = list(self.futures), collections.deque()
+        for future in futures:
+            try:
+                future.result().quit()
+            except ServerCannotBoot:
+                pass
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def start(self) -> "ThreadedProcessPool":
+        """
+        Start booting standby processes.
+        """
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("Pool closed")
+            if self.executor is None:
+                self.executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.size
+                )
+        self._replenish()
+        return self
+
+
+class AsyncProcessPool(ProcessPool):
+    """
+    A pool of warm standby scsynth processes for :py:class:`~supriya.AsyncServer`.
+
+    ::
+
+        >>> from supriya import AsyncServer
+        >>> from supriya.scsynth import AsyncProcessPool
+        >>> async def main():
+        ...     async with AsyncProcessPool(size=2) as pool:
+        ...         server = await AsyncServer().boot(pool=pool)
+        ...         await server.quit()
+        ...
+
+    :param size: The number of standby processes to keep booted.
+    :param options: The options to boot each process with.
+    :param kwargs: Keyword arguments for options.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, size: int = 1, options: Options | None = None, **kwargs):
+        super().__init__(size, options, **kwargs)
+        self.started = False
+        self.tasks: collections.deque[asyncio.Task[AsyncProcessProtocol]] = (
+            collections.deque()
+        )
+
+    ### SPECIAL METHODS ###
+
+    async def __aenter__(self) -> "AsyncProcessPool":
+        return self.start()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    ### PRIVATE METHODS ###
+
+    async def _boot(self) -> AsyncProcessProtocol:
+        process_protocol = AsyncProcessProtocol()
+        await process_protocol.boot(self._get_options())
+        return process_protocol
+
+    def _replenish(self) -> None:
+        if self.closed or not self.started:
+            return
+        loop = asyncio.get_running_loop()
+        while len(self.tasks) < self.size:
+            self.tasks.append(loop.create_task(self._boot()))
+
+    ### PUBLIC METHODS ###
+
+    async def acquire(self) -> AsyncProcessProtocol:
+        """
+        Acquire a booted process, waiting for one if none are ready yet.
+
+        Raises :py:class:`~supriya.exceptions.ServerCannotBoot` if as many processes
+        in a row as the pool's size failed to boot.
+        """
+        self.start()
+        failures = 0
+        while True:
+            if self.closed:
+                raise RuntimeError("Pool closed")
+            # Prefer whichever process finished booting first.
+            task = next((x for x in self.tasks if x.done()), self.tasks[0])
+            self.tasks.remove(task)
+            self._replenish()
+            try:
+                process_protocol = await task
+            except ServerCannotBoot:
+                # Another standby process may still be healthy; skip this one.
+                if (failures := failures + 1) >= self.size:
+                    raise
+                continue
+            # Standby processes may have died while idle; skip them.
+            if process_protocol.status == BootStatus.ONLINE:
+                return process_protocol
+
+    async def close(self) -> None:
+        """
+        Quit every standby process and stop booting replacements.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        tasks, self.tasks = list(self.tasks), collections.deque()
+        for task in tasks:
+            try:
+                await (await task).quit()
+            except ServerCannotBoot:
+                pass
+
+    def start(self) -> "AsyncProcessPool":
+        """
+        Start booting standby processes.
+
+        Must be called from within a running event loop.
+        """
+        if self.closed:
+            raise RuntimeError("Pool closed")
+        self.started = True
+        self._replenish()
+        return self
+
+
 class AsyncNonrealtimeProcessProtocol(asyncio.SubprocessProtocol, ProcessProtocol):
     def __init__(self) -> None:
         ProcessProtocol.__init__(self)
@@ -9,12 +9,16 @@ import shlex
 import struct
 from os import PathLike
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Literal
 
 from uqbar.io import find_executable
 from uqbar.strings import to_dash_case
 
 from . import output_path
 
+if TYPE_CHECKING:
+    import numpy
+
 
 @dataclasses.dataclass(frozen=True)
 class Say:
@@ -142,11 +146,143 @@ class Say:
         return output_file_path
 
 
+@dataclasses.dataclass(frozen=True)
+class _Header:
+    channel_count: int
+    # byte order and sample type, e.g. "<i2" or ">f4", with "i3" for 24-bit
+    dtype: str
+    frame_count: int
+    offset: int
+    sample_rate: int
+
+
+def _read_aiff_header(file_: BinaryIO, file_size: int) -> _Header | None:
+    form, _, kind = struct.unpack(">4sI4s", file_.read(12))
+    if form != b"FORM" or kind not in (b"AIFF", b"AIFC"):
+        return None
+    comm: bytes | None = None
+    while len(header := file_.read(8)) == 8:
+        chunk_id, chunk_size = struct.unpack(">4sI", header)
+        if chunk_id == b"SSND":
+            data_offset = struct.unpack(">I", file_.read(8)[:4])[0]
+            offset = file_.tell() + data_offset
+            break
+        elif chunk_id == b"COMM":
+            comm = file_.read(chunk_size + chunk_size % 2)
+        else:
+            file_.seek(chunk_size + chunk_size % 2, 1)
+    else:
+        return None
+    if comm is None:
+        return None
+    channel_count, frame_count, bit_depth = struct.unpack(">HIH", comm[:8])
+    # the sample rate is an 80-bit extended float
+    exponent, mantissa = struct.unpack(">HQ", comm[8:18])
+    sample_rate = round(mantissa * 2.0 ** ((exponent & 0x7FFF) - 16383 - 63))
+    compression = comm[18:22] if kind == b"AIFC" else b"NONE"
+    dtype = {
+        (b"NONE", 16): ">i2",
+        (b"NONE", 24): ">i3",
+        (b"NONE", 32): ">i4",
+        (b"sowt", 16): "<i2",
+        (b"sowt", 24): "<i3",
+        (b"sowt", 32): "<i4",
+        (b"fl32", 32): ">f4",
+        (b"FL32", 32): ">f4",
+        (b"fl64", 64): ">f8",
+        (b"FL64", 64): ">f8",
+    }.get((compression, bit_depth))
+    if dtype is None:
+        return None
+    frame_size = channel_count * int(dtype[2])
+    frame_count = min(frame_count, (file_size - offset) // frame_size)
+    return _Header(channel_count, dtype, frame_count, offset, sample_rate)
+
+
+def _read_header(path: PathLike) -> _Header | None:
+    file_size = Path(path).stat().st_size
+    with open(path, "rb") as file_:
+        magic = file_.read(4)
+        file_.seek(0)
+        if magic == b"RIFF":
+            return _read_wav_header(file_, file_size)
+        elif magic == b"FORM":
+            return _read_aiff_header(file_, file_size)
+    return None
+
+
+def _read_wav_header(file_: BinaryIO, file_size: int) -> _Header | None:
+    riff, _, wave = struct.unpack("<4sI4s", file_.read(12))
+    if riff != b"RIFF" or wave != b"WAVE":
+        return None
+    dtype: str | None = None
+    while len(header := file_.read(8)) == 8:
+        chunk_id, chunk_size = struct.unpack("<4sI", header)
+        if chunk_id == b"data":
+            offset = file_.tell()
+            break
+        elif chunk_id != b"fmt ":
+            file_.seek(chunk_size + chunk_size % 2, 1)
+            continue
+        fmt = file_.read(chunk_size + chunk_size % 2)
+        format_tag, channel_count, sample_rate = struct.unpack("<HHI", fmt[:8])
+        bit_depth = struct.unpack("<H", fmt[14:16])[0]
+        if format_tag == 0xFFFE:  # extensible, so read the subformat instead
+            format_tag = struct.unpack("<H", fmt[24:26])[0]
+        dtype = {
+            (1, 16): "<i2",
+            (1, 24): "<i3",
+            (1, 32): "<i4",
+            (3, 32): "<f4",
+            (3, 64): "<f8",
+        }.get((format_tag, bit_depth))
+    else:
+        return None
+    if dtype is None:
+        return None
+    frame_size = channel_count * int(dtype[2])
+    frame_count = min(chunk_size, file_size - offset) // frame_size
+    return _Header(channel_count, dtype, frame_count, offset, sample_rate)
+
+
+def _map(
+    path: PathLike, header: _Header, mode: Literal["r", "c", "r+"] = "r"
+) -> "numpy.memmap":
+    import numpy
+
+    dtype = header.dtype
+    shape: tuple[int, ...] = (header.frame_count, header.channel_count)
+    if dtype[1:] == "i3":
+        # no native 24-bit type, so map the bytes of each sample instead
+        dtype, shape = "u1", (*shape, 3)
+    return numpy.memmap(path, dtype=dtype, mode=mode, offset=header.offset, shape=shape)
+
+
+def _to_float(samples: "numpy.ndarray", dtype: str) -> "numpy.ndarray":
+    import numpy
+
+    if dtype[1:] == "i3":
+        samples = samples.astype(numpy.int32)
+        if dtype[0] == ">":
+            samples = samples[..., ::-1]
+        # shift into the top of an int32, which also extends the sign
+        samples = (samples[..., 0] | samples[..., 1] << 8 | samples[..., 2] << 16) << 8
+        scale = 1.0 / (1 << 31)
+    elif dtype[1] == "i":
+        scale = 1.0 / (1 << (8 * int(dtype[2]) - 1))
+    else:
+        scale = 1.0
+    array = numpy.empty(samples.shape[::-1], dtype=numpy.float32)
+    numpy.multiply(samples.T, scale, out=array, casting="unsafe")
+    return array
+
+
 def load(path: Path) -> tuple[tuple[tuple[float, ...], ...], int]:
     """
     Load an audio file as 2d array of floats, one row per channel.
 
-    This uses the ``audioread`` library under the hood.
+    This uses the ``audioread`` library under the hood. See :py:func:`load_array`
+    for a much faster loader returning a NumPy array.
 
     Return the audio data and the sample rate.
     """
@@ -165,3 +301,157 @@ def load(path: Path) -> tuple[tuple[tuple[float, ...], ...], int]:
         samples[i : i + channel_count] for i in range(0, len(samples), channel_count)
     )
     return tuple(zip(*frames, strict=True)), sample_rate
+
+
+def load_array(path: PathLike) -> tuple["numpy.ndarray", int]:
+    """
+    Load an audio file as a ``(channel_count, frame_count)`` float32 NumPy array.
+
+    Uncompressed WAV and AIFF files with 16-, 24- or 32-bit integer or 32- or
+    64-bit float samples are converted straight from a memory map. Anything else
+    decodes through the ``audioread`` library.
+
+    Return the audio data and the sample rate.
+
+    ::
+
+        >>> import numpy, tempfile
+        >>> from pathlib import Path
+        >>> from supriya.soundfiles import load_array, save
+        >>> path = Path(tempfile.mkdtemp()) / "ramp.wav"
+        >>> save(path, numpy.linspace(-1, 1, 8).reshape(4, 2), 44100)
+        >>> array, sample_rate = load_array(path)
+        >>> array.shape, array.dtype, sample_rate
+        ((2, 4), dtype('float32'), 44100)
+
+    :param path: The audio file to load.
+    """
+    import numpy
+
+    if (header := _read_header(path)) is not None:
+        return _to_float(_map(path, header), header.dtype), header.sample_rate
+    import audioread
+
+    with audioread.audio_open(str(path)) as audio_file:
+        sample_rate = audio_file.samplerate
+        channel_count = audio_file.channels
+        data = b"".join(audio_file)
+    samples = numpy.frombuffer(data, dtype="<i2").reshape(-1, channel_count)
+    return _to_float(samples, "<i2"), sample_rate
+
+
+def memmap(
+    path: PathLike, mode: Literal["r", "c", "r+"] = "c"
+) -> tuple["numpy.memmap", int]:
+    """
+    Map an uncompressed WAV or AIFF file's samples into memory, without decoding
+    them.
+
+    Supports 16- and 32-bit integer and 32- and 64-bit float samples, in the file's
+    own byte order.
+
+    Return a ``(frame_count, channel_count)`` array viewing the samples in place,
+    and the sample rate.
+
+    ::
+
+        >>> import numpy, tempfile
+        >>> from pathlib import Path
+        >>> from supriya.soundfiles import memmap, save
+        >>> path = Path(tempfile.mkdtemp()) / "ramp.wav"
+        >>> save(path, numpy.linspace(-1, 1, 8).reshape(4, 2), 44100)
+        >>> array, sample_rate = memmap(path)
+        >>> array.shape, array.dtype, sample_rate
+        ((4, 2), dtype('float32'), 44100)
+
+    :param path: The WAV or AIFF file to map.
+    :param mode: The mapping mode, as for :py:class:`numpy.memmap`. The default
+        copies on write, leaving the file untouched.
+    """
+    if (header := _read_header(path)) is None or header.dtype[1:] == "i3":
+        raise ValueError(path)
+    return _map(path, header, mode), header.sample_rate
+
+
+def save(path: PathLike, array: "numpy.ndarray", sample_rate: int) -> None:
+    """
+    Save samples as a 32-bit float WAV file.
+
+    :param path: The file to save into.
+    :param array: The samples, as a ``(frame_count, channel_count)`` array, or a
+        flat array of one channel.
+    :param sample_rate: The sample rate.
+    """
+    import numpy
+
+    samples = numpy.asarray(array, dtype="<f4")
+    if samples.ndim == 1:
+        samples = samples.reshape(-1, 1)
+    channel_count = samples.shape[1]
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + samples.nbytes,
+        b"WAVE",
+        b"fmt ",
+        16,
+        3,  # IEEE float
+        channel_count,
+        sample_rate,
+        sample_rate * channel_count * 4,
+        channel_count * 4,
+        32,
+        b"data",
+        samples.nbytes,
+    )
+    with open(path, "wb") as file_:
+        file_.write(header)
+        samples.tofile(file_)
+
+
+def stream(path: PathLike, frame_count: int = 65536) -> Iterator["numpy.ndarray"]:
+    """
+    Stream an audio file as ``(channel_count, frame_count)`` float32 arrays.
+
+    Decodes as :py:func:`load_array` does, but only ``frame_count`` frames at a time,
+    so files larger than memory can be processed. The last chunk may be shorter.
+
+    ::
+
+        >>> import numpy, tempfile
+        >>> from pathlib import Path
+        >>> from supriya.soundfiles import save, stream
+        >>> path = Path(tempfile.mkdtemp()) / "ramp.wav"
+        >>> save(path, numpy.linspace(-1, 1, 10).reshape(5, 2), 44100)
+        >>> for chunk in stream(path, frame_count=2):
+        ...     chunk.shape
+        ...
+        (2, 2)
+        (2, 2)
+        (2, 1)
+
+    :param path: The audio file to stream.
+    :param frame_count: The number of frames in each chunk.
+    """
+    import numpy
+
+    if (header := _read_header(path)) is not None:
+        mapped = _map(path, header)
+        for i in range(0, header.frame_count, frame_count):
+            yield _to_float(mapped[i : i + frame_count], header.dtype)
+        return
+    import audioread
+
+    with audioread.audio_open(str(path)) as audio_file:
+        channel_count = audio_file.channels
+        chunk_size = frame_count * channel_count * 2
+        pending = bytearray()
+        for block in audio_file:
+            pending += block
+            while len(pending) >= chunk_size:
+                samples = numpy.frombuffer(pending[:chunk_size], dtype="<i2")
+                yield _to_float(samples.reshape(-1, channel_count), "<i2")
+                del pending[:chunk_size]
+        if pending:
+            samples = numpy.frombuffer(bytes(pending), dtype="<i2")
+            yield _to_float(samples.reshape(-1, channel_count), "<i2")
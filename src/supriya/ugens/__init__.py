@@ -77,6 +77,7 @@ from .chaos import (
     StandardL,
     StandardN,
 )
+from .compilers import SynthDefCache
 from .convolution import Convolution, Convolution2, Convolution2L, Convolution3
 from .delay import (
     AllpassC,
@@ -694,6 +695,7 @@ __all__ = [
     "SyncSaw",
     "SynthDef",
     "SynthDefBuilder",
+    "SynthDefCache",
     "TBall",
     "TDelay",
     "TExpRand",
@@ -0,0 +1,121 @@
+import os
+import tempfile
+from os import PathLike
+from pathlib import Path
+from urllib.parse import quote
+
+from .core import SynthDef, compile_synthdefs
+
+
+class SynthDefCache:
+    """
+    A content-addressed directory of compiled SynthDefs.
+
+    Each SynthDef is compiled once into its own ``.scsyndef`` file, named after its
+    anonymous name (the hash of its compiled graph) and, if it has one, its name. A
+    file's name therefore determines its contents, so files never go stale and may be
+    shared between processes.
+
+    ::
+
+        >>> import tempfile
+        >>> from supriya.ugens import SynthDefCache, default
+        >>> cache = SynthDefCache(tempfile.mkdtemp())
+        >>> default in cache
+        False
+
+    ::
+
+        >>> path = cache.store(default)
+        >>> path.name
+        'd47e85613bb28f459b3e4a165cf3008b-supriya%3Adefault.scsyndef'
+
+    ::
+
+        >>> default in cache, path.read_bytes() == default.compile()
+        (True, True)
+
+    :param path: The cache directory, defaulting to a ``synthdefs`` directory inside
+        Supriya's output path.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, path: PathLike | str | None = None) -> None:
+        if path is None:
+            from .. import output_path
+
+            path = output_path / "synthdefs"
+        self._path = Path(path)
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, synthdef: SynthDef) -> bool:
+        return self.get_path(synthdef).exists()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {str(self._path)!r}>"
+
+    ### PUBLIC METHODS ###
+
+    def clear(self) -> None:
+        """
+        Delete every compiled SynthDef in the cache.
+        """
+        for path in self._path.glob("*.scsyndef"):
+            path.unlink(missing_ok=True)
+
+    def get_path(self, synthdef: SynthDef) -> Path:
+        """
+        Get the path of a SynthDef's compiled file, whether or not it exists yet.
+
+        Names are percent-encoded, so the path is safe to pass to ``/d_load``, which
+        treats its argument as a glob pattern.
+
+        :param synthdef: The SynthDef.
+        """
+        name = synthdef.anonymous_name
+        if synthdef.name:
+            name += "-" + quote(synthdef.name, safe="")
+        return self._path / f"{name}.scsyndef"
+
+    def store(self, synthdef: SynthDef) -> Path:
+        """
+        Compile a SynthDef into the cache, unless already present.
+
+        Files are written atomically, so concurrent processes never observe a
+        partial file.
+
+        :param synthdef: The SynthDef to store.
+        """
+        if (path := self.get_path(synthdef)).exists():
+            return path
+        self._path.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self._path, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as file_pointer:
+                file_pointer.write(compile_synthdefs(synthdef))
+            os.replace(temporary_path, path)
+        except BaseException:
+            Path(temporary_path).unlink(missing_ok=True)
+            raise
+        return path
+
+    def warm(self, *synthdefs: SynthDef) -> list[Path]:
+        """
+        Compile many SynthDefs into the cache ahead of time.
+
+        :param synthdefs: The SynthDefs to store.
+        """
+        return [self.store(synthdef) for synthdef in synthdefs]
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def path(self) -> Path:
+        """
+        Get the cache directory.
+        """
+        return self._path
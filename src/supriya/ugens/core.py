@@ -6244,7 +6244,7 @@ def _compile_synthdef(synthdef: SynthDef, name: str) -> bytes:
     return b"".join(
         [
             _encode_string(name),
-            _compile_ugen_graph(synthdef),
+            synthdef._compiled_graph,
         ]
     )
 
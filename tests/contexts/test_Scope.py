@@ -1,3 +1,4 @@
+import asyncio
 import time
 from typing import Generator, Literal
 
@@ -157,3 +158,37 @@ def test_frequency_scope(
     assert any([entry[0] for entry in results])
     assert all([any(entry[1]) for entry in results if entry[0]])
     scope.stop()
+
+
+@pytest.mark.asyncio
+async def test_stream(context: Server) -> None:
+    pytest.importorskip("numpy")
+    import numpy
+
+    scope = context.add_amplitude_scope(bus=context.audio_output_bus_group[0])
+    context.sync()
+
+    async def subscribe(count: int) -> list["numpy.ndarray"]:
+        frames = []
+        async for frame in scope.stream(fps=30):
+            frames.append(frame.copy())
+            if len(frames) == count:
+                break
+        return frames
+
+    frames_a, frames_b = await asyncio.gather(subscribe(10), subscribe(5))
+    assert all(
+        frame.shape[1] == 1 and frame.dtype == numpy.float32 for frame in frames_a
+    )
+    assert all(frame.any() for frame in frames_a)
+    # both subscribers saw the same frames, read from shared memory once
+    assert all(
+        numpy.array_equal(a, b) for a, b in zip(frames_a, frames_b, strict=False)
+    )
+    counters = scope.stream_counters
+    assert counters["frames"] >= 10
+    assert counters["polls"] == counters["frames"] + counters["unchanged"]
+    assert counters["dropped"] == 0
+    scope.stop()
+    with pytest.raises(ValueError):
+        await anext(scope.stream())
@@ -119,6 +119,25 @@ def test_set_bus(context: Score) -> None:
     ]
 
 
+def test_set_bus_array(context: Score) -> None:
+    numpy = pytest.importorskip("numpy")
+    with context.at(0):
+        audio_bus_group = context.add_bus_group("AUDIO", count=4)
+        control_bus_group = context.add_bus_group("CONTROL", count=4)
+    with context.at(1.23):
+        with pytest.raises(InvalidCalculationRate):
+            audio_bus_group.set_array(numpy.zeros(4))
+        with pytest.raises(ValueError):
+            control_bus_group.set_array(numpy.zeros(3))
+        control_bus_group.set_array(numpy.array([0.5, 0.25, 0.125, 1.0]))
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(OscMessage("/c_setn", 0, 4, 0.5, 0.25, 0.125, 1.0),),
+            timestamp=1.23,
+        )
+    ]
+
+
 @pytest.mark.asyncio
 async def test_set_bus_range(context: Score) -> None:
     with context.at(0):
@@ -1,6 +1,6 @@
 import pytest
 
-from supriya import OscBundle, OscMessage, Score, SynthDef, default
+from supriya import OscBundle, OscMessage, Score, Synth, SynthDef, default
 from supriya.ugens import compile_synthdefs
 
 
@@ -120,6 +120,143 @@ def test_add_synth(context: Score, two_voice_synthdef: SynthDef) -> None:
             synth.add_synth(default, add_action="ADD_TO_TAIL")
 
 
+def test_add_synths(context: Score, two_voice_synthdef: SynthDef) -> None:
+    with context.at(0):
+        group = context.add_group()
+        synths = context.add_synths(
+            default, 3, target_node=group, amplitude="c0", frequency=[440, 550, 660]
+        )
+        context.add_synths(
+            two_voice_synthdef,
+            2,
+            add_action="ADD_AFTER",
+            target_node=group,
+            amplitude=[0.5, "a4"],
+            frequencies=[(123, 456), (789, 1011)],
+        )
+        context.add_synths(two_voice_synthdef, 2, frequencies=(123, 456))
+    assert [synth.id_ for synth in synths] == [1001, 1002, 1003]
+    assert synths[-1] == synths[1:][-1] == Synth(context, 1003, default)
+    assert len(synths) == 3
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(
+                OscMessage("/g_new", 1000, 0, 0),
+                *(
+                    OscMessage(
+                        "/s_new",
+                        "supriya:default",
+                        id_,
+                        0,
+                        1000,
+                        "amplitude",
+                        "c0",
+                        "frequency",
+                        frequency,
+                    )
+                    for id_, frequency in [(1001, 440.0), (1002, 550.0), (1003, 660.0)]
+                ),
+                OscMessage(
+                    "/s_new",
+                    "test:two-voice",
+                    1004,
+                    3,
+                    1000,
+                    "amplitude",
+                    0.5,
+                    "frequencies",
+                    (123.0, 456.0),
+                ),
+                OscMessage(
+                    "/s_new",
+                    "test:two-voice",
+                    1005,
+                    3,
+                    1000,
+                    "amplitude",
+                    "a4",
+                    "frequencies",
+                    (789.0, 1011.0),
+                ),
+                OscMessage(
+                    "/s_new",
+                    "test:two-voice",
+                    1006,
+                    0,
+                    0,
+                    "frequencies",
+                    (123.0, 456.0),
+                ),
+                OscMessage(
+                    "/s_new",
+                    "test:two-voice",
+                    1007,
+                    0,
+                    0,
+                    "frequencies",
+                    (123.0, 456.0),
+                ),
+            ),
+            timestamp=0.0,
+        )
+    ]
+    with context.at(1):
+        # per-synth values must cover every synth
+        with pytest.raises(ValueError):
+            context.add_synths(default, 3, frequency=[440, 550])
+        # one node can't be replaced by many
+        with pytest.raises(ValueError):
+            context.add_synths(default, 2, add_action="REPLACE", target_node=group)
+        synths.free()
+    assert list(context.iterate_osc_bundles())[-1] == OscBundle(
+        contents=tuple(OscMessage("/n_set", id_, "gate", 0) for id_ in synths.ids),
+        timestamp=1.0,
+    )
+
+
+def test_add_synths_numpy(context: Score, two_voice_synthdef: SynthDef) -> None:
+    numpy = pytest.importorskip("numpy")
+    with context.at(0):
+        context.add_synths(
+            two_voice_synthdef,
+            2,
+            amplitude=numpy.float32(0.5),
+            frequencies=numpy.array([[110, 220], [330, 440]]),
+        )
+        context.add_synths(default, 2, frequency=numpy.linspace(100, 200, 2))
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(
+                OscMessage(
+                    "/s_new",
+                    "test:two-voice",
+                    1000,
+                    0,
+                    0,
+                    "amplitude",
+                    0.5,
+                    "frequencies",
+                    (110.0, 220.0),
+                ),
+                OscMessage(
+                    "/s_new",
+                    "test:two-voice",
+                    1001,
+                    0,
+                    0,
+                    "amplitude",
+                    0.5,
+                    "frequencies",
+                    (330.0, 440.0),
+                ),
+                OscMessage("/s_new", "supriya:default", 1002, 0, 0, "frequency", 100.0),
+                OscMessage("/s_new", "supriya:default", 1003, 0, 0, "frequency", 200.0),
+            ),
+            timestamp=0.0,
+        )
+    ]
+
+
 def test_free_group_children(context: Score) -> None:
     with context.at(0):
         grandparent = context.add_group()
@@ -0,0 +1,123 @@
+import asyncio
+import dataclasses
+import logging
+from typing import Any, AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from supriya import AsyncServerCluster, OscMessage, ServerCluster, default
+from supriya.contexts.clusters import (
+    LeastLoadedPlacement,
+    StickyPlacement,
+)
+from supriya.contexts.responses import StatusInfo
+
+
+async def get(x):
+    if asyncio.iscoroutine(x):
+        return await x
+    return x
+
+
+@dataclasses.dataclass
+class Shard:
+    status: StatusInfo | None = None
+
+
+def status(average_cpu_usage: float, synth_count: int) -> StatusInfo:
+    return StatusInfo(
+        actual_sample_rate=44100.0,
+        average_cpu_usage=average_cpu_usage,
+        group_count=2,
+        peak_cpu_usage=average_cpu_usage,
+        synth_count=synth_count,
+        synthdef_count=32,
+        target_sample_rate=44100.0,
+        ugen_count=synth_count * 8,
+    )
+
+
+@pytest.fixture(autouse=True)
+def use_caplog(caplog) -> None:
+    caplog.set_level(logging.INFO)
+
+
+@pytest_asyncio.fixture(params=[AsyncServerCluster, ServerCluster])
+async def cluster(request) -> AsyncGenerator[AsyncServerCluster | ServerCluster, None]:
+    cluster = request.param(count=2)
+    await get(cluster.boot())
+    yield cluster
+    await get(cluster.quit())
+
+
+def test_LeastLoadedPlacement() -> None:
+    shards: Any = [Shard(status(40.0, 10)), Shard(status(30.0, 10)), Shard()]
+    policy = LeastLoadedPlacement()
+    # No status yet counts as idle, until placements pile up.
+    assert [policy.select(shards) for _ in range(3)] == [2, 2, 2]
+    # Each placement costs 3% on shard 1, so it takes four to overtake shard 0.
+    shards[2].status = status(50.0, 3)
+    assert [policy.select(shards) for _ in range(5)] == [1, 1, 1, 1, 0]
+    # A fresh status reply resets the estimate.
+    shards[1].status = status(30.0, 14)
+    assert policy.select(shards) == 1
+
+
+def test_StickyPlacement() -> None:
+    shards: Any = [Shard(status(50.0, 1)), Shard(status(10.0, 1))]
+    policy = StickyPlacement(fallback=LeastLoadedPlacement())
+    assert policy.select(shards, "drums") == 1
+    shards[1].status = status(90.0, 100)
+    assert policy.select(shards, "drums") == 1
+    assert policy.select(shards, "pads") == 0
+    # Shard 0 now has a pending placement costing as much as its whole load.
+    assert policy.select(shards) == 1
+
+
+@pytest.mark.asyncio
+async def test_ServerCluster(cluster: AsyncServerCluster | ServerCluster) -> None:
+    cluster.add_synthdefs(default)
+    bus = cluster.add_bus()
+    bus.set(0.5)
+    group = cluster.add_group()
+    with (
+        cluster[0].osc_protocol.capture() as transcript_a,
+        cluster[1].osc_protocol.capture() as transcript_b,
+    ):
+        synths = [cluster.add_synth(amplitude=bus) for _ in range(3)]
+    # Round robin across shards, each node on its shard's own ID sequence.
+    assert group.context is cluster[0]
+    assert [synth.context for synth in synths] == [cluster[1], cluster[0], cluster[1]]
+    assert [synth.id_ for synth in synths] == [1000, 1001, 1001]
+    # Sharded buses resolve to the bus on the synth's shard.
+    for transcript, shard_bus, ids in [
+        (transcript_a, bus[0], [1001]),
+        (transcript_b, bus[1], [1000, 1001]),
+    ]:
+        assert [entry.message for entry in transcript.filtered(received=False)] == [
+            OscMessage(
+                "/s_new",
+                "supriya:default",
+                id_,
+                0,
+                1,
+                "amplitude",
+                shard_bus.map_symbol(),
+            )
+            for id_ in ids
+        ]
+    # Nodes added relative to a node stay on its shard.
+    inner = cluster.add_synth(target_node=group)
+    assert inner.context is cluster[0]
+    with pytest.raises(ValueError):
+        cluster.add_synth(target_node=1000)
+    await get(cluster.sync())
+    # The usual node API works on shard nodes.
+    for synth, shard in zip(synths, [cluster[1], cluster[0], cluster[1]]):
+        with shard.osc_protocol.capture() as transcript:
+            synth.set(frequency=443)
+        assert [entry.message for entry in transcript.filtered(received=False)] == [
+            OscMessage("/n_set", synth.id_, "frequency", 443.0)
+        ]
+    assert [len(shard.default_group.children) for shard in cluster] == [2, 2]
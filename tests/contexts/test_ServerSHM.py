@@ -1,5 +1,6 @@
 import random
 
+import pytest
 from supriya_shm import ServerSHM
 
 from supriya import Server
@@ -29,3 +30,18 @@ def test_shared_memory(server: Server) -> None:
         server.shared_memory[int(bus_group) : int(bus_group) + len(bus_group)]
         == values[: len(bus_group)]
     )
+
+
+def test_shared_memory_arrays(server: Server) -> None:
+    numpy = pytest.importorskip("numpy")
+    shared_memory = server.shared_memory
+    assert isinstance(shared_memory, ServerSHM)
+    bus_group = server.add_bus_group(calculation_rate="CONTROL", count=8)
+    start, stop = int(bus_group), int(bus_group) + len(bus_group)
+    server.set_bus_array(bus_group[0], numpy.arange(8) / 4, use_shared_memory=True)
+    assert shared_memory[start:stop] == [i / 4 for i in range(8)]
+    shared_memory[start:stop] = [i / 2 for i in range(8)]
+    out = numpy.zeros(8, dtype=numpy.float32)
+    array = server.get_bus_array(bus_group[0], 8, out=out, use_shared_memory=True)
+    assert array is out
+    assert array.tolist() == [i / 2 for i in range(8)]
@@ -324,6 +324,103 @@ async def test_get_buffer(context: AsyncServer | Server) -> None:
     ]
 
 
+@pytest.mark.asyncio
+async def test_get_buffer_array(context: AsyncServer | Server) -> None:
+    numpy = pytest.importorskip("numpy")
+    buffer = context.add_buffer(channel_count=2, frame_count=4410)
+    await get(context.sync())
+    samples = numpy.random.default_rng(0).uniform(-1, 1, (4410, 2))
+    samples = samples.astype(numpy.float32)
+    # force chunks of (1472 - 64) // 5 = 281 samples
+    context.set_maximum_datagram_size(1472)
+    with context.osc_protocol.capture() as transcript:
+        await get(buffer.from_numpy(samples, window=4))
+        array = await get(buffer.to_numpy(window=4))
+    assert array.dtype == numpy.float32
+    assert array.shape == (4410, 2)
+    assert numpy.array_equal(array, samples)
+    addresses = [
+        entry.message.address
+        for entry in transcript.filtered(received=False)
+        if isinstance(entry.message, OscMessage)
+    ]
+    assert addresses.count("/b_setn") == addresses.count("/b_getn") == 32
+    assert addresses.count("/sync") == 8
+    assert context.transfer_counters["transfers"] == 2
+    assert context.transfer_counters["samples"] == 2 * 8820
+    # partial transfers address frames
+    await get(buffer.from_numpy(numpy.zeros((10, 2)), starting_frame=100))
+    samples[100:110] = 0.0
+    assert numpy.array_equal(await get(buffer.to_numpy(95, 20)), samples[95:115])
+    # flat arrays take their channel count from the buffer
+    await get(buffer.from_numpy(numpy.ones(20), starting_frame=200))
+    samples[200:210] = 1.0
+    assert numpy.array_equal(await get(buffer.to_numpy(195, 20)), samples[195:215])
+
+
+@pytest.mark.asyncio
+async def test_get_buffer_array_via_file(context: AsyncServer | Server) -> None:
+    numpy = pytest.importorskip("numpy")
+    buffer = context.add_buffer(channel_count=2, frame_count=44100)
+    await get(context.sync())
+    samples = numpy.random.default_rng(0).uniform(-1, 1, (44100, 2))
+    samples = samples.astype(numpy.float32)
+    with context.osc_protocol.capture() as transcript:
+        await get(buffer.from_numpy(samples, via="file"))
+        array = await get(buffer.to_numpy(via="file"))
+    assert isinstance(array, numpy.memmap)
+    assert array.shape == (44100, 2)
+    assert numpy.array_equal(array, samples)
+    addresses = [
+        entry.message.address
+        for entry in transcript.filtered(received=False)
+        if isinstance(entry.message, OscMessage)
+    ]
+    assert addresses.count("/b_read") == addresses.count("/b_write") == 1
+    assert "/b_setn" not in addresses and "/b_getn" not in addresses
+    # partial transfers address frames either way
+    await get(buffer.from_numpy(numpy.zeros((10, 2)), starting_frame=100, via="file"))
+    samples[100:110] = 0.0
+    assert numpy.array_equal(
+        await get(buffer.to_numpy(95, 20, via="file")), samples[95:115]
+    )
+    assert numpy.array_equal(
+        await get(buffer.to_numpy(95, 20, via="osc")), samples[95:115]
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_buffer_array_via_auto(context: AsyncServer | Server) -> None:
+    numpy = pytest.importorskip("numpy")
+    buffer = context.add_buffer(channel_count=2, frame_count=44100)
+    await get(context.sync())
+    samples = numpy.random.default_rng(0).uniform(-1, 1, (44100, 2))
+    samples = samples.astype(numpy.float32)
+    # large transfers with a server booted locally go through a file
+    with context.osc_protocol.capture() as transcript:
+        await get(buffer.from_numpy(samples))
+        assert numpy.array_equal(await get(buffer.to_numpy()), samples)
+    addresses = [
+        entry.message.address
+        for entry in transcript.filtered(received=False)
+        if isinstance(entry.message, OscMessage)
+    ]
+    assert addresses.count("/b_read") == addresses.count("/b_write") == 1
+    assert "/b_setn" not in addresses and "/b_getn" not in addresses
+    # small transfers go through OSC messages
+    with context.osc_protocol.capture() as transcript:
+        await get(buffer.from_numpy(numpy.zeros((10, 2)), starting_frame=100))
+        samples[100:110] = 0.0
+        assert numpy.array_equal(await get(buffer.to_numpy(95, 20)), samples[95:115])
+    addresses = [
+        entry.message.address
+        for entry in transcript.filtered(received=False)
+        if isinstance(entry.message, OscMessage)
+    ]
+    assert "/b_setn" in addresses and "/b_getn" in addresses
+    assert "/b_read" not in addresses and "/b_write" not in addresses
+
+
 @pytest.mark.asyncio
 async def test_get_buffer_range(context: AsyncServer | Server) -> None:
     # actually allocate a buffer
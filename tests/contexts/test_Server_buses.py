@@ -181,6 +181,26 @@ async def test_get_bus(context: AsyncServer | Server) -> None:
     assert [entry.message for entry in transcript.filtered(received=False)] == []
 
 
+@pytest.mark.asyncio
+async def test_get_bus_array(context: AsyncServer | Server) -> None:
+    numpy = pytest.importorskip("numpy")
+    audio_bus_group = context.add_bus_group("audio", count=4)
+    with pytest.raises(InvalidCalculationRate):
+        await get(audio_bus_group.get_array())
+    bus_group = context.add_bus_group(count=4)
+    bus_group.set_array(numpy.array([0.5, 0.25, 0.125, 1.0]))
+    array = await get(bus_group.get_array())
+    assert array.dtype == numpy.float32
+    assert array.tolist() == [0.5, 0.25, 0.125, 1.0]
+    # Use shared memory:
+    out = numpy.zeros(4, dtype=numpy.float32)
+    with context.osc_protocol.capture() as transcript:
+        bus_group.set_array(numpy.arange(4) / 4, use_shared_memory=True)
+        assert await get(bus_group.get_array(out=out, use_shared_memory=True)) is out
+    assert [entry.message for entry in transcript.filtered(received=False)] == []
+    assert out.tolist() == [0.0, 0.25, 0.5, 0.75]
+
+
 @pytest.mark.asyncio
 async def test_get_bus_range(context: AsyncServer | Server) -> None:
     audio_bus_group = context.add_bus_group("audio", count=4)
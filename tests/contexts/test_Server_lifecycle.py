@@ -3,7 +3,7 @@ import logging
 import platform
 import random
 import warnings
-from typing import Literal, Type
+from typing import Any, Literal, Type
 
 import pytest
 from pytest import MonkeyPatch
@@ -23,7 +23,7 @@ from supriya.exceptions import (
     TooManyClients,
     UnownedServerShutdown,
 )
-from supriya.scsynth import kill
+from supriya.scsynth import AsyncProcessPool, ThreadedProcessPool, kill
 
 supernova = pytest.param(
     "supernova",
@@ -871,3 +871,55 @@ async def test_boot_a_and_connect_b_and_kill(
     assert context_b.boot_future.done()
     assert context_b.exit_future.done()
     logger.warning("END")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("context_class", [AsyncServer, Server])
+async def test_boot_pool(context_class: Type[AsyncServer | Server]) -> None:
+    """
+    Servers boot from warm standby processes, including after a panic.
+    """
+    context, events = setup_context(context_class)
+    pool: Any
+    if isinstance(context, AsyncServer):
+        pool = AsyncProcessPool(size=2, maximum_node_count=2048).start()
+        # Wait for the standbys, so booting only connects.
+        await asyncio.gather(*pool.tasks)
+    else:
+        pool = ThreadedProcessPool(size=2, maximum_node_count=2048).start()
+        for future in list(pool.futures):
+            future.result()
+    try:
+        await get(context.boot(pool=pool))
+        assert context.boot_status == BootStatus.ONLINE
+        assert context.options.maximum_node_count == 2048
+        assert events == [
+            ServerLifecycleEvent.BOOTING,
+            ServerLifecycleEvent.PROCESS_BOOTED,
+            ServerLifecycleEvent.CONNECTING,
+            ServerLifecycleEvent.OSC_CONNECTED,
+            ServerLifecycleEvent.CONNECTED,
+            ServerLifecycleEvent.BOOTED,
+        ]
+        # Kill only this server's process, leaving the standbys alone.
+        port = context.options.port
+        if isinstance(context, AsyncServer):
+            context.process_protocol.transport.kill()
+        else:
+            context.process_protocol.process.kill()
+        await get_future(context.exit_future)
+        assert ServerLifecycleEvent.PROCESS_PANICKED in events
+        events.clear()
+        await get(context.boot(pool=pool))
+        assert context.boot_status == BootStatus.ONLINE
+        assert context.options.port != port
+        assert events[-1] == ServerLifecycleEvent.BOOTED
+        port = context.options.port
+        await get(context.reboot())
+        assert context.boot_status == BootStatus.ONLINE
+        assert context.options.port != port
+        await get(context.quit())
+        with pytest.raises(ValueError):
+            await get(context.boot(pool=pool, port=find_free_port()))
+    finally:
+        await get(pool.close())
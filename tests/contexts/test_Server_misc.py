@@ -23,7 +23,13 @@ from supriya import (
 )
 from supriya.contexts.responses import StatusInfo, VersionInfo
 from supriya.exceptions import ServerOffline
-from supriya.ugens import SYSTEM_SYNTHDEFS
+from supriya.ugens import (
+    SYSTEM_SYNTHDEFS,
+    Out,
+    SinOsc,
+    SynthDefBuilder,
+    compile_synthdefs,
+)
 
 
 async def get(x):
@@ -68,6 +74,21 @@ async def test_clear_schedule(context: AsyncServer | Server) -> None:
     ]
 
 
+@pytest.mark.asyncio
+async def test_communicate_pipelined(context: AsyncServer | Server) -> None:
+    if not isinstance(context, AsyncServer):
+        return
+    groups = [context.add_group() for _ in range(10)]
+    await context.sync()
+    infos = await asyncio.gather(
+        *(context.query_node(group) for group in groups for _ in range(10))
+    )
+    assert [info.node_id for info in infos if info] == [
+        group.id_ for group in groups for _ in range(10)
+    ]
+    assert context.osc_protocol.pending_callbacks == {}
+
+
 @pytest.mark.asyncio
 async def test_default_group(context: AsyncServer | Server) -> None:
     assert isinstance(context.default_group, Group)
@@ -1212,10 +1233,14 @@ async def test_reboot(context: AsyncServer | Server) -> None:
     assert [entry.message for entry in transcript.filtered(received=False)] == [
         OscMessage("/quit"),
         OscMessage("/notify", 1),
-        OscMessage("/g_new", 1, 1, 0),
-        *(
-            OscMessage("/d_recv", synthdef.compile())
-            for synthdef in SYSTEM_SYNTHDEFS.values()
+        *OscBundle.partition(
+            [
+                OscMessage("/g_new", 1, 1, 0),
+                *(
+                    OscMessage("/d_recv", compile_synthdefs(*synthdefs))
+                    for synthdefs in context._get_system_synthdef_batches()
+                ),
+            ]
         ),
         OscMessage("/sync", 0),
     ]
@@ -1245,6 +1270,36 @@ async def test_register_osc_callback(context: AsyncServer | Server) -> None:
     assert osc_messages == [OscMessage("/synced", 2)]
 
 
+@pytest.mark.asyncio
+async def test_register_system_synthdefs(context: AsyncServer | Server) -> None:
+    with SynthDefBuilder() as builder:
+        Out.ar(bus=0, source=SinOsc.ar())
+    synthdef = builder.build(name="extra")
+    with context.osc_protocol.capture() as transcript:
+        context.register_system_synthdefs(synthdef)
+        await get(context.reset())
+    assert [entry.message for entry in transcript.filtered(received=False)][:2] == [
+        OscMessage("/d_recv", compile_synthdefs(synthdef)),
+        OscBundle(
+            contents=[
+                OscMessage("/clearSched"),
+                OscMessage("/g_freeAll", 0),
+                OscMessage("/d_freeAll"),
+            ]
+        ),
+    ]
+    batches = context._get_system_synthdef_batches()
+    assert [x for batch in batches for x in batch] == [
+        *SYSTEM_SYNTHDEFS.values(),
+        synthdef,
+    ]
+    assert all(
+        len(compile_synthdefs(*batch)) < context._get_maximum_datagram_size()
+        for batch in batches
+    )
+    assert "extra" in (context._resident_synthdefs or {})
+
+
 @pytest.mark.asyncio
 async def test_reset(context: AsyncServer | Server) -> None:
     # TODO: expand this
@@ -1266,10 +1321,14 @@ async def test_reset(context: AsyncServer | Server) -> None:
             ]
         ),
         OscMessage("/sync", 2),
-        OscMessage("/g_new", 1, 1, 0),
-        *(
-            OscMessage("/d_recv", synthdef.compile())
-            for synthdef in SYSTEM_SYNTHDEFS.values()
+        *OscBundle.partition(
+            [
+                OscMessage("/g_new", 1, 1, 0),
+                *(
+                    OscMessage("/d_recv", compile_synthdefs(*synthdefs))
+                    for synthdefs in context._get_system_synthdef_batches()
+                ),
+            ]
         ),
         OscMessage("/sync", 0),
     ]
@@ -1282,6 +1341,31 @@ async def test_root_node(context: AsyncServer | Server) -> None:
     assert context.root_node.id_ == 0
 
 
+@pytest.mark.asyncio
+async def test_send_oversized_bundle(context: AsyncServer | Server) -> None:
+    with context.osc_protocol.capture() as transcript:
+        with context.at():
+            synths = [context.add_synth(default, frequency=i) for i in range(500)]
+        await get(context.sync())
+    bundles = [
+        entry.message
+        for entry in transcript.filtered(received=False)
+        if isinstance(entry.message, OscBundle)
+    ]
+    assert len(bundles) > 1
+    assert all(len(bundle.to_datagram()) <= 8192 for bundle in bundles)
+    assert len({bundle.timestamp for bundle in bundles}) == 1
+    assert [
+        message.contents[1] for bundle in bundles for message in bundle.contents
+    ] == [synth.id_ for synth in synths]
+    assert context.split_counters == {
+        "bundles_split": 1,
+        "bundles_sent": len(bundles),
+        "oversized_elements": 0,
+    }
+    assert all(synth in context for synth in synths)
+
+
 @pytest.mark.asyncio
 async def test_sync(context: AsyncServer | Server) -> None:
     with context.osc_protocol.capture() as transcript:
@@ -9,6 +9,7 @@ from uqbar.strings import normalize
 from supriya import AsyncServer, OscBundle, OscMessage, Server, SynthDef, default
 from supriya.contexts.responses import NodeInfo
 from supriya.enums import NodeAction
+from supriya.ugens import Out, SinOsc, SynthDefBuilder
 
 
 async def get(x):
@@ -66,6 +67,31 @@ async def test_Group_children(context: AsyncServer | Server) -> None:
     assert context.root_node.children == []
 
 
+@pytest.mark.asyncio
+async def test_Group_children_view(context: AsyncServer | Server) -> None:
+    group = context.add_group()
+    synths = [group.add_synth(default, add_action="ADD_TO_TAIL") for _ in range(5)]
+    children = group.children
+    assert len(children) == 0  # waiting for the /n_go responses
+    await get(context.sync())
+    # the view is live, sized in constant time, and walks in either direction
+    assert len(children) == 5
+    assert list(children) == synths
+    assert list(reversed(children)) == synths[::-1]
+    assert children[0] == synths[0]
+    assert children[-1] == synths[-1]
+    assert children[1:3] == synths[1:3]
+    assert synths[2] in children
+    with pytest.raises(IndexError):
+        children[5]
+    # moves and frees relink in place
+    synths[0].move(synths[-1], "ADD_AFTER")
+    synths[2].free()
+    await get(context.sync())
+    assert children == [synths[1], synths[3], synths[4], synths[0]]
+    assert len(children) == 4
+
+
 @pytest.mark.asyncio
 async def test_Node_active(context: AsyncServer | Server) -> None:
     # nodes are active by default
@@ -220,6 +246,63 @@ async def test_add_synth(
         synth.add_synth(default, add_action="ADD_TO_TAIL")
 
 
+@pytest.mark.asyncio
+async def test_add_synths(context: AsyncServer | Server) -> None:
+    with context.osc_protocol.capture() as transcript:
+        synths = context.add_synths(default, 500, frequency=range(500), amplitude=0.5)
+    # one contiguous ID range, sent as datagram-sized bundles
+    assert synths.ids == range(1000, 1500)
+    assert [entry.message for entry in transcript.filtered(received=False)] == (
+        OscBundle.partition(
+            [
+                OscMessage(
+                    "/s_new",
+                    "supriya:default",
+                    id_,
+                    0,
+                    1,
+                    "amplitude",
+                    0.5,
+                    "frequency",
+                    float(id_ - 1000),
+                )
+                for id_ in synths.ids
+            ],
+            maximum=context._get_maximum_datagram_size(),
+        )
+    )
+    await get(context.sync())
+    assert len(context.default_group.children) == 500
+    assert context.default_group.children[0] == synths[-1]
+    synths.free(force=True)
+    await get(context.sync())
+    assert len(context.default_group.children) == 0
+
+
+@pytest.mark.asyncio
+async def test_add_synths_not_resident(context: AsyncServer | Server) -> None:
+    with SynthDefBuilder(frequency=440) as builder:
+        Out.ar(bus=0, source=SinOsc.ar(frequency=builder["frequency"]) * 0)
+    synthdef = builder.build(name="grain")
+    with context.osc_protocol.capture() as transcript:
+        synths = context.add_synths(synthdef, 2000, frequency=range(2000))
+    # the /s_new completion is spread across datagram-sized /d_recv requests
+    datagrams = [
+        entry.message.to_datagram() for entry in transcript.filtered(received=False)
+    ]
+    assert len(datagrams) > 1
+    assert all(
+        len(datagram) <= context._get_maximum_datagram_size() for datagram in datagrams
+    )
+    await get(context.sync())
+    assert len(context.default_group.children) == 2000
+    assert context.default_group.children[0] == synths[-1]
+    # the server created every synth, including those sent last
+    for synth in (synths[0], synths[-1]):
+        assert isinstance(node_info := await get(synth.query()), NodeInfo)
+        assert node_info.node_id == synth.id_
+
+
 @pytest.mark.asyncio
 async def test_free_group_children(context: AsyncServer | Server) -> None:
     grandparent = context.add_group()
@@ -8,7 +8,14 @@ import pytest_asyncio
 
 from supriya import AsyncServer, OscBundle, OscMessage, Server
 from supriya.exceptions import MomentClosed
-from supriya.ugens import Out, SinOsc, SynthDef, SynthDefBuilder, compile_synthdefs
+from supriya.ugens import (
+    Out,
+    SinOsc,
+    SynthDef,
+    SynthDefBuilder,
+    SynthDefCache,
+    compile_synthdefs,
+)
 
 
 async def get(x):
@@ -53,23 +60,33 @@ async def test_add_synthdefs(
             context.add_synthdefs()
         # /d_recv
         context.add_synthdefs(synthdefs[0])
-        # multiples
-        context.add_synthdefs(*synthdefs)
+        # multiples, skipping those already added
+        context.add_synthdefs(*synthdefs[:2])
         # completion without moment via on_completion lambda succeeds
-        context.add_synthdefs(synthdefs[1], on_completion=lambda ctx: ctx.add_group())
+        context.add_synthdefs(synthdefs[2], on_completion=lambda ctx: ctx.add_group())
         # completion without moment errors
+        context.free_synthdefs(synthdefs[2])
         with pytest.raises(MomentClosed):
             with context.add_synthdefs(synthdefs[2]):
                 context.add_group()
         # completion inside moment succeeds
+        context.free_synthdefs(synthdefs[2])
         with context.at(1.23):
             with context.add_synthdefs(synthdefs[2]):
                 context.add_group()
+        # completions of already-added synthdefs are emitted directly
+        with context.at(2.34):
+            with context.add_synthdefs(*synthdefs):
+                context.add_group()
+        # duplicates are skipped entirely
+        context.add_synthdefs(*synthdefs)
     assert [entry.message for entry in transcript.filtered(received=False)] == [
         OscMessage("/d_recv", compiled(synthdefs[0])),
-        OscMessage("/d_recv", compiled(*synthdefs)),
-        OscMessage("/d_recv", compiled(synthdefs[1]), OscMessage("/g_new", 1000, 0, 1)),
+        OscMessage("/d_recv", compiled(synthdefs[1])),
+        OscMessage("/d_recv", compiled(synthdefs[2]), OscMessage("/g_new", 1000, 0, 1)),
+        OscMessage("/d_free", "synthdef-c"),
         OscMessage("/d_recv", compiled(synthdefs[2])),
+        OscMessage("/d_free", "synthdef-c"),
         OscBundle(
             contents=[
                 OscMessage(
@@ -80,7 +97,114 @@ async def test_add_synthdefs(
             ],
             timestamp=1.23 + context.latency,
         ),
+        OscBundle(
+            contents=[OscMessage("/g_new", 1002, 0, 1)],
+            timestamp=2.34 + context.latency,
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_add_synth_resident_synthdefs(
+    context: AsyncServer | Server, synthdefs: list[SynthDef], tmp_path: Path
+) -> None:
+    def compiled(*x):
+        return compile_synthdefs(*x)
+
+    # synthdefs loaded from local files are known once the server is done loading
+    context.load_synthdefs(tmp_path / "b.scsyndef")
+    assert "synthdef-b" not in (context._resident_synthdefs or {})
+    await get(context.sync())
+    assert "synthdef-b" in (context._resident_synthdefs or {})
+    with context.osc_protocol.capture() as transcript:
+        # the first synth of an unknown synthdef receives it first
+        context.add_synth(synthdefs[0])
+        context.add_synth(synthdefs[0])
+        context.add_synth(synthdefs[1])
+    await get(context.sync())
+    assert [entry.message for entry in transcript.filtered(received=False)] == [
+        OscMessage(
+            "/d_recv",
+            compiled(synthdefs[0]),
+            OscMessage("/s_new", "synthdef-a", 1000, 0, 1),
+        ),
+        OscMessage("/s_new", "synthdef-a", 1001, 0, 1),
+        OscMessage("/s_new", "synthdef-b", 1002, 0, 1),
+    ]
+    # /d_removed forgets the synthdef, e.g. when freed by another client
+    context.osc_protocol.send(OscMessage("/d_free", "synthdef-a"))
+    await get(context.sync())
+    for _ in range(100):
+        if "synthdef-a" not in (context._resident_synthdefs or {}):
+            break
+        await asyncio.sleep(0.01)
+    assert "synthdef-a" not in (context._resident_synthdefs or {})
+
+
+@pytest.mark.asyncio
+async def test_add_synthdefs_cached(
+    context: AsyncServer | Server, synthdefs: list[SynthDef], tmp_path: Path
+) -> None:
+    def compiled(*x):
+        return compile_synthdefs(*x)
+
+    with SynthDefBuilder(frequency=440) as builder:
+        Out.ar(
+            bus=0,
+            source=sum(
+                SinOsc.ar(frequency=builder["frequency"] * (i + 1)) for i in range(100)
+            ),
+        )
+    large = builder.build(name="large")
+    cache = SynthDefCache(tmp_path / "cache")
+    context.set_synthdef_cache(cache, size_threshold=1024)
+    with context.osc_protocol.capture() as transcript:
+        with context.at():
+            with context.add_synthdefs(synthdefs[0], large):
+                context.add_group()
+        context.add_synth(large)
+    await get(context.sync())
+    assert [entry.message for entry in transcript.filtered(received=False)] == [
+        OscMessage(
+            "/d_recv",
+            compiled(synthdefs[0]),
+            OscMessage(
+                "/d_load",
+                str(cache.get_path(large)),
+                OscMessage("/g_new", 1000, 0, 1),
+            ),
+        ),
+        OscMessage("/s_new", "large", 1001, 0, 1),
     ]
+    assert [path.name for path in cache.path.iterdir()] == [cache.get_path(large).name]
+
+
+@pytest.mark.asyncio
+async def test_load_synthdefs_cached(
+    context: AsyncServer | Server, synthdefs: list[SynthDef], tmp_path: Path
+) -> None:
+    with SynthDefBuilder(frequency=440) as builder:
+        Out.ar(
+            bus=0,
+            source=sum(
+                SinOsc.ar(frequency=builder["frequency"] * (i + 1)) for i in range(100)
+            ),
+        )
+    large = builder.build(name="large")
+    context.set_synthdef_cache(SynthDefCache(tmp_path / "cache"), size_threshold=1024)
+    # hold the lock so no /done is handled before inspecting the queue
+    with context._lock:
+        with context.at():
+            context.add_synthdefs(large)
+            context.load_synthdefs(tmp_path / "b.scsyndef")
+        # each /d_load, cached or not, awaits its own /done
+        assert [
+            [synthdef.name for synthdef in synthdefs_]
+            for synthdefs_ in context._pending_synthdef_files
+        ] == [["large"], ["synthdef-b"]]
+    await get(context.sync())
+    assert not context._pending_synthdef_files
+    assert {"large", "synthdef-b"} <= set(context._resident_synthdefs or {})
 
 
 @pytest.mark.asyncio
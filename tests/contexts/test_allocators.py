@@ -1,3 +1,5 @@
+import random
+
 from supriya.contexts.allocators import BlockAllocator
 
 
@@ -18,3 +20,54 @@ def test_allocate() -> None:
     allocator.free(4)
     assert allocator.allocate(1) == 4
     assert allocator.allocate(1) == 5
+
+
+def test_allocate_best_fit() -> None:
+    allocator = BlockAllocator(heap_minimum=0, heap_maximum=32)
+    offsets = [allocator.allocate(4) for _ in range(8)]
+    # leave free blocks of 4 at 0, 8 at 8 and 4 at 24
+    for offset in [0, 8, 12, 24]:
+        allocator.free(offset)
+    assert offsets == [0, 4, 8, 12, 16, 20, 24, 28]
+    # the smallest fitting block wins, lowest offset first among equals
+    assert allocator.allocate(3) == 0
+    assert allocator.allocate(4) == 24
+    assert allocator.allocate(5) == 8
+    assert allocator.allocate(4) is None
+    assert allocator.allocate(3) == 13
+    stats = allocator.stats
+    assert (stats.allocation_count, stats.failure_count, stats.free_count) == (
+        12,
+        1,
+        4,
+    )
+    assert (stats.free_block_count, stats.free_size, stats.used_size) == (1, 1, 31)
+
+
+def test_allocate_random() -> None:
+    random.seed(0)
+    allocator = BlockAllocator(heap_minimum=0, heap_maximum=256)
+    used: dict[int, int] = {}
+    for _ in range(5000):
+        if used and random.random() < 0.5:
+            freed = random.choice(list(used))
+            allocator.free(freed)
+            del used[freed]
+        elif (offset := allocator.allocate(size := random.randint(1, 8))) is not None:
+            # never overlapping anything already allocated
+            assert all(
+                offset + size <= other or other + used[other] <= offset
+                for other in used
+            )
+            assert 0 <= offset <= 256 - size
+            used[offset] = size
+        stats = allocator.stats
+        assert stats.used_size == sum(used.values())
+        assert stats.free_size == 256 - stats.used_size
+        assert 0.0 <= stats.fragmentation < 1.0
+    for offset in list(used):
+        allocator.free(offset)
+    # everything coalesces back into one block
+    stats = allocator.stats
+    assert (stats.free_block_count, stats.largest_free_block) == (1, 256)
+    assert stats.fragmentation == 0.0
@@ -1,18 +1,30 @@
 import asyncio
 import concurrent.futures
+import contextlib
 import logging
+import socket
+import socketserver
+import threading
+import time
+from typing import cast
 
 import pytest
 from uqbar.strings import normalize
 
-from supriya.enums import BootStatus
+from supriya.enums import AddAction, BootStatus, CalculationRate
 from supriya.osc import (
     NTP_DELTA,
+    AddressPatternTrie,
     AsyncOscProtocol,
+    Capture,
     HealthCheck,
+    LazyOscMessage,
     OscBundle,
     OscMessage,
+    OscMetrics,
     ThreadedOscProtocol,
+    _split_frames,
+    compile_address_pattern,
     find_free_port,
 )
 from supriya.scsynth import AsyncProcessProtocol, Options, ThreadedProcessProtocol
@@ -68,6 +80,359 @@ def test_OscMessage() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        (OscMessage("/g_new", 0, 0), "2f675f6e657700002c6969000000000000000000"),
+        (OscMessage(3, 1.5), "000000032c6600003fc00000"),
+        (
+            OscMessage("/foo", AddAction.ADD_TO_TAIL, CalculationRate.AUDIO.name),
+            "2f666f6f000000002c69730000000001415544494f000000",
+        ),
+        (
+            OscMessage("/blob", b"\x01\x02\x03", bytearray(b"\x04")),
+            "2f626c6f620000002c62620000000003010203000000000104000000",
+        ),
+        (
+            OscMessage("/mixed", 1, True, None, [2, [3.0]], "x", False, 4),
+            (
+                "2f6d6978656400002c69544e5b695b665d5d734669000000"
+                "0000000100000002404000007800000000000004"
+            ),
+        ),
+    ],
+)
+def test_OscMessage_to_datagram(message: OscMessage, expected: str) -> None:
+    assert message.to_datagram().hex() == expected
+
+
+def test_OscBundle_to_datagram() -> None:
+    messages = [OscMessage("/n_set", i, "frequency", 440.0 + i) for i in range(100)]
+    bundle = OscBundle(
+        timestamp=1401557034.5,
+        contents=[
+            OscBundle(contents=messages[:50]),
+            OscMessage("/d_recv", b"SCgf\x01", OscBundle(contents=messages[50:])),
+        ],
+    )
+    datagram = bundle.to_datagram()
+    assert len(datagram) % 4 == 0
+    assert OscBundle.from_datagram(datagram) == bundle
+    assert bundle.to_datagram(realtime=False)[8:16] == OscBundle._encode_date(
+        1401557034.5, realtime=False
+    )
+
+
+def test_Capture_ring_buffer_and_log(tmp_path) -> None:
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    peer.settimeout(1.0)
+    log_path = tmp_path / "capture.log"
+    messages: list[OscBundle | OscMessage] = [
+        OscMessage("/c_set", i, 0.5) for i in range(10)
+    ]
+    messages.append(OscBundle(timestamp=int(time.time()) + 10, contents=[messages[0]]))
+    osc_protocol = ThreadedOscProtocol()
+    try:
+        osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+        with osc_protocol.capture(maximum_size=64, log_path=log_path) as transcript:
+            for message in messages:
+                osc_protocol.send(message)
+        # 20-byte messages, so only the bundle and the last message fit in budget
+        assert [entry.message for entry in transcript] == messages[-2:]
+        assert transcript.size == sum(len(x.to_datagram()) for x in messages[-2:])
+        assert [entry.message for entry in Capture.read_log(log_path)] == messages
+        # a record cut short is reported, after the complete ones before it
+        truncated_path = tmp_path / "truncated.log"
+        truncated_path.write_bytes(log_path.read_bytes()[:-4])
+        entries = Capture.read_log(truncated_path)
+        assert [next(entries).message for _ in messages[:-1]] == messages[:-1]
+        with pytest.raises(ValueError):
+            next(entries)
+        # the log can be replayed, with bundles retimed relative to the replay
+        for _ in messages:
+            peer.recvfrom(1024)
+        start = time.time()
+        assert Capture.replay_log(log_path, osc_protocol, speed=None) == 11
+        replayed = [peer.recvfrom(1024)[0] for _ in messages]
+        assert replayed[:-1] == [x.to_datagram() for x in messages[:-1]]
+        bundle = OscBundle.from_datagram(replayed[-1])
+        assert bundle.contents == (messages[0],)
+        assert start + 8 < cast(float, bundle.timestamp) < time.time() + 11
+    finally:
+        osc_protocol.disconnect()
+        peer.close()
+
+
+def test_OscBundle_partition() -> None:
+    messages = [
+        OscMessage("/s_new", "default", 1000 + i, 0, 1, "frequency", 440.0)
+        for i in range(100)
+    ]
+    messages.insert(50, OscMessage("/b_setn", 0, 0, 500, *([0.5] * 500)))
+    bundles = OscBundle.partition(messages, timestamp=1.5, maximum=1024)
+    assert [message for bundle in bundles for message in bundle.contents] == messages
+    assert {bundle.timestamp for bundle in bundles} == {1.5}
+    assert [len(bundle.to_datagram()) <= 1024 for bundle in bundles].count(False) == 1
+    assert OscBundle(contents=[messages[50]]) in [
+        OscBundle(contents=bundle.contents) for bundle in bundles
+    ]
+    assert OscBundle.partition([]) == []
+    # bundles encode from the segments compiled while partitioning
+    for bundle in bundles:
+        fresh = OscBundle(timestamp=bundle.timestamp, contents=bundle.contents)
+        for realtime in (True, False):
+            assert bundle.to_datagram(realtime=realtime) == fresh.to_datagram(
+                realtime=realtime
+            )
+        assert OscBundle(contents=[bundle]).to_datagram() == (
+            OscBundle(contents=[fresh]).to_datagram()
+        )
+
+
+def test_OscMessage_from_datagram() -> None:
+    samples = [float(i) for i in range(25_000)]
+    message = OscMessage("/b_getn.reply", 0, 0, len(samples), *samples)
+    datagram = message.to_datagram()
+    assert len(datagram) > 100_000
+    assert OscMessage.from_datagram(datagram) == message
+    assert OscMessage.from_datagram(memoryview(datagram)) == message
+    assert OscMessage.from_datagram(bytearray(datagram)) == message
+    with pytest.raises(ValueError):
+        OscMessage.from_datagram(datagram[:-4])
+
+
+def test_OscMessage_from_datagram_blobs() -> None:
+    nested = OscBundle(contents=[OscMessage("/s_new", "default", 1000)])
+    datagram = OscMessage(
+        "/d_recv", b"SCgf\x00\x00\x00\x02", nested, b"/"
+    ).to_datagram()
+    assert OscMessage.from_datagram(datagram) == OscMessage(
+        "/d_recv", b"SCgf\x00\x00\x00\x02", nested, b"/"
+    )
+    assert OscMessage.from_datagram(datagram, decode_blobs=False) == OscMessage(
+        "/d_recv", b"SCgf\x00\x00\x00\x02", nested.to_datagram(), b"/"
+    )
+
+
+def test_LazyOscMessage() -> None:
+    message = OscMessage("/b_setn", 0, 0, 3, 0.5, 0.25, [b"\x01", "x"])
+    datagram = message.to_datagram()
+    lazy = LazyOscMessage.from_datagram(bytearray(datagram))
+    assert (lazy.address, lazy.type_tags) == ("/b_setn", ",iiiff[bs]")
+    assert lazy._contents is None
+    assert lazy.to_datagram() == datagram
+    assert lazy == message
+    assert lazy.contents == message.contents
+    assert repr(lazy) == repr(message).replace("OscMessage", "LazyOscMessage")
+
+
+def test_OscProtocol__match_callbacks() -> None:
+    protocol = ThreadedOscProtocol()
+    n_go = protocol._register("/n_go", print)
+    n_end = protocol._register(["/n_end", 1000], print, once=True)
+    protocol._add_callback(n_go)
+    protocol._add_callback(n_end)
+    # unregistered addresses never decode their arguments
+    message = LazyOscMessage.from_datagram(
+        OscMessage("/status.reply", 1, 0, 0, 2, 4).to_datagram()
+    )
+    assert protocol._match_callbacks(message) == []
+    assert message._contents is None
+    # address-only patterns don't need arguments either
+    message = LazyOscMessage.from_datagram(
+        OscMessage("/n_go", 1000, 1, -1, -1, 0).to_datagram()
+    )
+    assert protocol._match_callbacks(message) == [n_go]
+    assert message._contents is None
+    # deeper patterns decode arguments
+    message = LazyOscMessage.from_datagram(
+        OscMessage("/n_end", 1000, 1, -1, -1, 0).to_datagram()
+    )
+    assert protocol._match_callbacks(message) == [n_end]
+    assert message._contents == (1000, 1, -1, -1, 0)
+
+
+def test_AddressPatternTrie() -> None:
+    patterns = [
+        "/voice/{1,2,3}/gate",
+        "/voice/{1,1}/*",
+        "/voice/[0-9]/gate",
+        "/voice/*/gate",
+        "/voice/1?/gate",
+        "/{a,b}{c,d}",
+        "/{unclosed",
+        *(f"/synth/{{{i},solo}}" for i in range(100)),
+    ]
+    trie = AddressPatternTrie()
+    for pattern in patterns:
+        trie.add(pattern)
+    for address in [
+        "/voice/1/gate",
+        "/voice/12/gate",
+        "/voice/x/gate",
+        "/bd",
+        "/{unclosed",
+        "/synth/42",
+        "/synth/solo",
+        "/synth/100",
+    ]:
+        assert sorted(trie.match(address)) == sorted(
+            x for x in patterns if compile_address_pattern(x).fullmatch(address)
+        )
+    trie.remove("/voice/*/gate")
+    assert sorted(trie.match("/voice/1/gate")) == [
+        "/voice/[0-9]/gate",
+        "/voice/{1,1}/*",
+        "/voice/{1,2,3}/gate",
+    ]
+
+
+@pytest.mark.parametrize(
+    "pattern, matches, mismatches",
+    [
+        ("/[]", ["/[]"], ["/a", "/[", "/]"]),
+        ("/[!]", ["/[!]"], ["/a", "/!"]),
+        ("/b_[", ["/b_["], ["/b_s"]),
+        ("/a[]b]", ["/a[]b]"], ["/ab", "/a]"]),
+        ("/n_{go", ["/n_{go"], ["/n_go"]),
+        ("/b_[a-]", ["/b_a", "/b_-"], ["/b_b"]),
+        ("/b_[!a]", ["/b_b"], ["/b_a", "/b_/"]),
+    ],
+)
+def test_compile_address_pattern(pattern, matches, mismatches) -> None:
+    regex = compile_address_pattern(pattern)
+    assert all(regex.fullmatch(x) for x in matches)
+    assert not any(regex.fullmatch(x) for x in mismatches)
+
+
+def test_compile_address_pattern_invalid() -> None:
+    with pytest.raises(ValueError, match="invalid address pattern"):
+        compile_address_pattern("/b_[z-a]")
+
+
+def test_OscProtocol__match_callbacks_address_patterns(monkeypatch) -> None:
+    osc_protocol = ThreadedOscProtocol()
+    # apply once-only unregistration immediately, rather than via the service loop
+    monkeypatch.setattr(osc_protocol, "unregister", osc_protocol._remove_callback)
+    callbacks = {}
+    for name, pattern, once in [
+        ("node", ["/n_*"], False),
+        ("node_1000", ["/n_{go,end}", 1000], False),
+        ("buffer", ["/b_[!a-m]*"], False),
+        ("exact", ["/n_go"], False),
+        ("once", ["/n_?o"], True),
+    ]:
+        callbacks[name] = osc_protocol._register(pattern, lambda _: None, once=once)
+        osc_protocol._add_callback(callbacks[name])
+
+    def match(*message) -> set[str]:
+        matched = osc_protocol._match_callbacks(OscMessage(*message))
+        return {name for name, callback in callbacks.items() if callback in matched}
+
+    assert match("/n_go", 1000) == {"exact", "node", "node_1000", "once"}
+    assert match("/n_go", 1000) == {"exact", "node", "node_1000"}
+    assert match("/n_end", 1001) == {"node"}
+    assert match("/n_off", 1000) == {"node"}
+    assert match("/b_setn", 1) == {"buffer"}
+    assert match("/b_info", 1) == set()
+    assert match("/n_go/x") == set()
+    osc_protocol._remove_callback(callbacks["node"])
+    osc_protocol._remove_callback(callbacks["node_1000"])
+    assert match("/n_go", 1000) == {"exact"}
+    assert list(osc_protocol.pattern_callbacks) == ["/b_[!a-m]*"]
+    assert osc_protocol.pattern_trie.match("/n_go") == ()
+
+
+def test_OscProtocol_metrics() -> None:
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    peer.settimeout(1.0)
+    received = threading.Event()
+    osc_protocol = ThreadedOscProtocol()
+    metrics = osc_protocol.enable_metrics()
+    assert metrics is not None
+    try:
+        osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+        osc_protocol.register(pattern=["/synced"], procedure=lambda _: received.set())
+        osc_protocol.send(OscMessage("/sync", 1))
+        osc_protocol.send(
+            OscBundle(contents=[OscMessage("/n_free", 1), OscMessage("/sync", 2)])
+        )
+        _, address = peer.recvfrom(1024)
+        peer.sendto(OscMessage("/n_go", 1000).to_datagram(), address)
+        peer.sendto(OscMessage("/synced", 1).to_datagram(), address)
+        assert received.wait(1.0)
+    finally:
+        osc_protocol.disconnect()
+        peer.close()
+    snapshot = metrics.snapshot()
+    assert snapshot["sent"] == {
+        "/sync": {"count": 2, "bytes": 32},
+        "/n_free": {"count": 1, "bytes": 16},
+        "#bundle": {"count": 1, "bytes": 24},
+    }
+    assert snapshot["received"] == {
+        "/n_go": {"count": 1, "bytes": 16},
+        "/synced": {"count": 1, "bytes": 16},
+    }
+    assert list(snapshot["dispatch"]) == ["/synced"]
+    assert osc_protocol.enable_metrics(False) is None
+    assert osc_protocol.metrics is None
+
+
+@pytest.mark.asyncio
+async def test_OscMetrics_stream() -> None:
+    metrics = OscMetrics()
+    stream = metrics.stream(interval=0.01)
+    metrics.record_round_trip("Sync", 0.003)
+    metrics.record_round_trip("Sync", 5.0)
+    snapshot = await anext(stream)
+    assert snapshot["round_trips"]["Sync"]["count"] == 2
+    assert snapshot["round_trips"]["Sync"]["buckets"][0.005] == 1
+    assert snapshot["round_trips"]["Sync"]["buckets"][float("inf")] == 1
+    await stream.aclose()
+
+
+def test_OscProtocol_pending_callbacks() -> None:
+    protocol = ThreadedOscProtocol()
+    callbacks = [
+        protocol._register(["/b_info", 1], print, pending=True),
+        protocol._register(["/b_info", 2], print, pending=True),
+        protocol._register(["/b_info", 1], print, pending=True),
+        protocol._register(
+            ["/done", "/notify"],
+            print,
+            failure_pattern=["/fail", "/notify"],
+            pending=True,
+        ),
+    ]
+    for callback in callbacks:
+        protocol._add_callback(callback)
+    replies = [
+        OscMessage("/b_info", 1, 512, 1, 44100.0),
+        OscMessage("/b_info", 1, 1024, 1, 44100.0),
+        OscMessage("/b_info", 1, 2048, 1, 44100.0),
+        OscMessage("/b_info", 2, 512, 2, 44100.0),
+        OscMessage("/fail", "/notify", "too many users"),
+        OscMessage("/done", "/notify", 0),
+    ]
+    matched = [
+        [callback for callback, _ in protocol._validate_receive(x.to_datagram())]
+        for x in replies
+    ]
+    # each reply is claimed by the oldest pending callback for its pattern, once
+    assert matched == [
+        [callbacks[0]],
+        [callbacks[2]],
+        [],
+        [callbacks[1]],
+        [callbacks[3]],
+        [],
+    ]
+    assert protocol.pending_callbacks == {}
+
+
 def test_new_ntp_era() -> None:
     """
     Check for NTP timestamp overflow.
@@ -77,6 +442,240 @@ def test_new_ntp_era() -> None:
     assert datagram.hex() == "0000000100000000"
 
 
+def test_split_frames() -> None:
+    datagrams = [OscMessage("/sync", i).to_datagram() for i in range(3)]
+    stream = b"".join(len(x).to_bytes(4, "big") + x for x in datagrams)
+    buffer = bytearray(stream[:5])
+    assert _split_frames(buffer) == []
+    assert buffer == stream[:5]
+    buffer.extend(stream[5:30])
+    assert _split_frames(buffer) == datagrams[:1]
+    buffer.extend(stream[30:])
+    assert _split_frames(buffer) == datagrams[1:]
+    assert buffer == b""
+
+
+def test_ThreadedOscProtocol_receive() -> None:
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    peer.settimeout(1.0)
+    messages: list[OscMessage] = []
+    received = threading.Event()
+    osc_protocol = ThreadedOscProtocol()
+    try:
+        osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+        osc_protocol.send(OscMessage("/notify", 1))
+        _, address = peer.recvfrom(1024)
+        # registration applies immediately, without waiting for unrelated traffic
+        osc_protocol.register(pattern=["/n_go"], procedure=messages.append)
+        callback = osc_protocol.register(
+            pattern=["/synced"], procedure=lambda _: received.set()
+        )
+        for i in range(100):
+            peer.sendto(OscMessage("/n_go", i).to_datagram(), address)
+        peer.sendto(OscMessage("/synced", 1).to_datagram(), address)
+        assert received.wait(1.0)
+        assert messages == [OscMessage("/n_go", i) for i in range(100)]
+        osc_protocol.unregister(callback)
+        for _ in range(100):
+            if "/synced" not in osc_protocol.callbacks:
+                break
+            time.sleep(0.01)
+        assert "/synced" not in osc_protocol.callbacks
+        osc_protocol.disconnect()
+        assert osc_protocol.osc_thread is not None
+        osc_protocol.osc_thread.join(1.0)
+        assert not osc_protocol.osc_thread.is_alive()
+    finally:
+        peer.close()
+
+
+def test_ThreadedOscProtocol_receive_errors(caplog) -> None:
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    peer.settimeout(1.0)
+    received = threading.Event()
+
+    def explode(message: OscMessage) -> None:
+        raise RuntimeError(message)
+
+    osc_protocol = ThreadedOscProtocol()
+    try:
+        osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+        osc_protocol.send(OscMessage("/notify", 1))
+        _, address = peer.recvfrom(1024)
+        osc_protocol.register(pattern=["/fail"], procedure=explode)
+        osc_protocol.register(pattern=["/synced"], procedure=lambda _: received.set())
+        # neither a raising callback nor garbage stops the receive thread
+        peer.sendto(OscMessage("/fail").to_datagram(), address)
+        peer.sendto(b"garbage", address)
+        peer.sendto(OscMessage("/synced", 1).to_datagram(), address)
+        assert received.wait(1.0)
+        assert osc_protocol.osc_thread is not None
+        assert osc_protocol.osc_thread.is_alive()
+        assert osc_protocol.status == BootStatus.ONLINE
+        errors = [r for r in caplog.records if r.levelno == logging.ERROR]
+        assert len(errors) == 2
+        assert all(record.exc_info for record in errors)
+        osc_protocol.disconnect()
+    finally:
+        peer.close()
+
+
+@pytest.mark.asyncio
+async def test_AsyncOscProtocol_coalescing() -> None:
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    peer.settimeout(1.0)
+    osc_protocol = AsyncOscProtocol()
+    osc_protocol.enable_coalescing()
+    try:
+        await osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+        for i in range(3):
+            osc_protocol.send(OscMessage("/n_free", 1000 + i))
+        for i in range(2):
+            osc_protocol.send(
+                OscBundle(timestamp=10, contents=[OscMessage("/n_set", i, "a", 1)])
+            )
+        osc_protocol.send(OscMessage("/sync", 1))
+        assert len(osc_protocol.pending_datagrams) == 6
+        await asyncio.sleep(0)
+        assert not osc_protocol.pending_datagrams
+        datagrams = [peer.recvfrom(8192)[0] for _ in range(3)]
+        assert [OscBundle.from_datagram(x) for x in datagrams[:2]] == [
+            OscBundle(contents=[OscMessage("/n_free", 1000 + i) for i in range(3)]),
+            OscBundle(
+                timestamp=10,
+                contents=[OscMessage("/n_set", i, "a", 1) for i in range(2)],
+            ),
+        ]
+        assert OscMessage.from_datagram(datagrams[2]) == OscMessage("/sync", 1)
+        assert osc_protocol.coalesce_counters == {
+            "datagrams": 3,
+            "flushes": 1,
+            "messages": 6,
+        }
+        # Explicit maximums are clamped to the protocol's datagram limit
+        osc_protocol.maximum_datagram_size = 40
+        osc_protocol.enable_coalescing(maximum=8192)
+        for i in range(2):
+            osc_protocol.send(OscMessage("/n_free", 1000 + i))
+        await asyncio.sleep(0)
+        assert [OscMessage.from_datagram(peer.recvfrom(8192)[0]) for _ in range(2)] == [
+            OscMessage("/n_free", 1000 + i) for i in range(2)
+        ]
+        osc_protocol.enable_coalescing(None)
+        osc_protocol.send(OscMessage("/status"))
+        assert not osc_protocol.pending_datagrams
+        assert OscMessage.from_datagram(peer.recvfrom(8192)[0]) == OscMessage("/status")
+    finally:
+        await osc_protocol.disconnect()
+        peer.close()
+
+
+@pytest.mark.parametrize("osc_protocol_class", [AsyncOscProtocol, ThreadedOscProtocol])
+@pytest.mark.asyncio
+async def test_OscProtocol_pacing(osc_protocol_class) -> None:
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    peer.settimeout(1.0)
+    received: list[OscBundle | OscMessage] = []
+
+    def serve() -> None:
+        # Answer every probe but the first, as if it had been dropped.
+        with contextlib.suppress(OSError):
+            while True:
+                datagram, address = peer.recvfrom(8192)
+                if datagram.startswith(b"#bundle"):
+                    received.append(OscBundle.from_datagram(datagram))
+                    continue
+                received.append(message := OscMessage.from_datagram(datagram))
+                if message.address == "/sync" and message.contents[0] != -1:
+                    peer.sendto(
+                        OscMessage("/synced", *message.contents).to_datagram(),
+                        address,
+                    )
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    osc_protocol = osc_protocol_class()
+    try:
+        await get(osc_protocol.connect("127.0.0.1", peer.getsockname()[1]))
+        pacer = osc_protocol.enable_pacing(
+            messages_per_second=200, probe_interval=0.05, probe_timeout=0.1
+        )
+        start = time.monotonic()
+        for i in range(10):
+            osc_protocol.send(OscMessage("/n_free", i))
+        osc_protocol.send(OscBundle(timestamp=1, contents=[OscMessage("/late")]))
+        assert pacer.snapshot()["queue_depth"] > 0
+        while len(received) < 11:
+            await asyncio.sleep(0.01)
+        assert time.monotonic() - start >= 0.04
+        # the overdue bundle keeps its place in the queue
+        assert received.index(
+            OscBundle(timestamp=1, contents=[OscMessage("/late")])
+        ) > received.index(OscMessage("/n_free", 9))
+        for _ in range(100):
+            snapshot = pacer.snapshot()
+            if snapshot["probes_lost"]:
+                break
+            await asyncio.sleep(0.01)
+        assert snapshot["probes_lost"] == 1
+        osc_protocol.send(OscMessage("/n_free", 10))
+        for _ in range(100):
+            snapshot = pacer.snapshot()
+            if snapshot["probes_acknowledged"]:
+                break
+            await asyncio.sleep(0.01)
+        assert snapshot["probes_acknowledged"] == 1
+        assert snapshot["released"] == snapshot["probes_sent"] + 12
+        assert snapshot["maximum_queue_depth"] > 1
+        assert snapshot["maximum_delay"] > 0
+        assert osc_protocol.enable_pacing() is None
+    finally:
+        await get(osc_protocol.disconnect())
+        peer.close()
+
+
+@pytest.mark.parametrize("osc_protocol_class", [AsyncOscProtocol, ThreadedOscProtocol])
+@pytest.mark.asyncio
+async def test_OscProtocol_tcp(osc_protocol_class) -> None:
+    class EchoHandler(socketserver.BaseRequestHandler):
+        def handle(self) -> None:
+            while data := self.request.recv(4096):
+                self.request.sendall(data)
+
+    messages: list[OscMessage] = []
+    echo_server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), EchoHandler)
+    echo_server.daemon_threads = True
+    threading.Thread(target=echo_server.serve_forever, daemon=True).start()
+    osc_protocol = osc_protocol_class()
+    try:
+        await get(
+            osc_protocol.connect(
+                "127.0.0.1", echo_server.server_address[1], protocol="tcp"
+            )
+        )
+        assert osc_protocol.status == BootStatus.ONLINE
+        osc_protocol.register(pattern=["/b_setn"], procedure=messages.append)
+        # Larger than any UDP datagram
+        message = OscMessage("/b_setn", 0, 0, 20000, *([0.5] * 20000))
+        for _ in range(3):
+            osc_protocol.send(message)
+        for _ in range(100):
+            if len(messages) == 3:
+                break
+            await asyncio.sleep(0.05)
+        assert messages == [message] * 3
+        await get(osc_protocol.disconnect())
+        assert osc_protocol.status == BootStatus.OFFLINE
+    finally:
+        echo_server.shutdown()
+        echo_server.server_close()
+
+
+@pytest.mark.parametrize("protocol", ["udp", "tcp"])
 @pytest.mark.parametrize(
     "osc_protocol_class, process_protocol_class",
     [
@@ -85,7 +684,9 @@ def test_new_ntp_era() -> None:
     ],
 )
 @pytest.mark.asyncio
-async def test_OscProtocol(osc_protocol_class, process_protocol_class) -> None:
+async def test_OscProtocol(
+    osc_protocol_class, process_protocol_class, protocol: str
+) -> None:
     def on_healthcheck_failed() -> None:
         healthcheck_failed.append(True)
 
@@ -102,7 +703,7 @@ async def test_OscProtocol(osc_protocol_class, process_protocol_class) -> None:
 
     try:
         logger.info("BOOT PROCESS")
-        await get(process_protocol.boot(Options(port=port)))
+        await get(process_protocol.boot(Options(port=port, protocol=protocol)))
         await get(process_protocol.boot_future)
         assert process_protocol.status == BootStatus.ONLINE
 
@@ -116,6 +717,7 @@ async def test_OscProtocol(osc_protocol_class, process_protocol_class) -> None:
                     response_pattern=["/status.reply"],
                     max_attempts=3,
                 ),
+                protocol=protocol,
             )
         )
         assert osc_protocol.status == BootStatus.BOOTING
@@ -1,11 +1,14 @@
+import concurrent.futures
 import os
 import stat
+import sys
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 
 import pytest
 
 from supriya import scsynth
+from supriya.enums import BootStatus
 
 
 @pytest.fixture
@@ -221,3 +224,124 @@ def test_Options(kwargs: dict, expected: list[str]) -> None:
     actual = list(options)
     actual[0] = "/path/to/executable"  # replace to make it portable
     assert actual == expected
+
+
+@pytest.fixture
+def fake_executable(tmp_path: Path) -> Path:
+    path = tmp_path / "scsynth"
+    path.write_text(
+        "\n".join(
+            [
+                f"#!{sys.executable}",
+                "import time",
+                "print('SuperCollider 3 server ready.', flush=True)",
+                "time.sleep(60)",
+            ]
+        )
+    )
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return path
+
+
+def test_ThreadedProcessPool(fake_executable: Path) -> None:
+    with scsynth.ThreadedProcessPool(size=2, executable=str(fake_executable)) as pool:
+        process_protocols = [pool.acquire(), pool.acquire()]
+        # a standby process which dies while idle is skipped
+        (dead := pool.futures[0].result()).process.kill()
+        dead.exit_future.result()
+        process_protocols.append(pool.acquire())
+        assert dead not in process_protocols
+        assert all(x.status == BootStatus.ONLINE for x in process_protocols)
+        assert len({x.options.port for x in process_protocols}) == 3
+        standbys = [future.result() for future in pool.futures]
+    assert all(x.status == BootStatus.OFFLINE for x in standbys)
+    assert all(x.status == BootStatus.ONLINE for x in process_protocols)
+    for process_protocol in process_protocols:
+        process_protocol.quit()
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+
+@pytest.fixture
+def flaky_executable(tmp_path: Path) -> Path:
+    # fails to boot once for each marker file it finds
+    path = tmp_path / "flaky-scsynth"
+    path.write_text(
+        "\n".join(
+            [
+                f"#!{sys.executable}",
+                "import pathlib, sys, time",
+                "for marker in pathlib.Path(sys.argv[0]).parent.glob('fail-*'):",
+                "    try:",
+                "        marker.unlink()",
+                "    except FileNotFoundError:",
+                "        continue",
+                "    sys.exit(1)",
+                "print('SuperCollider 3 server ready.', flush=True)",
+                "time.sleep(60)",
+            ]
+        )
+    )
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return path
+
+
+def test_ThreadedProcessPool_concurrent(fake_executable: Path) -> None:
+    with scsynth.ThreadedProcessPool(size=1, executable=str(fake_executable)) as pool:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            process_protocols = list(executor.map(lambda _: pool.acquire(), range(4)))
+        assert all(x.status == BootStatus.ONLINE for x in process_protocols)
+        assert len(set(process_protocols)) == 4
+    for process_protocol in process_protocols:
+        process_protocol.quit()
+
+
+def test_ThreadedProcessPool_boot_failure(flaky_executable: Path) -> None:
+    (flaky_executable.parent / "fail-0").touch()
+    # a process which fails to boot is skipped while another may be healthy
+    with scsynth.ThreadedProcessPool(size=2, executable=str(flaky_executable)) as pool:
+        pool.acquire().quit()
+    # but not once every process in a row has failed
+    for i in range(10):
+        (flaky_executable.parent / f"fail-{i}").touch()
+    with scsynth.ThreadedProcessPool(size=2, executable=str(flaky_executable)) as pool:
+        with pytest.raises(scsynth.ServerCannotBoot):
+            pool.acquire()
+
+
+@pytest.mark.asyncio
+async def test_AsyncProcessPool_boot_failure(flaky_executable: Path) -> None:
+    (flaky_executable.parent / "fail-0").touch()
+    async with scsynth.AsyncProcessPool(
+        size=2, executable=str(flaky_executable)
+    ) as pool:
+        await (await pool.acquire()).quit()
+    for i in range(10):
+        (flaky_executable.parent / f"fail-{i}").touch()
+    async with scsynth.AsyncProcessPool(
+        size=2, executable=str(flaky_executable)
+    ) as pool:
+        with pytest.raises(scsynth.ServerCannotBoot):
+            await pool.acquire()
+
+
+@pytest.mark.asyncio
+async def test_AsyncProcessPool(fake_executable: Path) -> None:
+    async with scsynth.AsyncProcessPool(
+        size=2, executable=str(fake_executable)
+    ) as pool:
+        process_protocols = [await pool.acquire(), await pool.acquire()]
+        # a standby process which dies while idle is skipped
+        (dead := await pool.tasks[0]).transport.kill()
+        await dead.exit_future
+        process_protocols.append(await pool.acquire())
+        assert dead not in process_protocols
+        assert all(x.status == BootStatus.ONLINE for x in process_protocols)
+        assert len({x.options.port for x in process_protocols}) == 3
+        standbys = [await task for task in pool.tasks]
+    assert all(x.status == BootStatus.OFFLINE for x in standbys)
+    assert all(x.status == BootStatus.ONLINE for x in process_protocols)
+    for process_protocol in process_protocols:
+        await process_protocol.quit()
+    with pytest.raises(RuntimeError):
+        await pool.acquire()
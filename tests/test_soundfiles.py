@@ -0,0 +1,168 @@
+import struct
+import wave
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import pytest
+
+from supriya.soundfiles import load, load_array, memmap, save, stream
+
+if TYPE_CHECKING:
+    import numpy
+else:
+    numpy = pytest.importorskip("numpy")
+
+
+def build_samples(frame_count: int = 1000, channel_count: int = 3) -> "numpy.ndarray":
+    return numpy.random.default_rng(0).uniform(-1, 1, (frame_count, channel_count))
+
+
+def quantize(samples: "numpy.ndarray", bit_depth: int) -> "numpy.ndarray":
+    return numpy.round(samples * ((1 << (bit_depth - 1)) - 1)).astype(numpy.int64)
+
+
+def to_bytes(
+    integers: "numpy.ndarray", bit_depth: int, byteorder: Literal["little", "big"]
+) -> bytes:
+    return b"".join(
+        int(x).to_bytes(bit_depth // 8, byteorder, signed=True)
+        for x in integers.reshape(-1)
+    )
+
+
+def write_aiff(
+    path: Path,
+    data: bytes,
+    channel_count: int,
+    frame_count: int,
+    bit_depth: int,
+    compression: bytes | None = None,
+) -> None:
+    exponent = (44100).bit_length() - 1
+    comm = struct.pack(
+        ">HIHHQ",
+        channel_count,
+        frame_count,
+        bit_depth,
+        16383 + exponent,
+        44100 << (63 - exponent),
+    )
+    if compression is not None:
+        comm += compression + b"\x00\x00"  # empty, padded name
+    chunks = b"COMM" + struct.pack(">I", len(comm)) + comm
+    chunks += b"SSND" + struct.pack(">III", len(data) + 8, 0, 0) + data
+    kind = b"AIFF" if compression is None else b"AIFC"
+    path.write_bytes(b"FORM" + struct.pack(">I", len(chunks) + 4) + kind + chunks)
+
+
+def write_wav(path: Path, data: bytes, channel_count: int, bit_depth: int) -> None:
+    with wave.open(str(path), "wb") as file_:
+        file_.setnchannels(channel_count)
+        file_.setsampwidth(bit_depth // 8)
+        file_.setframerate(44100)
+        file_.writeframes(data)
+
+
+@pytest.mark.parametrize("bit_depth", [16, 24, 32])
+def test_load_wav_integer(bit_depth: int, tmp_path: Path) -> None:
+    integers = quantize(build_samples(), bit_depth)
+    write_wav(
+        path := tmp_path / "test.wav",
+        to_bytes(integers, bit_depth, "little"),
+        3,
+        bit_depth,
+    )
+    array, sample_rate = load_array(path)
+    assert sample_rate == 44100
+    assert array.dtype == numpy.float32
+    assert array.shape == (3, 1000)
+    assert numpy.allclose(array, integers.T / (1 << (bit_depth - 1)))
+
+
+@pytest.mark.parametrize(
+    "bit_depth, compression, byteorder",
+    [
+        (16, None, "big"),
+        (24, None, "big"),
+        (32, None, "big"),
+        (16, b"sowt", "little"),
+        (24, b"sowt", "little"),
+    ],
+)
+def test_load_aiff_integer(
+    bit_depth: int,
+    compression: bytes | None,
+    byteorder: Literal["little", "big"],
+    tmp_path: Path,
+) -> None:
+    integers = quantize(build_samples(), bit_depth)
+    data = to_bytes(integers, bit_depth, byteorder)
+    write_aiff(path := tmp_path / "test.aiff", data, 3, 1000, bit_depth, compression)
+    array, sample_rate = load_array(path)
+    assert sample_rate == 44100
+    assert array.shape == (3, 1000)
+    assert numpy.allclose(array, integers.T / (1 << (bit_depth - 1)))
+
+
+def test_load_aiff_float(tmp_path: Path) -> None:
+    samples = build_samples().astype(">f4")
+    write_aiff(path := tmp_path / "test.aiff", samples.tobytes(), 3, 1000, 32, b"fl32")
+    array, _ = load_array(path)
+    assert numpy.array_equal(array, samples.T)
+    mapped, _ = memmap(path)
+    assert mapped.dtype == numpy.dtype(">f4")
+    assert numpy.array_equal(mapped, samples)
+
+
+def test_load_wav_float(tmp_path: Path) -> None:
+    samples = build_samples().astype(numpy.float32)
+    save(path := tmp_path / "test.wav", samples, 48000)
+    array, sample_rate = load_array(path)
+    assert sample_rate == 48000
+    assert array.flags.c_contiguous
+    assert numpy.array_equal(array, samples.T)
+
+
+def test_load_audioread_fallback(tmp_path: Path) -> None:
+    pytest.importorskip("audioread")
+    # 8-bit WAV files aren't mapped, so they decode through audioread
+    write_wav(path := tmp_path / "test.wav", bytes(range(0, 256, 2)) * 3, 2, 8)
+    array, sample_rate = load_array(path)
+    assert sample_rate == 44100
+    assert array.shape == (2, 192)
+    assert numpy.array_equal(
+        numpy.concatenate(list(stream(path, frame_count=50)), axis=1), array
+    )
+
+
+def test_load_tuples(tmp_path: Path) -> None:
+    pytest.importorskip("audioread")
+    integers = quantize(build_samples(100, 2), 16)
+    write_wav(path := tmp_path / "test.wav", to_bytes(integers, 16, "little"), 2, 16)
+    data, sample_rate = load(path)
+    assert sample_rate == 44100
+    assert isinstance(data, tuple) and all(isinstance(x, tuple) for x in data)
+    assert numpy.array_equal(
+        numpy.array(data, dtype=numpy.float32), load_array(path)[0]
+    )
+
+
+def test_memmap_int24(tmp_path: Path) -> None:
+    integers = quantize(build_samples(), 24)
+    write_wav(path := tmp_path / "test.wav", to_bytes(integers, 24, "little"), 3, 24)
+    with pytest.raises(ValueError):
+        memmap(path)
+
+
+@pytest.mark.parametrize("bit_depth", [16, 24])
+def test_stream(bit_depth: int, tmp_path: Path) -> None:
+    integers = quantize(build_samples(), bit_depth)
+    write_wav(
+        path := tmp_path / "test.wav",
+        to_bytes(integers, bit_depth, "little"),
+        3,
+        bit_depth,
+    )
+    chunks = list(stream(path, frame_count=300))
+    assert [chunk.shape for chunk in chunks] == [(3, 300)] * 3 + [(3, 100)]
+    assert numpy.array_equal(numpy.concatenate(chunks, axis=1), load_array(path)[0])
@@ -0,0 +1,60 @@
+import multiprocessing
+from pathlib import Path
+
+from supriya.ugens import (
+    Out,
+    SinOsc,
+    SynthDefBuilder,
+    SynthDefCache,
+    decompile_synthdefs,
+)
+
+
+def build_synthdefs():
+    with SynthDefBuilder(frequency=440) as builder:
+        Out.ar(bus=0, source=SinOsc.ar(frequency=builder["frequency"]))
+    return [
+        builder.build(),
+        builder.build(name="sine"),
+        builder.build(name="sine:*"),
+    ]
+
+
+def store(path: str) -> list[Path]:
+    return SynthDefCache(path).warm(*build_synthdefs())
+
+
+def test_SynthDefCache(tmp_path: Path) -> None:
+    cache = SynthDefCache(tmp_path)
+    anonymous, named, awkward = synthdefs = build_synthdefs()
+    assert not any(synthdef in cache for synthdef in synthdefs)
+    paths = cache.warm(*synthdefs)
+    assert all(synthdef in cache for synthdef in synthdefs)
+    # Same graph, so the same anonymous name, but different files.
+    assert [path.name for path in paths] == [
+        f"{anonymous.anonymous_name}.scsyndef",
+        f"{anonymous.anonymous_name}-sine.scsyndef",
+        f"{anonymous.anonymous_name}-sine%3A%2A.scsyndef",
+    ]
+    for synthdef, path in zip(synthdefs, paths):
+        assert path.read_bytes() == synthdef.compile()
+        assert decompile_synthdefs(path.read_bytes())[0].effective_name == (
+            synthdef.effective_name
+        )
+    # Storing again leaves existing files alone.
+    mtime = paths[1].stat().st_mtime_ns
+    assert cache.store(named) == paths[1]
+    assert paths[1].stat().st_mtime_ns == mtime
+    # A second cache on the same directory, e.g. in another process, sees them.
+    assert awkward in SynthDefCache(tmp_path)
+    cache.clear()
+    assert not any(synthdef in cache for synthdef in synthdefs)
+
+
+def test_SynthDefCache_processes(tmp_path: Path) -> None:
+    with multiprocessing.get_context("spawn").Pool(4) as pool:
+        results = pool.map(store, [str(tmp_path)] * 4)
+    assert all(result == results[0] for result in results)
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        path.name for path in results[0]
+    )